@@ -0,0 +1,5 @@
+"""Benchmarks for `airspeed velocity <https://asv.readthedocs.io/>`_.
+
+Run ``asv run`` from the repository root. Results are stored in ``benchmarks/results`` so that scaling curves can be
+compared between versions.
+"""
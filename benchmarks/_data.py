@@ -0,0 +1,40 @@
+"""Synthetic datasets shared by the benchmarks."""
+
+from functools import cache
+
+import numpy as np
+import pandas as pd
+
+START = pd.Timestamp("2020-01-01")
+SCHEDULE_TYPES = ("timedelta", "cron", "explicit")
+
+
+@cache
+def timestamps(n_rows: int, n_folds: int = 100, *, shuffle: bool = False) -> pd.DatetimeIndex:
+    """Evenly spaced timestamps covering `n_folds` hours."""
+    index = pd.date_range(START, START + pd.Timedelta(hours=n_folds), periods=n_rows)
+    if shuffle:
+        index = index[np.random.default_rng(2019).permutation(n_rows)]
+    return index
+
+
+@cache
+def frame(n_rows: int, n_folds: int = 100) -> pd.DataFrame:
+    """A frame with a time column and a value column."""
+    return pd.DataFrame({"time": timestamps(n_rows, n_folds), "value": np.arange(n_rows)})
+
+
+def limits(n_folds: int) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """Limits which produce about `n_folds` hourly folds."""
+    return START, START + pd.Timedelta(hours=n_folds)
+
+
+def schedule(kind: str, n_folds: int) -> str | pd.DatetimeIndex:
+    """An hourly schedule of the given `kind`."""
+    if kind == "timedelta":
+        return "1h"
+    if kind == "cron":
+        return "0 * * * *"
+    if kind == "explicit":
+        return pd.date_range(START, periods=n_folds + 1, freq="h")
+    raise ValueError(f"Unknown schedule {kind=}.")
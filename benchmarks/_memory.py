@@ -0,0 +1,27 @@
+"""Memory measurement helpers."""
+
+import tracemalloc
+from collections.abc import Callable, Iterable
+from typing import Any
+
+
+def traced(fn: Callable[[], Iterable[Any]]) -> tuple[int, int]:
+    """Measure allocations made while consuming the iterable returned by `fn`.
+
+    Only allocations which are visible to :mod:`tracemalloc` are counted; this includes numpy and pandas, but not
+    libraries with their own allocators (e.g. polars).
+
+    Returns:
+        A tuple ``(peak, steady)`` in bytes, relative to the memory in use before calling `fn`. The `steady` value is
+        the largest amount held while an item is being processed, i.e. excluding temporary allocations.
+    """
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        steady = 0
+        for _ in fn():
+            steady = max(steady, tracemalloc.get_traced_memory()[0] - base)
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    return peak, steady
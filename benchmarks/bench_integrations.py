@@ -0,0 +1,67 @@
+"""Benchmarks for :mod:`time_split.integration` functions."""
+
+from time_split.integration.pandas import split_pandas
+
+from . import _data
+
+
+class Pandas:
+    """Iterate over all folds of :func:`~time_split.integration.pandas.split_pandas`."""
+
+    params = ([1_000, 100_000, 10_000_000], [10, 1_000])
+    param_names = ("n_rows", "n_folds")
+    timeout = 600
+
+    def setup(self, n_rows, n_folds):
+        self.df = _data.frame(n_rows, n_folds)
+
+    def time_split_pandas(self, n_rows, n_folds):
+        for _ in split_pandas(self.df, "time", schedule="1h", before="3h"):
+            pass
+
+    def time_split_pandas_index(self, n_rows, n_folds):
+        for _ in split_pandas(self.df.set_index("time"), schedule="1h", before="3h"):
+            pass
+
+
+class Polars:
+    """Iterate over all folds of :func:`~time_split.integration.polars.split_polars`."""
+
+    params = ([1_000, 100_000, 10_000_000], [10, 1_000])
+    param_names = ("n_rows", "n_folds")
+    timeout = 600
+
+    def setup(self, n_rows, n_folds):
+        try:
+            import polars as pl
+        except ModuleNotFoundError:
+            raise NotImplementedError from None  # Skipped by asv.
+
+        self.df = pl.from_pandas(_data.frame(n_rows, n_folds))
+
+    def time_split_polars(self, n_rows, n_folds):
+        from time_split.integration.polars import split_polars
+
+        for _ in split_polars(self.df, "time", schedule="1h", before="3h"):
+            pass
+
+
+class ScikitLearn:
+    """Create all folds of :class:`~time_split.integration.sklearn.ScikitLearnSplitter`."""
+
+    params = ([1_000, 100_000, 10_000_000], [10, 1_000])
+    param_names = ("n_rows", "n_folds")
+    timeout = 600
+
+    def setup(self, n_rows, n_folds):
+        try:
+            from time_split.integration.sklearn import ScikitLearnSplitter
+        except ModuleNotFoundError:
+            raise NotImplementedError from None
+
+        self.splitter = ScikitLearnSplitter(schedule="1h", before="3h")
+        self.X = _data.frame(n_rows, n_folds).set_index("time")
+
+    def time_split(self, n_rows, n_folds):
+        for _ in self.splitter.split(self.X):
+            pass
@@ -0,0 +1,129 @@
+"""Memory benchmarks for iterating all folds.
+
+Peak memory is measured in two ways:
+
+* ``peakmem_*``: Maximum resident set size (RSS) of the process, including the input data. Works for all libraries.
+* ``track_*``: Allocations made during iteration, measured using :mod:`tracemalloc`. Excludes the input data.
+
+Use ``asv continuous`` or ``asv compare`` to flag regressions against stored results.
+"""
+
+from time_split import split
+from time_split.integration.pandas import split_pandas
+from time_split.support import fold_weight
+
+from . import _data
+from ._memory import traced
+
+SIZES = [100_000, 1_000_000, 10_000_000]
+N_FOLDS = 100
+
+
+def _bytes(fn):
+    fn.unit = "bytes"
+    return fn
+
+
+class Pandas:
+    """Iterate over all folds of :func:`~time_split.integration.pandas.split_pandas`."""
+
+    params = SIZES
+    param_names = ("n_rows",)
+    timeout = 600
+
+    def setup(self, n_rows):
+        self.df = _data.frame(n_rows, N_FOLDS)
+
+    def _folds(self):
+        return split_pandas(self.df, "time", schedule="1h", before="12h")
+
+    def peakmem_split_pandas(self, n_rows):
+        for _ in self._folds():
+            pass
+
+    @_bytes
+    def track_peak(self, n_rows):
+        return traced(self._folds)[0]
+
+    @_bytes
+    def track_steady(self, n_rows):
+        return traced(self._folds)[1]
+
+
+class Polars:
+    """Iterate over all folds of :func:`~time_split.integration.polars.split_polars`.
+
+    Polars allocations are not visible to :mod:`tracemalloc`; only RSS is measured.
+    """
+
+    params = SIZES
+    param_names = ("n_rows",)
+    timeout = 600
+
+    def setup(self, n_rows):
+        try:
+            import polars as pl
+        except ModuleNotFoundError:
+            raise NotImplementedError from None
+
+        self.df = pl.from_pandas(_data.frame(n_rows, N_FOLDS))
+
+    def peakmem_split_polars(self, n_rows):
+        from time_split.integration.polars import split_polars
+
+        for _ in split_polars(self.df, "time", schedule="1h", before="12h"):
+            pass
+
+
+class ScikitLearn:
+    """Iterate over all folds of :meth:`ScikitLearnSplitter.split <.ScikitLearnSplitter.split>`."""
+
+    params = SIZES
+    param_names = ("n_rows",)
+    timeout = 600
+
+    def setup(self, n_rows):
+        try:
+            from time_split.integration.sklearn import ScikitLearnSplitter
+        except ModuleNotFoundError:
+            raise NotImplementedError from None
+
+        self.splitter = ScikitLearnSplitter(schedule="1h", before="12h")
+        self.X = _data.frame(n_rows, N_FOLDS).set_index("time")
+
+    def _folds(self):
+        return self.splitter.split(self.X)
+
+    def peakmem_split(self, n_rows):
+        for _ in self._folds():
+            pass
+
+    @_bytes
+    def track_peak(self, n_rows):
+        return traced(self._folds)[0]
+
+    @_bytes
+    def track_steady(self, n_rows):
+        return traced(self._folds)[1]
+
+
+class FoldWeight:
+    """Row counting using :func:`~time_split.support.fold_weight`."""
+
+    params = SIZES
+    param_names = ("n_rows",)
+    timeout = 600
+
+    def setup(self, n_rows):
+        self.available = _data.timestamps(n_rows, N_FOLDS)
+        self.splits = split("1h", before="12h", available=self.available)
+
+    def _weights(self):
+        return fold_weight(self.splits, unit="rows", available=self.available)
+
+    def peakmem_fold_weight(self, n_rows):
+        self._weights()
+
+    @_bytes
+    def track_peak(self, n_rows):
+        return traced(self._weights)[0]
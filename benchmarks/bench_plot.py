@@ -0,0 +1,31 @@
+"""Benchmarks for :func:`time_split.plot`."""
+
+from time_split import plot
+
+from . import _data
+
+
+class Plot:
+    """Plot folds, with and without row counts."""
+
+    params = ([100_000, 10_000_000], [10, 100], [False, True])
+    param_names = ("n_rows", "n_folds", "bar_labels")
+    timeout = 300
+
+    def setup(self, n_rows, n_folds, bar_labels):
+        try:
+            import matplotlib
+
+            matplotlib.use("Agg")
+        except ModuleNotFoundError:
+            raise NotImplementedError from None
+
+        self.available = _data.timestamps(n_rows, n_folds)
+
+    def teardown(self, n_rows, n_folds, bar_labels):
+        import matplotlib.pyplot as plt
+
+        plt.close("all")
+
+    def time_plot(self, n_rows, n_folds, bar_labels):
+        plot("1h", before=1, available=self.available, bar_labels=bar_labels)
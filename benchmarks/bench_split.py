@@ -0,0 +1,51 @@
+"""Benchmarks for :func:`time_split.split` and the ``DatetimeIndexSplitter`` backend."""
+
+from time_split import split
+from time_split.support import DatetimeIndexSplitter
+
+from . import _data
+
+
+class Schedule:
+    """Scaling with the number of folds, for each schedule type."""
+
+    params = (_data.SCHEDULE_TYPES, [10, 1_000, 100_000])
+    param_names = ("schedule", "n_folds")
+    timeout = 300
+
+    def setup(self, kind, n_folds):
+        self.schedule = _data.schedule(kind, n_folds)
+        self.available = _data.limits(n_folds)
+
+    def time_split(self, kind, n_folds):
+        split(self.schedule, before=1, available=self.available)
+
+    def time_compile(self, kind, n_folds):
+        DatetimeIndexSplitter(self.schedule, before=1).compile()
+
+
+class Span:
+    """Span types for `before` and `after`."""
+
+    params = ([1, "3h", "all", "empty"], [1, "3h", "empty"])
+    param_names = ("before", "after")
+
+    def setup(self, before, after):
+        self.available = _data.limits(1_000)
+
+    def time_split(self, before, after):
+        split("1h", before=before, after=after, available=self.available)
+
+
+class Available:
+    """Scaling with the size of the `available` data."""
+
+    params = ([1_000, 100_000, 10_000_000, 100_000_000], [False, True])
+    param_names = ("n_rows", "shuffle")
+    timeout = 600
+
+    def setup(self, n_rows, shuffle):
+        self.available = _data.timestamps(n_rows, shuffle=shuffle)
+
+    def time_split(self, n_rows, shuffle):
+        split("1h", before=1, available=self.available)
@@ -0,0 +1,21 @@
+"""Benchmarks for :mod:`time_split.support` functions."""
+
+from time_split import split
+from time_split.support import fold_weight
+
+from . import _data
+
+
+class FoldWeight:
+    """Row counting using :func:`~time_split.support.fold_weight`."""
+
+    params = ([1_000, 100_000, 10_000_000, 100_000_000], [10, 1_000, 100_000])
+    param_names = ("n_rows", "n_folds")
+    timeout = 600
+
+    def setup(self, n_rows, n_folds):
+        self.available = _data.timestamps(n_rows, n_folds)
+        self.splits = split("1h", before=1, available=self.available)
+
+    def time_fold_weight(self, n_rows, n_folds):
+        fold_weight(self.splits, unit="rows", available=self.available)
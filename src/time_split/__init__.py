@@ -1,6 +1,9 @@
 """Time-based k-fold validation splits for heterogeneous data."""
 
-from ._frontend import log_split_progress, plot, split
+import typing as _t
+
+if _t.TYPE_CHECKING:
+    from ._frontend import log_split_progress, plot, split
 
 __all__ = [
     "__version__",  # Make MyPy happy
@@ -10,3 +13,19 @@ __all__ = [
 ]
 
 __version__ = "1.2.1.dev1"
+
+
+def __getattr__(name: str) -> _t.Any:
+    # Import on first access, so that importing the package does not import pandas.
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from . import _frontend
+
+    value = getattr(_frontend, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
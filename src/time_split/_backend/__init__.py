@@ -1,13 +1,18 @@
 from ._datetime_index_like import DatetimeIndexLike
-from ._limits import expand_limits, is_limits_tuple
+from ._limits import expand_limits, is_limits_like, is_limits_tuple
 from ._process_available import ProcessAvailableResult, process_available
-from ._splitter import DatetimeIndexSplitter
+from ._splitter import DatetimeIndexSplitter, SplitterPlan
+from ._timing import StageTimings, record_stages
 
 __all__ = [
     "DatetimeIndexLike",
     "DatetimeIndexSplitter",
     "ProcessAvailableResult",
+    "SplitterPlan",
+    "StageTimings",
     "expand_limits",
+    "is_limits_like",
     "is_limits_tuple",
     "process_available",
+    "record_stages",
 ]
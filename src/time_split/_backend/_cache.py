@@ -0,0 +1,159 @@
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from pandas import DatetimeIndex, Timedelta
+
+from ..settings import auto_expand_limits, misc
+from ..settings import split_cache as settings
+from ..types import BalancedRows, DatetimeSplitBounds, DatetimeSplits
+from ._limits import LimitsTuple
+
+if TYPE_CHECKING:
+    from . import _splitter
+
+LOGGER = logging.getLogger(__name__)
+SUFFIX = ".npz"
+
+
+def make_key(plan: "_splitter.SplitterPlan", limits: LimitsTuple | None) -> str | None:
+    """Create a cache key for `plan`.
+
+    Args:
+        plan: A compiled splitter.
+        limits: Limits of the `available` data, or ``None``.
+
+    Returns:
+        A hex digest, or ``None`` if the splitter cannot be cached.
+    """
+    splitter = plan.splitter
+    schedule = _schedule_key(plan.schedule)
+    if schedule is None:
+        return None
+
+    filter_ = _filter_key(splitter.filter)
+    if filter_ is None and splitter.filter is not None:
+        return None
+
+    from time_split import __version__
+
+    key = {
+        "version": __version__,
+        "schedule": schedule,
+        "before": str(plan.before),
+        "after": str(plan.after),
+        "step": splitter.step,
+        "n_splits": splitter.n_splits,
+        "expand_limits": splitter.expand_limits,
+        "ignore_filters": splitter.ignore_filters,
+        "filter": filter_,
+        "limits": None if limits is None else [ts.isoformat() for ts in limits],
+        "settings": settings_snapshot(),
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def settings_snapshot() -> dict[str, Any]:
+    """Return settings which affect split results."""
+    return {
+        "misc.snap_to_end": misc.snap_to_end,
+        "misc.round_limits": misc.round_limits,
+        "auto_expand_limits.SANITY_CHECK": auto_expand_limits.SANITY_CHECK,
+        "auto_expand_limits.day": list(map(str, auto_expand_limits.day)),
+        "auto_expand_limits.hour": list(map(str, auto_expand_limits.hour)),
+    }
+
+
+def load(key: str) -> DatetimeSplits | None:
+    """Load cached splits, or ``None`` if `key` is not cached."""
+    path = _directory() / (key + SUFFIX)
+
+    try:
+        with np.load(path, allow_pickle=False) as npz:
+            values, tz = npz["values"], str(npz["tz"])
+    except FileNotFoundError:
+        return None
+    except Exception:
+        LOGGER.warning("Removing corrupt cache entry: '%s'.", path, exc_info=True)
+        path.unlink(missing_ok=True)
+        return None
+
+    os.utime(path)  # Mark as recently used.
+
+    index = DatetimeIndex(values.ravel().astype("datetime64[ns]"))
+    if tz:
+        index = index.tz_localize("UTC").tz_convert(tz)
+
+    return [DatetimeSplitBounds(*index[i : i + 3]) for i in range(0, len(index), 3)]
+
+
+def store(key: str, splits: DatetimeSplits) -> None:
+    """Store `splits` and evict entries until the cache directory is within the size limit."""
+    directory = _directory()
+    directory.mkdir(parents=True, exist_ok=True)
+
+    tz = splits[0].mid.tz if splits else None
+    values = np.array([[ts.value for ts in bounds] for bounds in splits], dtype=np.int64).reshape(-1, 3)
+
+    tmp = directory / f".{key}.{os.getpid()}.tmp"
+    with tmp.open("wb") as f:
+        np.savez(f, values=values, tz=np.array("" if tz is None else str(tz)))
+    tmp.replace(directory / (key + SUFFIX))
+
+    _evict(directory)
+
+
+def _evict(directory: Path) -> None:
+    entries = []
+    for path in directory.glob("*" + SUFFIX):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:  # Removed by another process.
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= settings.MAX_BYTES:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def _directory() -> Path:
+    if settings.DIRECTORY is None:
+        raise RuntimeError("Cache is disabled.")
+    return Path(settings.DIRECTORY)
+
+
+def _schedule_key(schedule: str | Timedelta | DatetimeIndex | BalancedRows) -> str | None:
+    if isinstance(schedule, BalancedRows):
+        return None  # Depends on all available data, not just the limits.
+    if isinstance(schedule, str):
+        return schedule
+    if isinstance(schedule, Timedelta):
+        return str(schedule)
+
+    digest = hashlib.sha256(schedule.as_unit("ns").asi8.tobytes()).hexdigest()
+    return f"{schedule.tz}:{digest}"
+
+
+def _filter_key(filter: Any) -> str | None:
+    if filter is None or isinstance(filter, str):
+        return filter
+
+    module = getattr(filter, "__module__", None)
+    qualname = getattr(filter, "__qualname__", None)
+    if module is None or qualname is None or "<" in qualname:
+        return None  # Lambdas, local functions, partials, etc.
+
+    bound_to = getattr(filter, "__self__", None)
+    if bound_to is not None and not isinstance(bound_to, ModuleType):
+        return None  # Bound methods; results may depend on the instance (or class) state.
+
+    return f"{module}.{qualname}"
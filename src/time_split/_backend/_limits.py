@@ -7,6 +7,7 @@ from pandas import Timedelta, Timestamp
 from .._compat import fix_pandas4_warning, make_timedelta
 from ..settings import auto_expand_limits, misc
 from ..types import ExpandLimits, TimedeltaTypes
+from ._timing import stage
 
 LimitsTuple = tuple[Timestamp, Timestamp]
 LevelTuple = tuple[TimedeltaTypes, TimedeltaTypes, TimedeltaTypes]
@@ -37,6 +38,27 @@ def is_limits_tuple(arg: Any) -> TypeGuard[LimitsTuple]:
     return bool(start <= end)
 
 
+def is_limits_like(arg: Any) -> bool:
+    """Check if `arg` is a ``(min, max)``-tuple of datetime-like values, e.g. strings.
+
+    Tuples such as these are accepted as `available` data, but hold no information other than the limits.
+
+    Args:
+        arg: An argument.
+
+    Returns:
+        Returns ``True`` if `arg` may be cast to a :class:`.LimitsTuple`.
+    """
+    if not (isinstance(arg, tuple) and len(arg) == 2):  # noqa: PLR2004
+        return False
+
+    try:
+        return is_limits_tuple((Timestamp(arg[0]), Timestamp(arg[1])))
+    except (TypeError, ValueError):
+        return False
+
+
+@stage("expand_limits")
 def expand_limits(
     limits: LimitsTuple,
     spec: ExpandLimits | LevelTuple | Iterable[LevelTuple] = "auto",
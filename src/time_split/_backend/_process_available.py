@@ -7,6 +7,7 @@ from ..types import DatetimeIterable, ExpandLimits
 from ._datetime_index_like import DatetimeIndexLike
 from ._limits import LimitsTuple
 from ._limits import expand_limits as expand
+from ._timing import stage
 
 
 class ProcessAvailableResult(NamedTuple):
@@ -17,6 +18,7 @@ class ProcessAvailableResult(NamedTuple):
     expanded_limits: LimitsTuple
 
 
+@stage("process_available")
 def process_available(available: DatetimeIterable, *, expand_limits: ExpandLimits) -> ProcessAvailableResult:
     """Process a user-given `available` argument.
 
@@ -1,15 +1,17 @@
-from typing import Literal, NamedTuple, get_args
+from typing import Literal, NamedTuple
 
+import numpy as np
 from pandas import DatetimeIndex, NaT, Timedelta, Timestamp, date_range
 
-from .._compat import make_timedelta
+from .._compat import TIMEDELTA_TYPES, make_timedelta
 from ..settings import misc as settings
-from ..types import DatetimeIterable, ExpandLimits, Schedule, TimedeltaTypes
-from ._limits import LimitsTuple
+from ..types import BalancedRows, DatetimeIterable, ExpandLimits, Schedule, TimedeltaTypes
+from ._limits import LimitsTuple, is_limits_like
 from ._process_available import ProcessAvailableResult, process_available
+from ._timing import stage
 
 NO_LIMITS: LimitsTuple = NaT, NaT
-ScheduleType = Literal["cron", "explicit", "timedelta"]
+ScheduleType = Literal["cron", "explicit", "timedelta", "balanced"]
 
 
 class MaterializedSchedule(NamedTuple):
@@ -20,11 +22,21 @@ class MaterializedSchedule(NamedTuple):
     schedule_type: ScheduleType
 
 
+@stage("materialize_schedule")
 def materialize_schedule(
-    schedule: Schedule, expand_limits: ExpandLimits, *, available: DatetimeIterable | None = None
+    schedule: Schedule,
+    expand_limits: ExpandLimits,
+    *,
+    available: DatetimeIterable | None = None,
+    available_metadata: ProcessAvailableResult | None = None,
 ) -> MaterializedSchedule:
-    """Materialize user schedule based on available data."""
-    if available is None:
+    """Materialize user schedule based on available data.
+
+    Pass `available_metadata` to skip processing `available` data, if already done.
+    """
+    if available is None and available_metadata is None:
+        if isinstance(schedule, BalancedRows):
+            raise ValueError(f"Schedule {schedule} requires available data.")
         try:
             return MaterializedSchedule(
                 DatetimeIndex(schedule),
@@ -34,14 +46,18 @@ def materialize_schedule(
         except TypeError as e:
             raise ValueError("Schedule must be explicit when not bounded by an available range.") from e
 
-    available_metadata = process_available(available, expand_limits=expand_limits)
+    if available_metadata is None:
+        available_metadata = process_available(available, expand_limits=expand_limits)  # type: ignore[arg-type]
     min_dt, max_dt = available_metadata.expanded_limits
 
     schedule_type: ScheduleType
-    if isinstance(schedule, str) and _cron_like(schedule):
+    if isinstance(schedule, BalancedRows):
+        schedule = _from_balanced_rows(schedule.n, available, available_metadata)
+        schedule_type = "balanced"
+    elif isinstance(schedule, str) and _cron_like(schedule):
         schedule = _handle_cron(schedule, min_dt, max_dt)
         schedule_type = "cron"
-    elif isinstance(schedule, get_args(TimedeltaTypes)):
+    elif isinstance(schedule, TIMEDELTA_TYPES):
         schedule = _from_timedelta(schedule, available_metadata.expanded_limits)
         schedule_type = "timedelta"
     else:
@@ -71,6 +87,28 @@ def _from_timedelta(schedule: TimedeltaTypes, limits: LimitsTuple) -> DatetimeIn
         return date_range(limits[0], limits[1], freq=timedelta, inclusive="both")
 
 
+def _from_balanced_rows(
+    n: int,
+    available: DatetimeIterable | None,
+    available_metadata: ProcessAvailableResult,
+) -> DatetimeIndex:
+    if available_metadata.available_as_index is None:
+        raise ValueError(f"Schedule {BalancedRows(n)} requires available data.")
+    if is_limits_like(available):
+        # Converted to a two-element index by process_available(); quantiles would be meaningless.
+        msg = f"Schedule {BalancedRows(n)} requires available data; limits {available=} are not enough."
+        raise ValueError(msg)
+
+    time = DatetimeIndex(available_metadata.available_as_index).dropna()
+    if not time.is_monotonic_increasing:
+        time = time.sort_values()
+
+    # Interior quantiles. Each interval [schedule[i], schedule[i + 1]) gets about len(time) / n rows.
+    positions = np.arange(1, n, dtype=np.int64) * len(time) // n
+    min_dt, max_dt = available_metadata.expanded_limits
+    return time[positions].insert(0, min_dt).append(DatetimeIndex([max_dt])).unique()
+
+
 def _handle_cron(expr: str, min_dt: Timestamp, max_dt: Timestamp) -> DatetimeIndex:
     try:
         from croniter import croniter_range
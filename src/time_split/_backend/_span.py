@@ -1,8 +1,8 @@
-from collections.abc import Callable
 from datetime import timedelta
 from typing import Literal, TypeAlias
 
-from pandas import DatetimeIndex, Timedelta, Timestamp
+import numpy as np
+from pandas import DatetimeIndex, Timedelta
 
 from .._compat import make_timedelta
 from ..types import Span
@@ -11,7 +11,6 @@ from ._schedule import NO_LIMITS
 
 StrictSpan: TypeAlias = int | Timedelta | Literal["all", "empty"]
 SpanArgumentName = Literal["before", "after"]
-FuncType = Callable[[int], Timestamp | None]
 
 
 class InvalidSpanError(ValueError):
@@ -75,79 +74,50 @@ class OffsetCalculator:
         *,
         name: SpanArgumentName,
     ) -> None:
-        span = to_strict_span(span, name=name)
-        is_before = name == "before"
-
+        self._span = to_strict_span(span, name=name)
         self._schedule = schedule
-        self._is_before = is_before
+        self._is_before = name == "before"
         self._limits: LimitsTuple | None = None if limits == NO_LIMITS else limits
 
-        self._func: FuncType
+    def compute(self) -> DatetimeIndex:
+        """Compute outer bounds for all `schedule` timestamps. Invalid bounds are ``NaT``."""
+        schedule = self._schedule
+        span = self._span
+
+        bounds: DatetimeIndex
         if span == "all":
-            self._func = self.get_all
+            bounds = self._get_all()
         elif span == "empty":
-            self._func = self.get_empty
+            bounds = schedule
         elif isinstance(span, int):
-            self._func = self._make_int(span)
+            positions = np.arange(len(schedule)) + (-span if self._is_before else span)
+            in_range = (positions >= 0) & (positions < len(schedule))
+            bounds = schedule.take(np.clip(positions, 0, max(len(schedule) - 1, 0))).where(in_range)
         else:  # Timedelta
-            self._func = self._make_timedelta(span)
-
-    def get(self, i: int) -> Timestamp | None:
-        """Get get outer bound at index `i`."""
-        rv = self._func(i)
-        if rv is None:
-            return None
-
-        mid = self._schedule[i]
+            bounds = schedule - span if self._is_before else schedule + span
 
+        valid = bounds.notna()
         if self._limits:
             min_start, max_end = self._limits
-            if not (min_start <= mid <= max_end):
-                return None  # Snapping to end may shift schedule out of range.
-            if not (min_start <= rv <= max_end):
-                return None
-
-        if rv == mid and self._func != self.get_empty:
-            return None
+            valid &= (min_start <= schedule) & (schedule <= max_end)  # Snapping to end may shift schedule out of range.
+            valid &= (min_start <= bounds) & (bounds <= max_end)
+        if span != "empty":
+            valid &= bounds != schedule
 
-        return rv
+        return bounds.where(valid)
 
-    def get_all(self, _: int) -> Timestamp:
+    def _get_all(self) -> DatetimeIndex:
         if self._limits is None:
+            if len(self._schedule) == 0:
+                return self._schedule
             raise InvalidSpanError("all", name=self.name, reason="requires available data to bound the schedule")
 
-        index = 0 if self._is_before else 1
-        return self._limits[index]
-
-    def get_empty(self, i: int) -> Timestamp:
-        return self._schedule[i]
-
-    def _make_int(self, offset: int) -> FuncType:
-        def func(i: int) -> Timestamp | None:
-            i = i - offset if self._is_before else i + offset
-            if 0 <= i < len(self._schedule):
-                return self._schedule[i]
-            else:
-                return None
-
-        func.__name__ = f"get_int({offset})"
-        return func
-
-    def _make_timedelta(self, offset: Timedelta) -> FuncType:
-        if self._is_before:
-            schedule = self._schedule - offset
-        else:
-            schedule = self._schedule + offset
-
-        def func(i: int) -> Timestamp:
-            return schedule[i]
-
-        func.__name__ = f"get_timedelta('{offset}')"
-        return func
+        limit = self._limits[0 if self._is_before else 1]
+        return DatetimeIndex([limit]).repeat(len(self._schedule))
 
     @property
     def name(self) -> SpanArgumentName:
         return "before" if self._is_before else "after"
 
     def __str__(self) -> str:
-        return f"{type(self).__name__}({self.name}={self._func.__name__})"
+        return f"{type(self).__name__}({self.name}={self._span!r})"
@@ -1,11 +1,15 @@
-from dataclasses import asdict, dataclass
-from typing import cast, get_args
+from dataclasses import dataclass, fields
+from functools import cached_property
+from typing import cast
 
+from pandas import DatetimeIndex, Timedelta
 from rics.misc import format_kwargs, get_by_full_name
 
-from .._compat import make_timedelta
+from .._compat import TIMEDELTA_TYPES, make_timedelta
 from ..settings import misc as settings
+from ..settings import split_cache as cache_settings
 from ..types import (
+    BalancedRows,
     DatetimeIndexSplitterKwargs,
     DatetimeIterable,
     DatetimeSplitBounds,
@@ -14,10 +18,12 @@ from ..types import (
     Filter,
     Schedule,
     Span,
-    TimedeltaTypes,
 )
-from ._schedule import MaterializedSchedule, materialize_schedule
-from ._span import OffsetCalculator, to_strict_span
+from . import _cache
+from ._process_available import ProcessAvailableResult, process_available
+from ._schedule import MaterializedSchedule, _cron_like, materialize_schedule
+from ._span import OffsetCalculator, StrictSpan, to_strict_span
+from ._timing import stage
 
 
 @dataclass(frozen=True)
@@ -34,30 +40,160 @@ class DatetimeIndexSplitter:
     filter: Filter | str | None = None
 
     def get_splits(self, available: DatetimeIterable | None = None) -> DatetimeSplits:
-        """Compute a split of given user data."""
-        ms = self._materialize_schedule(available)
-        return self._make_bounds_list(ms)
+        """Compute a split of given user data.
+
+        Results are cached on disk if :attr:`settings.split_cache.DIRECTORY <.split_cache.DIRECTORY>` is set.
+        """
+        return self._plan.get_splits(available)
 
     def get_plot_data(self, available: DatetimeIterable | None = None) -> tuple[DatetimeSplits, MaterializedSchedule]:
         """Returns additional data needed to visualize folds."""
-        ms = self._materialize_schedule(available)
-        splits = self._make_bounds_list(ms)
-        return splits, ms
+        return self._plan.get_plot_data(available)
+
+    def compile(self) -> "SplitterPlan":
+        """Create an immutable plan which may be applied to many different `available` data sets.
+
+        Spans and explicit schedules are parsed, and `filter` strings resolved, only once. Use this method when
+        applying the same configuration to many data sets, e.g. one series per entity.
+
+        Returns:
+            A :class:`.SplitterPlan`.
+
+        Raises:
+            ValueError: If a timedelta `schedule` is not positive.
+
+        Examples:
+            Reusing a plan.
+
+            >>> plan = DatetimeIndexSplitter("1d", before="all").compile()
+            >>> for limits in [("2022-01-01", "2022-01-04"), ("2022-01-02", "2022-01-05")]:
+            ...     for start, mid, end in plan.get_splits(limits):
+            ...         print(start.date(), mid.date(), end.date())
+            2022-01-01 2022-01-02 2022-01-03
+            2022-01-01 2022-01-03 2022-01-04
+            2022-01-02 2022-01-03 2022-01-04
+            2022-01-02 2022-01-04 2022-01-05
+        """
+        return SplitterPlan(self)
+
+    @cached_property
+    def _plan(self) -> "SplitterPlan":
+        return self.compile()
 
     def _materialize_schedule(self, available: DatetimeIterable | None = None) -> MaterializedSchedule:
-        ms = materialize_schedule(self.schedule, self.expand_limits, available=available)
-        if not ms.schedule.sort_values().equals(ms.schedule):
-            raise ValueError(f"schedule must be sorted in ascending order; schedule={self.schedule!r} is not valid.")
-
-        types = get_args(TimedeltaTypes)
-        if (
-            settings.snap_to_end
-            and self.after not in {"all", "empty"}
-            and ms.schedule_type == "timedelta"
-            and isinstance(self.after, (types, int))
-        ):
-            ms = self._snap_to_end(ms)
+        plan = self._plan
+        return plan.adapt_schedule(plan.materialize_schedule(available))
+
+    def __post_init__(self) -> None:
+        # Verify n_splits
+        if self.n_splits < 0:
+            raise ValueError(f"Expected n_splits >= 0, but got n_splits={self.n_splits!r}.")
+
+        # Verify before/after
+        to_strict_span(self.before, name="before")
+        to_strict_span(self.after, name="after")
+
+        if self.step == 0:
+            raise ValueError(f"Bad argument step={self.step}; must be a non-zero integer.")
+
+    def as_dict(self) -> DatetimeIndexSplitterKwargs:
+        """Returns the splitter as a ``dict``."""
+        # Not dataclasses.asdict(), which would convert dataclass schedules (e.g. BalancedRows) to dicts.
+        return cast(DatetimeIndexSplitterKwargs, {f.name: getattr(self, f.name) for f in fields(self)})
+
+
+class SplitterPlan:
+    """A compiled :class:`.DatetimeIndexSplitter`. Create using :meth:`.DatetimeIndexSplitter.compile`.
+
+    Settings are read when the plan is applied, not when it is compiled.
+    """
+
+    __slots__ = ("after", "before", "filter", "schedule", "splitter")
+
+    splitter: DatetimeIndexSplitter
+    """The splitter that created this plan."""
+    schedule: str | Timedelta | DatetimeIndex | BalancedRows
+    """A cron expression, a timedelta, an explicit schedule, or a :class:`~time_split.types.BalancedRows` instance."""
+    before: StrictSpan
+    """Parsed `before`-argument."""
+    after: StrictSpan
+    """Parsed `after`-argument."""
+    filter: Filter | None
+    """Resolved `filter`-argument. Always ``None`` if ``ignore_filters=True``."""
+
+    def __init__(self, splitter: DatetimeIndexSplitter) -> None:
+        attributes = {
+            "splitter": splitter,
+            "schedule": _parse_schedule(splitter.schedule),
+            "before": to_strict_span(splitter.before, name="before"),
+            "after": to_strict_span(splitter.after, name="after"),
+            "filter": None if splitter.ignore_filters else _resolve_filter(splitter.filter),
+        }
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable.")
 
+    def __getstate__(self) -> dict[str, object]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        # Used by pickle and copy.deepcopy; the plan may be cached by DatetimeIndexSplitter._plan.
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def get_splits(self, available: DatetimeIterable | None = None) -> DatetimeSplits:
+        """Compute a split of given user data. See :meth:`.DatetimeIndexSplitter.get_splits`."""
+        if cache_settings.DIRECTORY is None:
+            ms = self.adapt_schedule(self.materialize_schedule(available))
+            return self.make_bounds_list(ms)
+
+        splitter = self.splitter
+        metadata = None if available is None else process_available(available, expand_limits=splitter.expand_limits)
+        key = _cache.make_key(self, None if metadata is None else metadata.limits)
+        if key is not None and (splits := _cache.load(key)) is not None:
+            return splits
+
+        ms = self.adapt_schedule(self.materialize_schedule(available, available_metadata=metadata))
+        splits = self.make_bounds_list(ms)
+        if key is not None:
+            _cache.store(key, splits)
+        return splits
+
+    def get_plot_data(self, available: DatetimeIterable | None = None) -> tuple[DatetimeSplits, MaterializedSchedule]:
+        """Returns additional data needed to visualize folds."""
+        ms = self.adapt_schedule(self.materialize_schedule(available))
+        splits = self.make_bounds_list(ms)
+        return splits, ms
+
+    def materialize_schedule(
+        self,
+        available: DatetimeIterable | None = None,
+        *,
+        available_metadata: ProcessAvailableResult | None = None,
+    ) -> MaterializedSchedule:
+        """Materialize the schedule for the given `available` data.
+
+        The schedule returned by this method does not depend on spans or filters. Pass the result to
+        :meth:`adapt_schedule` before computing bounds.
+        """
+        ms = materialize_schedule(
+            self.schedule,
+            self.splitter.expand_limits,
+            available=available,
+            available_metadata=available_metadata,
+        )
+        if not ms.schedule.is_monotonic_increasing:
+            schedule = self.splitter.schedule
+            raise ValueError(f"schedule must be sorted in ascending order; {schedule=} is not valid.")
+
+        return ms
+
+    def adapt_schedule(self, ms: MaterializedSchedule) -> MaterializedSchedule:
+        """Apply span-dependent adjustments, such as snapping to the end of the `available` data."""
+        if settings.snap_to_end and ms.schedule_type == "timedelta" and not isinstance(self.after, str):
+            return self._snap_to_end(ms)
         return ms
 
     def _snap_to_end(self, ms: MaterializedSchedule) -> MaterializedSchedule:
@@ -65,37 +201,40 @@ class DatetimeIndexSplitter:
         schedule_end = ms.schedule[-1]
 
         from_end = data_end - schedule_end
-        if not isinstance(self.after, int):
-            after = make_timedelta(self.after)
-            from_end -= after
+        if isinstance(self.after, Timedelta):
+            from_end -= self.after
 
         return ms._replace(schedule=ms.schedule + from_end)
 
-    def _make_bounds_list(self, ms: MaterializedSchedule) -> DatetimeSplits:
-        oc_start = OffsetCalculator(self.before, ms.schedule, ms.available_metadata.expanded_limits, name="before")
-        oc_end = OffsetCalculator(self.after, ms.schedule, ms.available_metadata.expanded_limits, name="after")
+    def make_bounds_list(self, ms: MaterializedSchedule) -> DatetimeSplits:
+        """Create filtered bounds from a materialized schedule."""
+        splits = self.compute_bounds(ms)
+        return splits if self.splitter.ignore_filters else self.apply_filters(splits)
 
-        retval = []
-        for i, mid in enumerate(ms.schedule):
-            start = oc_start.get(i)
-            if start is None:
-                continue
+    @stage("compute_bounds")
+    def compute_bounds(self, ms: MaterializedSchedule) -> DatetimeSplits:
+        """Create unfiltered bounds from a materialized schedule.
 
-            end = oc_end.get(i)
-            if end is None:
-                continue
+        Raises:
+            ValueError: If there are no valid splits.
+        """
+        limits = ms.available_metadata.expanded_limits
+        start = OffsetCalculator(self.before, ms.schedule, limits, name="before").compute()
+        end = OffsetCalculator(self.after, ms.schedule, limits, name="after").compute()
 
-            retval.append(DatetimeSplitBounds(start, mid, end))
+        valid = start.notna() & end.notna()
+        retval = list(map(DatetimeSplitBounds, start[valid], ms.schedule[valid], end[valid]))
 
         if not retval:
             limits_info = f"limits={tuple(map(str, ms.available_metadata.limits))} and "
-            msg = f"No valid splits with {limits_info}split params: ({format_kwargs(self.as_dict())})"
+            msg = f"No valid splits with {limits_info}split params: ({format_kwargs(self.splitter.as_dict())})"
             raise ValueError(msg)
 
-        return retval if self.ignore_filters else self._filter(retval)
+        return retval
 
-    def _filter(self, splits: DatetimeSplits) -> DatetimeSplits:
-        """Apply splitting arguments.
+    @stage("apply_filters")
+    def apply_filters(self, splits: DatetimeSplits) -> DatetimeSplits:
+        """Apply filtering arguments (`step`, `n_splits` and `filter`).
 
         Args:
             splits: Splits to filter.
@@ -103,38 +242,46 @@ class DatetimeIndexSplitter:
         Returns:
             Filtered splits.
         """
-        if self.step != 1:
-            step = abs(self.step)
-            splits = [s for i, s in enumerate(reversed(splits)) if i % step == 0]
+        step = self.splitter.step
+        n_splits = self.splitter.n_splits
+
+        if step != 1:
+            splits = [s for i, s in enumerate(reversed(splits)) if i % abs(step) == 0]
             splits.reverse()
 
-        if self.n_splits > 0:
-            splits = splits[-self.n_splits :]
+        if n_splits > 0:
+            splits = splits[-n_splits:]
 
-        if self.step < 0:  # Poorly documented - might not work as expected?
+        if step < 0:  # Poorly documented - might not work as expected?
             splits.reverse()
 
         filter = self.filter
         if filter is None:
             return splits
 
-        if isinstance(filter, str):
-            filter = cast(Filter, get_by_full_name(filter))
-
         return [s for s in splits if filter(*s)]
 
-    def __post_init__(self) -> None:
-        # Verify n_splits
-        if self.n_splits < 0:
-            raise ValueError(f"Expected n_splits >= 0, but got n_splits={self.n_splits!r}.")
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.splitter!r})"
 
-        # Verify before/after
-        to_strict_span(self.before, name="before")
-        to_strict_span(self.after, name="after")
 
-        if self.step == 0:
-            raise ValueError(f"Bad argument step={self.step}; must be a non-zero integer.")
+def _parse_schedule(schedule: Schedule) -> str | Timedelta | DatetimeIndex | BalancedRows:
+    if isinstance(schedule, BalancedRows):
+        return schedule
 
-    def as_dict(self) -> DatetimeIndexSplitterKwargs:
-        """Returns the splitter as a ``dict``."""
-        return cast(DatetimeIndexSplitterKwargs, asdict(self))
+    if isinstance(schedule, str) and _cron_like(schedule):
+        return schedule
+
+    if isinstance(schedule, TIMEDELTA_TYPES):
+        timedelta = make_timedelta(schedule)
+        if timedelta <= Timedelta(0):
+            raise ValueError(f"unbounded {schedule=} must be greater than zero.")
+        return timedelta
+
+    return schedule if isinstance(schedule, DatetimeIndex) else DatetimeIndex(schedule)
+
+
+def _resolve_filter(filter: Filter | str | None) -> Filter | None:
+    if isinstance(filter, str):
+        return cast(Filter, get_by_full_name(filter))
+    return filter
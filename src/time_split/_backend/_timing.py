@@ -0,0 +1,120 @@
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+_RECORDER: ContextVar["StageTimings | None"] = ContextVar("time_split_stage_timings", default=None)
+
+
+class StageTimings:
+    """Wall time and call counts per stage. Created by :func:`.record_stages`.
+
+    Stages may be nested; e.g. ``'process_available'`` includes ``'expand_limits'``. Times are inclusive.
+    """
+
+    def __init__(self) -> None:
+        self._seconds: dict[str, float] = {}
+        self._calls: dict[str, int] = {}
+
+    def add(self, stage: str, seconds: float, calls: int = 1) -> None:
+        """Add `seconds` and `calls` to the totals of `stage`."""
+        self._seconds[stage] = self._seconds.get(stage, 0.0) + seconds
+        self._calls[stage] = self._calls.get(stage, 0) + calls
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Returns a dict ``{stage: {'calls': int, 'seconds': float}}``, in the order that stages were first entered."""
+        return {stage: {"calls": self._calls[stage], "seconds": seconds} for stage, seconds in self._seconds.items()}
+
+    def to_pandas(self) -> "DataFrame":
+        """Returns a ``DataFrame`` with columns ``['calls', 'seconds']``, indexed by stage."""
+        from pandas import DataFrame
+
+        df = DataFrame.from_dict(self.to_dict(), orient="index", columns=["calls", "seconds"])
+        return df.rename_axis("stage")
+
+    def log(
+        self,
+        logger: logging.Logger | logging.LoggerAdapter[Any] | str = "time_split",
+        level: int = logging.DEBUG,
+    ) -> None:
+        """Log a summary. Per-stage timings are available as ``extra['stage_timings']``.
+
+        Args:
+            logger: Logger or logger name to use.
+            level: Log level to use.
+        """
+        logger = logging.getLogger(logger) if isinstance(logger, str) else logger
+        if not logger.isEnabledFor(level):
+            return
+
+        timings = self.to_dict()
+        parts = [f"{stage}={t['seconds']:.6f}s/{t['calls']}" for stage, t in timings.items()]
+        logger.log(level, "Stage timings: " + ", ".join(parts), extra={"stage_timings": timings})
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()})"
+
+
+@contextmanager
+def record_stages() -> Iterator[StageTimings]:
+    """Record wall time and call counts of internal stages.
+
+    Recording is scoped to the current :mod:`context <contextvars>`. Code running in other threads is not recorded,
+    unless started using e.g. :meth:`contextvars.Context.run`. When nested, only the innermost recorder is updated.
+
+    Recorded stages:
+        * ``'process_available'``, ``'expand_limits'``: Limits derived from the `available` data.
+        * ``'materialize_schedule'``: Cron, timedelta and explicit schedule materialization.
+        * ``'compute_bounds'``: Computing `before` and `after` offsets for each fold.
+        * ``'apply_filters'``: The `step`, `n_splits` and `filter` arguments.
+        * ``'as_available'``: Integration callback (see :func:`.split_data`).
+        * ``'select_fold'``: Selecting the `data` and `future_data` of each fold in :func:`.split_data`, using either
+          two `select` calls or the next two items of `select_many`. Called once per fold.
+
+    Yields:
+        A :class:`.StageTimings` instance, updated while the block runs.
+
+    Examples:
+        Timing a split.
+
+        >>> from time_split import split
+        >>> with record_stages() as timings:
+        ...     splits = split("1d", available=("2022", "2022-02"))
+        >>> timings.to_pandas()["calls"]
+        stage
+        materialize_schedule    1
+        process_available       1
+        expand_limits           1
+        compute_bounds          1
+        apply_filters           1
+        Name: calls, dtype: int64
+
+        Stages are listed in the order they were entered.
+    """
+    timings = StageTimings()
+    token = _RECORDER.set(timings)
+    try:
+        yield timings
+    finally:
+        _RECORDER.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a stage if recording is enabled. Does nothing otherwise. May also be used as a decorator."""
+    timings = _RECORDER.get()
+    if timings is None:
+        yield
+        return
+
+    timings.add(name, 0.0, calls=0)  # Preserve entry order for nested stages.
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, perf_counter() - start)
@@ -1,7 +1,15 @@
-from pandas import Timedelta
+from datetime import date, datetime, timedelta
+
+from numpy import datetime64, timedelta64
+from pandas import Timedelta, Timestamp
 
 from time_split.types import TimedeltaTypes
 
+DATETIME_TYPES = (str, Timestamp, datetime, date, datetime64)
+"""Members of :attr:`~time_split.types.DatetimeTypes`, for use with ``isinstance``."""
+TIMEDELTA_TYPES = (str, Timedelta, timedelta, timedelta64)
+"""Members of :attr:`~time_split.types.TimedeltaTypes`, for use with ``isinstance``."""
+
 
 def fix_pandas4_warning(arg: str) -> str:
     return arg[:-1] + "D" if arg.endswith("d") else arg
@@ -16,7 +16,10 @@ def docs(__func: Callable[P, T], /) -> Callable[P, T]:
         f"or `'all'` (requires `available` data). Pass `'empty'` to disable."
     )
     docstrings = {
-        "schedule": f"A :attr:`~time_split.types.DatetimeIterable`, {offset}, or `cron <https://pypi.org/project/croniter/>`_ expression.",
+        "schedule": (
+            f"A :attr:`~time_split.types.DatetimeIterable`, {offset}, `cron <https://pypi.org/project/croniter/>`_ "
+            "expression, or :class:`~time_split.types.BalancedRows`."
+        ),
         "before": span.format("before"),
         "after": span.format("after"),
         "step": "Select a subset of folds, preferring folds later in the schedule.",
@@ -33,6 +36,7 @@ def docs(__func: Callable[P, T], /) -> Callable[P, T]:
         "DatetimeIndexSplitterKwargs": "See :func:`~time_split.split`. The `available` keyword is managed by the integration.",
         "show_removed": "If ``True``, splits removed by `n_splits` or `step` are included in the figure.",
         "log_progress": "Controls logging of fold progress. See :func:`~.log_split_progress` for details.",
+        "cache": "A :class:`~time_split.integration.base.SelectCache` used to memoize fold data selection.",
     }
 
     __func.__doc__ = __func.__doc__.format(**docstrings)
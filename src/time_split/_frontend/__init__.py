@@ -1,15 +1,30 @@
+from ._budget import fit_to_budget
+from ._collector import MetricsCollector
+from ._grouped import split_grouped
+from ._manifest import SplitManifest, read_manifest, write_manifest
+from ._membership import FoldIndex, fold_membership
 from ._plot import plot
 from ._progress import default_metrics_formatter, log_split_progress
 from ._split import split
+from ._sweep import split_sweep
 from ._to_string import format_expanded_limits, to_string
 from ._weight import fold_weight
 
 __all__ = [
+    "FoldIndex",
+    "MetricsCollector",
+    "SplitManifest",
     "default_metrics_formatter",
+    "fit_to_budget",
+    "fold_membership",
     "fold_weight",
     "format_expanded_limits",
     "log_split_progress",
     "plot",
+    "read_manifest",
     "split",
+    "split_grouped",
+    "split_sweep",
     "to_string",
+    "write_manifest",
 ]
@@ -0,0 +1,119 @@
+import numpy as np
+
+from .._backend import DatetimeIndexSplitter, is_limits_like
+from .._compat import TIMEDELTA_TYPES, make_timedelta
+from .._docstrings import docs
+from ..types import (
+    DatetimeIterable,
+    ExpandLimits,
+    Filter,
+    FoldBudget,
+    FoldCost,
+    Schedule,
+    Span,
+    TimedeltaTypes,
+)
+from ._weight import fold_weight
+
+
+@docs
+def fit_to_budget(
+    schedule: Schedule,
+    budget: float | TimedeltaTypes,
+    *,
+    cost: float | FoldCost,
+    available: DatetimeIterable,
+    before: Span = "7d",
+    after: Span = 1,
+    expand_limits: ExpandLimits = "auto",
+    filter: Filter | str | None = None,
+) -> FoldBudget:
+    """Choose `n_splits` and `step` to fit a compute budget.
+
+    Maximizes the number of folds whose total estimated cost is within the `budget`. When several `step` values give
+    the same number of folds, the smallest `step` is preferred. Row counts are computed using :func:`.fold_weight`.
+
+    Args:
+        schedule: {schedule}
+        budget: Total budget in seconds, or a timedelta. Whether this is wall-clock or CPU time is determined by the
+            `cost` model.
+        cost: Seconds per row (counting both `data` and `future_data` rows), or a callable
+            ``(DatetimeSplitCounts) -> seconds`` which estimates the cost of a single fold.
+        available: {available} Row counts are derived from this data, so a limits tuple ``(min, max)`` is not
+            enough.
+        before: {before}
+        after: {after}
+        expand_limits: {expand_limits}
+        filter: {filter}
+
+    {USER_GUIDE}
+
+    Returns:
+        A :class:`~time_split.types.FoldBudget` tuple. Pass `n_splits` and `step` to e.g. :func:`time_split.split`.
+
+    Raises:
+        ValueError: If no fold fits the `budget`, or if `filter` removes all folds.
+        ValueError: If `available` is a limits tuple.
+
+    Examples:
+        Fit folds into a 4-minute budget, assuming each row costs 10 milliseconds.
+
+        >>> import pandas as pd
+        >>> available = pd.date_range("2022-01-01", "2022-03-01", freq="10min")
+        >>> budget = fit_to_budget("7d", "4m", cost=0.01, available=available, before="all")
+        >>> budget
+        FoldBudget(n_splits=0, step=2, n_folds=4, seconds=218.88)
+
+        Splitting with these arguments produces `n_folds` folds.
+
+        >>> from time_split import split
+        >>> splits = split(
+        ...     "7d",
+        ...     before="all",
+        ...     available=available,
+        ...     n_splits=budget.n_splits,
+        ...     step=budget.step,
+        ... )
+        >>> len(splits)
+        4
+    """
+    if is_limits_like(available):
+        raise ValueError(f"Cannot count rows using limits {available=}. Pass the full available data instead.")
+
+    seconds = make_timedelta(budget).total_seconds() if isinstance(budget, TIMEDELTA_TYPES) else float(budget)
+
+    plan = DatetimeIndexSplitter(
+        schedule, before=before, after=after, expand_limits=expand_limits, filter=filter
+    ).compile()
+    ms = plan.adapt_schedule(plan.materialize_schedule(available))
+    splits = plan.compute_bounds(ms)
+
+    weights = fold_weight(splits, unit="rows", available=ms.available_metadata.available_as_index)
+    estimate = cost if callable(cost) else lambda counts: cost * sum(counts)
+    keep = np.array([plan.filter is None or bool(plan.filter(*s)) for s in splits])
+    costs = np.where(keep, [estimate(w) for w in weights], 0.0)
+    if not keep.any():
+        raise ValueError(f"No folds remain after applying {filter=}.")
+
+    best: FoldBudget | None = None
+    for step in range(1, len(splits) + 1):
+        order = np.arange(len(splits) - 1, -1, -step)  # Latest first; the order used by `n_splits`.
+        total = np.cumsum(costs[order])
+        n_splits = int(np.searchsorted(total, seconds, side="right"))
+
+        kept = np.flatnonzero(keep[order[:n_splits]])
+        if len(kept) == 0 or (best is not None and len(kept) <= best.n_folds):
+            continue
+
+        n_splits = int(kept[-1]) + 1  # Don't include folds removed by `filter`.
+        best = FoldBudget(
+            n_splits=0 if n_splits == len(order) else n_splits,
+            step=step,
+            n_folds=len(kept),
+            seconds=round(float(total[n_splits - 1]), 6),
+        )
+
+    if best is None:
+        msg = f"No fold fits within {budget=} ({seconds=:g}); the latest fold costs {costs[keep][-1]:g} seconds."
+        raise ValueError(msg)
+    return best
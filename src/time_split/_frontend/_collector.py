@@ -0,0 +1,174 @@
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+from rics.collections.dicts import flatten_dict
+
+from ..types import DatetimeSplitBounds
+
+if TYPE_CHECKING:
+    import polars
+
+PART_FORMAT = "part-{:05d}.parquet"
+"""File name format used for Parquet part files written by :class:`.MetricsCollector`."""
+
+_FOLD_KEYS = ("seconds", "select_seconds", "data_rows", "future_data_rows")
+
+
+class MetricsCollector:
+    """Accumulate per-fold metrics, durations and bounds in a columnar table.
+
+    Pass to :func:`~time_split.log_split_progress` using the `collector` argument. One row is added each time a fold
+    finishes. Columns are ``n``, the fold bounds (``start``, ``mid`` and ``end``), ``seconds``, and the
+    :class:`~time_split.types.SplitProgressExtras` keys ``select_seconds``, ``data_rows`` and ``future_data_rows``
+    when available. Metrics returned by `get_metrics` are added with a ``'metrics.'`` prefix. Nested dicts and pandas
+    types are flattened, e.g. ``{'rmse': {'test': 0.5}}`` becomes ``'metrics.rmse.test'``. Other metric types (e.g.
+    pre-formatted strings) are stored as-is in the ``'metrics'`` column.
+
+    Columns which are missing for some folds are filled with ``None``.
+
+    Args:
+        path: A directory to write rows to while iterating. Rows are written as Parquet part files, so that long
+            backtests may be inspected while they run; see :meth:`read_parquet`. The directory is created if it does
+            not exist, but it may not contain any part files.
+        flush_every: Number of rows per part file. Remaining rows are written when the last fold finishes, or when
+            leaving a ``with``-block. Call :meth:`flush` to write them manually, e.g. after tracking folds out of order.
+
+    Raises:
+        FileExistsError: If `path` already contains part files.
+        ValueError: If `flush_every` is not positive.
+
+    Examples:
+        Collecting fold metrics.
+
+        >>> from time_split import log_split_progress, split
+        >>> collector = MetricsCollector()
+        >>> folds = log_split_progress(
+        ...     split("1d", before="all", available=("2022-01-01", "2022-01-04")),
+        ...     get_metrics=lambda mid: dict(rmse=dict(test=mid.day / 10)),
+        ...     collector=collector,
+        ... )
+        >>> for fold in folds:
+        ...     pass  # Train and evaluate model.
+        >>> collector.to_pandas()[["n", "mid", "metrics.rmse.test"]]
+           n        mid  metrics.rmse.test
+        0  1 2022-01-02                0.2
+        1  2 2022-01-03                0.3
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None, *, flush_every: int = 1) -> None:
+        if flush_every < 1:
+            raise ValueError(f"Bad {flush_every=}; must be a positive integer.")
+
+        self._columns: dict[str, list[Any]] = {}
+        self._n_rows = 0
+        self._flushed = 0
+        self._n_parts = 0
+        self._flush_every = flush_every
+
+        self._path = None if path is None else Path(path)
+        if self._path is not None:
+            self._path.mkdir(parents=True, exist_ok=True)
+            if any(self._path.glob("part-*.parquet")):
+                raise FileExistsError(f"Directory '{self._path}' already contains part files.")
+
+    @property
+    def path(self) -> Path | None:
+        """Directory that rows are written to, if any."""
+        return self._path
+
+    def add(self, bounds: DatetimeSplitBounds, n: int, extra: Mapping[str, Any]) -> None:
+        """Add a row for a finished fold.
+
+        Args:
+            bounds: Bounds of the fold.
+            n: Fold number (starting at 1).
+            extra: Progress extras of the fold (see :class:`~time_split.types.SplitProgressExtras`). Keys which are
+                not listed in the class description are ignored.
+        """
+        row: dict[str, Any] = {"n": n, **bounds._asdict()}
+        row.update((key, extra[key]) for key in _FOLD_KEYS if key in extra)
+        if "metrics" in extra:
+            row.update(_flatten_metrics(extra["metrics"]))
+
+        for key in row:
+            if key not in self._columns:
+                self._columns[key] = [None] * self._n_rows
+        for key, values in self._columns.items():
+            values.append(row.get(key))
+        self._n_rows += 1
+
+        if self._path is not None and self._n_rows - self._flushed >= self._flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write rows which have not yet been written to a new part file. Does nothing if `path` is ``None``."""
+        if self._path is None or self._flushed == self._n_rows:
+            return
+
+        df = self._to_pandas(slice(self._flushed, self._n_rows))
+        df.to_parquet(self._path / PART_FORMAT.format(self._n_parts), index=False)
+        self._n_parts += 1
+        self._flushed = self._n_rows
+
+    def __enter__(self) -> "MetricsCollector":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.flush()
+
+    def __len__(self) -> int:
+        return self._n_rows
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """Returns collected rows as a dict ``{column: values}``."""
+        return {key: values.copy() for key, values in self._columns.items()}
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Returns collected rows as a ``pandas.DataFrame``."""
+        return self._to_pandas(slice(None))
+
+    def to_polars(self) -> "polars.DataFrame":
+        """Returns collected rows as a ``polars.DataFrame``."""
+        import polars
+
+        return polars.from_pandas(self.to_pandas())
+
+    @classmethod
+    def read_parquet(cls, path: str | os.PathLike[str]) -> pd.DataFrame:
+        """Read part files written by a collector.
+
+        Part files may have different columns, e.g. if metrics were added while iterating.
+
+        Args:
+            path: The `path` of a collector.
+
+        Returns:
+            A ``pandas.DataFrame``.
+
+        Raises:
+            FileNotFoundError: If `path` does not contain any part files.
+        """
+        files = sorted(Path(path).glob("part-*.parquet"))
+        if not files:
+            raise FileNotFoundError(f"No part files found in '{path}'.")
+        return pd.concat([pd.read_parquet(file) for file in files], ignore_index=True)
+
+    def _to_pandas(self, rows: slice) -> pd.DataFrame:
+        return pd.DataFrame({key: values[rows] for key, values in self._columns.items()})
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={self._path!r}, rows={self._n_rows}, columns={len(self._columns)})"
+
+
+def _flatten_metrics(metrics: Any) -> dict[str, Any]:
+    if isinstance(metrics, pd.DataFrame):
+        metrics = {str(column): metrics[column].to_dict() for column in metrics.columns}
+    elif isinstance(metrics, pd.Series):
+        metrics = metrics.to_dict()
+
+    if isinstance(metrics, dict):
+        return {f"metrics.{key}": value for key, value in flatten_dict(metrics).items()}
+    return {"metrics": metrics}
@@ -0,0 +1,106 @@
+from collections.abc import Hashable
+from typing import Any, Literal, Unpack
+
+import numpy as np
+from pandas import DataFrame, DatetimeIndex, MultiIndex, Series
+
+from .._backend import DatetimeIndexSplitter
+from .._docstrings import docs
+from ..types import BalancedRows, DatetimeIndexSplitterKwargs, DatetimeSplits
+
+
+@docs
+def split_grouped(
+    data: DataFrame,
+    group_column: Hashable,
+    time_column: Hashable = None,
+    *,
+    errors: Literal["raise", "ignore"] = "raise",
+    **kwargs: Unpack[DatetimeIndexSplitterKwargs],
+) -> DataFrame:
+    """Split many entities' series in a single call.
+
+    Limits are computed for all groups at once. Arguments are parsed only once, and folds are computed only once per
+    unique ``(min, max)``-pair of `available` data. The exception is :class:`~time_split.types.BalancedRows`
+    schedules, which depend on every timestamp; folds are computed separately for each group.
+
+    Args:
+        data: A ``DataFrame`` with one or more series per group.
+        group_column: A column in `data` that identifies the group (entity) of each row.
+        time_column: A column in `data` to split on. Use ``data.index`` if ``None``.
+        errors: If `'ignore'`, groups which cannot be split (e.g. due to lack of data) are excluded from the output.
+        **kwargs: See :func:`~time_split.split`. The `available` keyword is managed by this function.
+
+    {USER_GUIDE}
+
+    Returns:
+        A long-format ``DataFrame`` with columns ``[group_column, 'fold', 'start', 'mid', 'end']``. Folds are numbered
+        within each group, starting from zero.
+
+    Raises:
+        ValueError: If a group cannot be split and ``errors='raise'``.
+
+    Examples:
+        Split stores with different lifetimes.
+
+        >>> import pandas as pd
+        >>> df = pd.DataFrame(
+        ...     dict(
+        ...         store=["a", "a", "b", "b", "c", "c"],
+        ...         time=pd.to_datetime(
+        ...             ["2022-01-01", "2022-01-05"] * 2 + ["2022-01-03", "2022-01-06"]
+        ...         ),
+        ...     )
+        ... )
+        >>> split_grouped(df, "store", "time", schedule="1d", before="all", after=1)
+          store  fold      start        mid        end
+        0     a     0 2022-01-01 2022-01-02 2022-01-03
+        1     a     1 2022-01-01 2022-01-03 2022-01-04
+        2     a     2 2022-01-01 2022-01-04 2022-01-05
+        3     b     0 2022-01-01 2022-01-02 2022-01-03
+        4     b     1 2022-01-01 2022-01-03 2022-01-04
+        5     b     2 2022-01-01 2022-01-04 2022-01-05
+        6     c     0 2022-01-03 2022-01-04 2022-01-05
+        7     c     1 2022-01-03 2022-01-05 2022-01-06
+
+        Groups `a` and `b` share limits; their folds are computed only once.
+    """
+    if errors not in {"raise", "ignore"}:
+        raise ValueError(f"Bad {errors=}; expected one of ('raise', 'ignore').")
+
+    time = DatetimeIndex(data.index if time_column is None else data[time_column])
+    grouped = Series(time).groupby(data[group_column].array, observed=True)
+    limits = grouped.agg(["min", "max"])
+    limits.index.name = group_column
+
+    plan = DatetimeIndexSplitter(**kwargs).compile()
+    if isinstance(plan.schedule, BalancedRows):
+        # Limits are not enough; the schedule is derived from the timestamps of each group.
+        codes = np.arange(len(limits))
+        unique_available: list[Any] = [DatetimeIndex(group_time) for _, group_time in grouped]
+    else:
+        codes, unique_limits = MultiIndex.from_frame(limits).factorize()
+        unique_available = list(unique_limits)
+
+    per_limits: list[DatetimeSplits] = []
+    for i, available in enumerate(unique_available):
+        try:
+            per_limits.append(plan.get_splits(available))
+        except ValueError as e:
+            if errors == "raise":
+                group = limits.index[codes == i][0]
+                raise ValueError(f"Cannot split group {group_column}={group!r}: {e}") from e
+            per_limits.append([])
+
+    # Expand folds of each unique limits-pair to all groups with the same limits.
+    n_folds = np.array([len(splits) for splits in per_limits], dtype=np.int64)
+    counts = n_folds[codes]
+    first = np.cumsum(counts) - counts
+    fold = np.arange(counts.sum(), dtype=np.int64) - np.repeat(first, counts)
+    positions = np.repeat((np.cumsum(n_folds) - n_folds)[codes], counts) + fold
+
+    result = DataFrame({group_column: limits.index.repeat(counts), "fold": fold})
+    bounds = [bounds for splits in per_limits for bounds in splits]
+    for i, name in enumerate(["start", "mid", "end"]):
+        result[name] = DatetimeIndex([b[i] for b in bounds], dtype=time.dtype).take(positions)
+    return result
@@ -0,0 +1,162 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, NamedTuple, Unpack
+
+import numpy as np
+from pandas import DataFrame, DatetimeIndex, Timedelta, read_parquet
+
+from .._backend import DatetimeIndexSplitter, process_available
+from .._backend._cache import _filter_key, settings_snapshot
+from .._docstrings import docs
+from ..types import BalancedRows, DatetimeIndexSplitterKwargs, DatetimeIterable, DatetimeSplitBounds, DatetimeSplits
+
+FORMAT = "time-split-manifest"
+VERSION = 1
+"""Current manifest format version. Manifests with a higher version cannot be read."""
+
+
+class SplitManifest(NamedTuple):
+    """Output of :func:`.write_manifest` and :func:`.read_manifest`."""
+
+    splits: DatetimeSplits
+    """Materialized splits."""
+    config: dict[str, Any]
+    """Arguments used to create the `splits`. For reference only; never used to recompute splits."""
+    settings: dict[str, Any]
+    """Snapshot of the settings which affect split results, taken when the manifest was written."""
+    version: str
+    """Version of ``time_split`` that wrote the manifest."""
+
+    def settings_match(self) -> bool:
+        """Returns ``True`` if the current settings match the :attr:`settings` snapshot."""
+        current: dict[str, Any] = json.loads(json.dumps(settings_snapshot()))
+        return current == self.settings
+
+
+@docs
+def write_manifest(
+    path: str | os.PathLike[str],
+    *,
+    available: DatetimeIterable | None = None,
+    **kwargs: Unpack[DatetimeIndexSplitterKwargs],
+) -> SplitManifest:
+    r"""Compute splits and write them to a versioned manifest file.
+
+    The format is determined by the suffix of `path`; either ``.json`` or ``.parquet``. Bounds are stored as integer
+    nanoseconds (JSON) or as timestamp columns (Parquet), along with the split configuration and a snapshot of relevant
+    :mod:`~time_split.settings`. Use :func:`read_manifest` to load the splits without recomputing them.
+
+    Args:
+        path: Output file.
+        available: {available}
+        **kwargs: See :func:`~time_split.split`.
+
+    {USER_GUIDE}
+
+    Returns:
+        A :class:`.SplitManifest` tuple ``(splits, config, settings, version)``.
+
+    Raises:
+        ValueError: If the suffix of `path` is not supported.
+
+    Examples:
+        Write folds once, then load them in a worker process.
+
+        >>> import tempfile
+        >>> path = tempfile.mkdtemp() + "/folds.json"
+        >>> manifest = write_manifest(
+        ...     path,
+        ...     schedule="1d",
+        ...     before="all",
+        ...     available=("2022-01-01", "2022-01-04"),
+        ... )
+        >>> manifest.config["schedule"], len(manifest.splits)
+        ('1d', 2)
+        >>> print(*read_manifest(path).splits[-1], sep="\n")
+        2022-01-01 00:00:00
+        2022-01-03 00:00:00
+        2022-01-04 00:00:00
+    """
+    path = Path(path)
+    if path.suffix not in {".json", ".parquet"}:
+        raise ValueError(f"Bad {path=}; expected suffix '.json' or '.parquet'.")
+
+    splitter = DatetimeIndexSplitter(**kwargs)
+    plan = splitter.compile()
+    metadata = None if available is None else process_available(available, expand_limits=splitter.expand_limits)
+    splits = plan.make_bounds_list(
+        plan.adapt_schedule(plan.materialize_schedule(available, available_metadata=metadata))
+    )
+
+    from time_split import __version__
+
+    config = {
+        "schedule": splitter.schedule if isinstance(splitter.schedule, str) else _schedule_config(plan.schedule),
+        "before": str(plan.before),
+        "after": str(plan.after),
+        "step": splitter.step,
+        "n_splits": splitter.n_splits,
+        "expand_limits": splitter.expand_limits,
+        "filter": _filter_key(splitter.filter) or (None if splitter.filter is None else repr(splitter.filter)),
+        "available": None if metadata is None else [ts.isoformat() for ts in metadata.limits],
+    }
+    header = dict(format=FORMAT, manifest_version=VERSION, version=__version__, config=config)
+    header = json.loads(json.dumps({**header, "settings": settings_snapshot()}, default=str))
+
+    index = DatetimeIndex([ts for bounds in splits for ts in bounds]).as_unit("ns")
+    if path.suffix == ".json":
+        values = index.tz_convert(None) if index.tz is not None else index
+        splits_data = values.asi8.reshape(-1, 3).tolist()
+        path.write_text(
+            json.dumps({**header, "tz": None if index.tz is None else str(index.tz), "splits": splits_data})
+        )
+    else:
+        df = DataFrame({name: index[i::3] for i, name in enumerate(DatetimeSplitBounds._fields)})
+        df.attrs[FORMAT] = json.dumps(header)
+        df.to_parquet(path, index=False)
+
+    return SplitManifest(splits, header["config"], header["settings"], header["version"])
+
+
+def read_manifest(path: str | os.PathLike[str]) -> SplitManifest:
+    """Read a manifest written by :func:`write_manifest`.
+
+    Args:
+        path: A ``.json`` or ``.parquet`` manifest file.
+
+    Returns:
+        A :class:`.SplitManifest` tuple ``(splits, config, settings, version)``.
+
+    Raises:
+        ValueError: If `path` is not a manifest, or if the manifest version is not supported.
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        df = read_parquet(path)
+        header = json.loads(df.attrs.get(FORMAT, "{}"))
+        columns = [DatetimeIndex(df[name]) for name in DatetimeSplitBounds._fields]
+    else:
+        header = json.loads(path.read_text())
+        values = np.array(header.get("splits", []), dtype=np.int64).reshape(-1, 3)
+        index = DatetimeIndex(values.ravel().astype("datetime64[ns]"))
+        if header.get("tz"):
+            index = index.tz_localize("UTC").tz_convert(header["tz"])
+        columns = [index[i::3] for i in range(3)]
+
+    if header.get("format") != FORMAT:
+        raise ValueError(f"Not a manifest: '{path}'.")
+    if header["manifest_version"] > VERSION:
+        msg = f"Manifest version {header['manifest_version']} is not supported (max {VERSION}). Upgrade time-split."
+        raise ValueError(msg)
+
+    splits = [DatetimeSplitBounds(*bounds) for bounds in zip(*columns, strict=True)]
+    return SplitManifest(splits, header["config"], header["settings"], header["version"])
+
+
+def _schedule_config(schedule: str | Timedelta | DatetimeIndex | BalancedRows) -> Any:
+    if isinstance(schedule, DatetimeIndex):
+        return [ts.isoformat() for ts in schedule]
+    if isinstance(schedule, BalancedRows):
+        return repr(schedule)
+    return str(schedule)
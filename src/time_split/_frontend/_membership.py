@@ -0,0 +1,162 @@
+from collections.abc import Sequence
+from typing import Literal
+
+import numpy as np
+from pandas import DatetimeIndex
+
+from ..types import (
+    DatetimeIterable,
+    DatetimeSplitBounds,
+    DatetimeSplitMembership,
+    DatetimeSplits,
+    SparseFoldMembership,
+)
+
+
+def fold_membership(splits: DatetimeSplits, *, available: DatetimeIterable) -> DatetimeSplitMembership:
+    """Compute row-to-fold membership.
+
+    Rows are assigned to folds in a single pass, using binary search over sorted fold boundaries. Memory usage is
+    proportional to the total number of memberships, rather than ``n_rows * n_folds``.
+
+    Args:
+        splits: List of :attr:`~time_split.types.DatetimeSplitBounds`. Boundaries must be non-decreasing when ordered
+            by `mid`, which is always the case for splits created by :func:`time_split.split`.
+        available: Available data, typically a time column or index. Row order is preserved.
+
+    Returns:
+        A tuple ``(data, future_data)`` of :class:`~time_split.types.SparseFoldMembership` matrices.
+
+    Raises:
+        ValueError: If `splits` boundaries are not monotonic.
+
+    Examples:
+        Find the folds that use each row.
+
+        >>> from time_split import split
+        >>> available = ["2022-01-01", "2022-01-03", "2022-01-06", "2022-01-09"]
+        >>> splits = split(
+        ...     "2d", before="all", after=2, available=available, expand_limits=False
+        ... )
+        >>> membership = fold_membership(splits, available=available)
+        >>> membership.data.to_dense().astype(int)
+        array([[1, 1],
+               [0, 1],
+               [0, 0],
+               [0, 0]])
+        >>> membership.future_data.to_dense().astype(int)
+        array([[0, 0],
+               [1, 0],
+               [1, 1],
+               [0, 0]])
+
+        Rows may belong to several folds, both as `data` and as `future_data`.
+
+    See Also:
+        The :class:`.FoldIndex` class, which may be reused for repeated queries.
+    """
+    return FoldIndex(splits).membership(available)
+
+
+class FoldIndex:
+    """Sorted-endpoint index over folds for fast timestamp-to-fold lookup.
+
+    Each query costs ``O(log n_folds + n_hits)``.
+
+    Args:
+        splits: List of :attr:`~time_split.types.DatetimeSplitBounds`. Boundaries must be non-decreasing when ordered
+            by `mid`, which is always the case for splits created by :func:`time_split.split`.
+
+    Raises:
+        ValueError: If `splits` boundaries are not monotonic.
+
+    Examples:
+        Find the folds that covered a set of timestamps.
+
+        >>> from time_split import split
+        >>> available = ("2022-01-01", "2022-01-07")
+        >>> index = FoldIndex(split("1d", before="2d", after="2d", available=available))
+        >>> timestamps = ["2022-01-04 12:00", "2022-01-05 12:00", "2022-01-10"]
+        >>> result = index.query(timestamps, which="future_data")
+        >>> [result.folds(i).tolist() for i in range(len(timestamps))]
+        [[0, 1], [1, 2], []]
+
+        Fold ids are positions in the original `splits`.
+    """
+
+    def __init__(self, splits: DatetimeSplits) -> None:
+        start = DatetimeIndex([s.start for s in splits])
+        mid = DatetimeIndex([s.mid for s in splits])
+        end = DatetimeIndex([s.end for s in splits])
+
+        # Splits are usually sorted already, but may be reversed (e.g. step < 0).
+        order = np.argsort(mid.asi8, kind="stable").astype(np.int64)
+        start, mid, end = start[order], mid[order], end[order]
+        for name, bounds in ("start", start), ("end", end):
+            if not bounds.is_monotonic_increasing:
+                msg = f"Cannot index folds; fold '{name}' must be non-decreasing when ordered by 'mid'."
+                raise ValueError(msg)
+
+        self._splits = splits
+        self._order = order
+        self._start = start
+        self._mid = mid
+        self._end = end
+
+    @property
+    def splits(self) -> Sequence[DatetimeSplitBounds]:
+        """The indexed splits."""
+        return self._splits
+
+    def __len__(self) -> int:
+        return len(self._splits)
+
+    def query(
+        self,
+        timestamps: DatetimeIterable,
+        *,
+        which: Literal["data", "future_data"],
+    ) -> SparseFoldMembership:
+        """Find folds whose `data` or `future_data` range contains each of the given `timestamps`.
+
+        Args:
+            timestamps: Timestamps to look up. Need not be sorted.
+            which: Range to match; `'data'` for ``[start, mid)`` or `'future_data'` for ``[mid, end)``.
+
+        Returns:
+            A ``(len(timestamps), len(splits))`` :class:`~time_split.types.SparseFoldMembership` matrix.
+
+        Raises:
+            ValueError: For unknown `which`-arguments.
+        """
+        time = timestamps if isinstance(timestamps, DatetimeIndex) else DatetimeIndex(timestamps)
+
+        if which == "data":
+            return self._query(self._start, self._mid, time)
+        if which == "future_data":
+            return self._query(self._mid, self._end, time)
+
+        raise ValueError(f"Bad {which=}; expected one of ('data', 'future_data').")
+
+    def membership(self, available: DatetimeIterable) -> DatetimeSplitMembership:
+        """Compute row-to-fold membership. See :func:`.fold_membership`."""
+        time = available if isinstance(available, DatetimeIndex) else DatetimeIndex(available)
+        return DatetimeSplitMembership(
+            data=self._query(self._start, self._mid, time),
+            future_data=self._query(self._mid, self._end, time),
+        )
+
+    def _query(self, left: DatetimeIndex, right: DatetimeIndex, time: DatetimeIndex) -> SparseFoldMembership:
+        # Folds containing `t` satisfy left <= t < right. Since both are sorted, these form a contiguous range [lo, hi).
+        hi = left.searchsorted(time, side="right").astype(np.int64)
+        lo = right.searchsorted(time, side="right").astype(np.int64)
+        counts = np.maximum(hi - lo, 0)
+
+        indptr = np.zeros(len(time) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        positions = np.arange(indptr[-1], dtype=np.int64) + np.repeat(lo - indptr[:-1], counts)
+        return SparseFoldMembership(indptr, self._order[positions], n_folds=len(self._order))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n_folds={len(self)})"
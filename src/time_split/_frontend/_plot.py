@@ -1,7 +1,7 @@
 import os
 from collections.abc import Sized
 from contextlib import suppress
-from dataclasses import asdict, dataclass, replace
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, Any, Literal
 
 import pandas as pd
@@ -164,7 +164,7 @@ def plot(
         )
 
     # Set title
-    split_kwargs = asdict(splitter)
+    split_kwargs: dict[str, Any] = dict(splitter.as_dict())
     split_kwargs["n_splits"] = n_splits  # We may "incorrectly" set this to None to show excluded folds.
     ax.set_title(_make_title(available, split_kwargs))
 
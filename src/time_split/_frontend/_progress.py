@@ -1,5 +1,6 @@
 import logging
-from collections.abc import Callable, Iterator, MutableMapping, Sequence
+from collections.abc import AsyncIterator, Callable, Iterator, MutableMapping, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from time import perf_counter
 from typing import Any, Generic, overload
@@ -18,6 +19,7 @@ from ..types import (
     MetricsType,
     SplitProgressExtras,
 )
+from ._collector import MetricsCollector
 from ._to_string import _PrettyTimestamp
 
 
@@ -29,6 +31,7 @@ def log_split_progress(
     end_level: int = logging.INFO,
     extra: dict[str, Any] | None = None,
     get_metrics: GetMetrics[MetricsType] | None = None,
+    collector: MetricsCollector | None = None,
 ) -> LogSplitProgress:
     """Log iteration progress.
 
@@ -46,6 +49,8 @@ def log_split_progress(
             the :func:`default formatter <.support.default_metrics_formatter>` will assume that the metrics are
             pre-formatted, simply appending the formatted metrics to the
             :attr:`fold-end message <.settings.log_split_progress.END_MESSAGE>` as-is.
+        collector: A :class:`~time_split.support.MetricsCollector`. If given, bounds, durations and metrics of each
+            finished fold are added to the collector.
 
     Returns:
         A :class:`.LogSplitProgress` object.
@@ -109,6 +114,7 @@ def log_split_progress(
         user_extra={} if extra is None else extra.copy(),  # Not actually immutable; deepcopy can be very expensive.
         get_metrics=get_metrics,
         format_metrics=settings.FORMAT_METRICS or default_metrics_formatter,
+        collector=collector,
     )
 
 
@@ -125,6 +131,7 @@ class _ProgressTracker(LogSplitProgress, Generic[MetricsType]):
     user_extra: dict[str, Any]
     get_metrics: GetMetrics[MetricsType] | None
     format_metrics: FormatMetrics[MetricsType]
+    collector: MetricsCollector | None
 
     @overload
     def __getitem__(self, index: int) -> DatetimeSplitBounds: ...
@@ -139,44 +146,68 @@ class _ProgressTracker(LogSplitProgress, Generic[MetricsType]):
         return len(self.splits)
 
     def __iter__(self) -> Iterator[DatetimeSplitBounds]:
-        for n, split in enumerate(self.splits, start=1):
-            default_extras = SplitProgressExtras[MetricsType](
-                n=n,
-                n_splits=len(self.splits),
-                start=split.start.isoformat(),
-                mid=split.mid.isoformat(),
-                end=split.end.isoformat(),
-            )
-            extra = {**self.user_extra, **default_extras}
-            kwargs: dict[str, Any] = dict(
-                n=n,
-                n_splits=len(self.splits),
-                start=_PrettyTimestamp(split.start),
-                mid=_PrettyTimestamp(split.mid),
-                end=_PrettyTimestamp(split.end),
-                **self.user_extra,
-            )
-            kwargs.update(fold=self.fold_format.format(**kwargs))
-
-            self.logger.log(self.start_level, self.start_message.format(**kwargs), extra=extra)
-
-            # Yield split and count user time.
-            start = perf_counter()
-            yield split
-            seconds = round(perf_counter() - start, 6)
-
-            kwargs.update(
-                seconds=seconds,
-                formatted_seconds=self.seconds_formatter(seconds),
-            )
-            msg = self.end_message.format(**kwargs)
-
-            if self.get_metrics is not None:
-                extra["metrics"] = self.get_metrics(split.mid)
-                msg = self.format_metrics(msg, extra["metrics"])
-
-            extra.update(seconds=seconds)
-            self.logger.log(self.end_level, msg, extra=extra)
+        for index, split in enumerate(self.splits):
+            with self.track(index):
+                yield split
+
+    async def __aiter__(self) -> AsyncIterator[DatetimeSplitBounds]:
+        for index, split in enumerate(self.splits):
+            with self.track(index):
+                yield split
+
+    @contextmanager
+    def track(self, index: int, *, extra: dict[str, Any] | None = None) -> Iterator[DatetimeSplitBounds]:
+        n = range(len(self.splits))[index] + 1
+        split = self.splits[index]
+        fold_extra = {**self.user_extra, **extra} if extra else self.user_extra
+
+        default_extras = SplitProgressExtras[MetricsType](
+            n=n,
+            n_splits=len(self.splits),
+            start=split.start.isoformat(),
+            mid=split.mid.isoformat(),
+            end=split.end.isoformat(),
+        )
+        extra = {**fold_extra, **default_extras}
+        kwargs: dict[str, Any] = dict(
+            n=n,
+            n_splits=len(self.splits),
+            start=_PrettyTimestamp(split.start),
+            mid=_PrettyTimestamp(split.mid),
+            end=_PrettyTimestamp(split.end),
+            **fold_extra,
+        )
+        kwargs.update(fold=self.fold_format.format(**kwargs))
+
+        self.logger.log(self.start_level, self.start_message.format(**kwargs), extra=extra)
+
+        # Count user time.
+        start = perf_counter()
+        yield split
+        seconds = round(perf_counter() - start, 6)
+
+        self._log_end(split, seconds, kwargs=kwargs, extra=extra)
+
+    def _log_end(
+        self, split: DatetimeSplitBounds, seconds: float, *, kwargs: dict[str, Any], extra: dict[str, Any]
+    ) -> None:
+        kwargs.update(
+            seconds=seconds,
+            formatted_seconds=self.seconds_formatter(seconds),
+        )
+        msg = self.end_message.format(**kwargs)
+
+        if self.get_metrics is not None:
+            extra["metrics"] = self.get_metrics(split.mid)
+            msg = self.format_metrics(msg, extra["metrics"])
+
+        extra.update(seconds=seconds)
+        self.logger.log(self.end_level, msg, extra=extra)
+
+        if self.collector is not None:
+            self.collector.add(split, kwargs["n"], extra)
+            if kwargs["n"] == kwargs["n_splits"]:
+                self.collector.flush()
 
 
 def default_metrics_formatter(end_message: str, metrics: dict[Any, Any] | pd.Series | pd.DataFrame | str | Any) -> str:
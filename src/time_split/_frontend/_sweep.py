@@ -0,0 +1,105 @@
+from collections.abc import Hashable, Iterable, Mapping
+from itertools import product
+from typing import Any, Literal
+
+from pandas import DataFrame, DatetimeIndex
+
+from .._backend import DatetimeIndexSplitter, process_available
+from .._docstrings import docs
+from ..types import DatetimeIterable, DatetimeSplits, ExpandLimits, Schedule
+
+SWEEP_PARAMETERS = ("before", "after", "step", "n_splits", "filter")
+
+
+@docs
+def split_sweep(
+    schedule: Schedule,
+    grid: Mapping[str, Iterable[Any]],
+    *,
+    available: DatetimeIterable | None = None,
+    expand_limits: ExpandLimits = "auto",
+    errors: Literal["raise", "ignore"] = "raise",
+) -> DataFrame:
+    """Create splits for every combination in a parameter `grid`.
+
+    The `schedule` is materialized only once. Bounds are computed once per unique ``(before, after)``-pair, and then
+    filtered for each combination of the remaining parameters.
+
+    Args:
+        schedule: {schedule}
+        grid: A dict ``{{parameter: values}}``. Valid parameters are `before`, `after`, `step`, `n_splits` and `filter`.
+            Parameters not in the grid use the same defaults as :func:`~time_split.split`.
+        available: {available} Passing a tuple ``(min, max)`` is enough, unless a `schedule` is a
+            :class:`~time_split.types.BalancedRows` instance.
+        expand_limits: {expand_limits}
+        errors: If `'ignore'`, combinations without valid splits are excluded from the output.
+
+    {USER_GUIDE}
+
+    Returns:
+        A long-format ``DataFrame`` with one column for each `grid` parameter, followed by ``['fold', 'start', 'mid',
+        'end']``. Folds are numbered within each combination, starting from zero.
+
+    Raises:
+        ValueError: For unknown `grid` parameters.
+        ValueError: If a combination has no valid splits and ``errors='raise'``.
+
+    Examples:
+        Compare `before` and `n_splits` choices.
+
+        >>> grid = dict(before=["2d", "all"], n_splits=[1, 2])
+        >>> available = ("2022-01-01", "2022-01-05")
+        >>> split_sweep("1d", grid, available=available).head(6)
+          before  n_splits  fold      start        mid        end
+        0     2d         1     0 2022-01-02 2022-01-04 2022-01-05
+        1     2d         2     0 2022-01-01 2022-01-03 2022-01-04
+        2     2d         2     1 2022-01-02 2022-01-04 2022-01-05
+        3    all         1     0 2022-01-01 2022-01-04 2022-01-05
+        4    all         2     0 2022-01-01 2022-01-03 2022-01-04
+        5    all         2     1 2022-01-01 2022-01-04 2022-01-05
+    """
+    if unknown := set(grid).difference(SWEEP_PARAMETERS):
+        raise ValueError(f"Unknown grid parameters: {sorted(unknown)}; valid parameters are {SWEEP_PARAMETERS}.")
+    if errors not in {"raise", "ignore"}:
+        raise ValueError(f"Bad {errors=}; expected one of ('raise', 'ignore').")
+
+    keys = list(grid)
+    values = [list(grid[key]) for key in keys]
+
+    base = DatetimeIndexSplitter(schedule, expand_limits=expand_limits).compile()
+    metadata = None if available is None else process_available(available, expand_limits=expand_limits)
+    ms = base.materialize_schedule(available, available_metadata=metadata)
+
+    params: dict[Hashable, list[Any]] = {key: [] for key in keys}
+    folds: list[int] = []
+    bounds: DatetimeSplits = []
+
+    unfiltered: dict[tuple[Any, Any], DatetimeSplits | ValueError] = {}
+    for combination in product(*values):
+        kwargs = dict(zip(keys, combination, strict=True))
+        plan = DatetimeIndexSplitter(base.schedule, expand_limits=expand_limits, **kwargs).compile()
+
+        spans = plan.before, plan.after
+        if spans not in unfiltered:
+            try:
+                unfiltered[spans] = plan.compute_bounds(plan.adapt_schedule(ms))
+            except ValueError as e:
+                unfiltered[spans] = e
+
+        splits = unfiltered[spans]
+        if isinstance(splits, ValueError):
+            if errors == "raise":
+                raise ValueError(f"Cannot split combination {kwargs}: {splits}") from splits
+            continue
+
+        splits = plan.apply_filters(splits)
+        for key, value in kwargs.items():
+            params[key].extend([value] * len(splits))
+        folds.extend(range(len(splits)))
+        bounds.extend(splits)
+
+    result = DataFrame(params)
+    result["fold"] = folds
+    for i, name in enumerate(["start", "mid", "end"]):
+        result[name] = DatetimeIndex([b[i] for b in bounds])
+    return result
@@ -0,0 +1,31 @@
+"""Type aliases which depend on numpy or pandas.
+
+Documented and re-exported by :mod:`time_split.types`, which imports this module on first access.
+"""
+
+import datetime as _dt
+import typing as _t
+from collections import abc as _abc
+
+import numpy as _np
+import pandas as _pd
+
+from .types import BalancedRows, MetricsType
+
+__all__ = [
+    "DatetimeIterable",
+    "DatetimeTypes",
+    "Filter",
+    "GetMetrics",
+    "Schedule",
+    "Span",
+    "TimedeltaTypes",
+]
+
+DatetimeTypes: _t.TypeAlias = str | _pd.Timestamp | _dt.datetime | _dt.date | _np.datetime64
+DatetimeIterable = _abc.Iterable[DatetimeTypes]
+TimedeltaTypes: _t.TypeAlias = str | _pd.Timedelta | _dt.timedelta | _np.timedelta64
+Schedule: _t.TypeAlias = _pd.DatetimeIndex | DatetimeIterable | TimedeltaTypes | BalancedRows
+Span = int | _t.Literal["all", "empty"] | TimedeltaTypes
+Filter = _t.Callable[[_pd.Timestamp, _pd.Timestamp, _pd.Timestamp], bool]
+GetMetrics = _t.Callable[[_pd.Timestamp], MetricsType]
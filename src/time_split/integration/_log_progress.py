@@ -1,16 +1,15 @@
 import logging
-from collections.abc import Iterable
 from typing import Any
 
 from .. import log_split_progress
-from ..types import DatetimeSplitBounds, DatetimeSplits, LogSplitProgressKwargs, MetricsType
+from ..types import DatetimeSplits, LogSplitProgress, LogSplitProgressKwargs, MetricsType
 
 LogProgressArg = str | bool | logging.Logger | logging.LoggerAdapter[Any] | LogSplitProgressKwargs[MetricsType]
 
 
 def handle_log_progress_arg(
     log_progress: LogProgressArg[MetricsType], *, splits: DatetimeSplits
-) -> Iterable[DatetimeSplitBounds] | None:
+) -> LogSplitProgress | None:
     """Wrapper function for integrations."""
     if log_progress is True:
         return log_split_progress(splits)
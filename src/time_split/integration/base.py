@@ -3,12 +3,22 @@
 Users may implement splitting of any data type by implementing suitable ``as_available`` and ``select`` functions.
 """
 
+import asyncio as _asyncio
+import inspect as _inspect
+import sys as _sys
 import typing as _t
+import weakref as _weakref
+from collections import OrderedDict as _OrderedDict
+from collections import deque as _deque
 from datetime import datetime as _datetime
+from time import perf_counter as _perf_counter
 
 from .. import _frontend
 from .. import types as _tst
+from .._backend import DatetimeIndexLike as _DatetimeIndexLike
+from .._backend._timing import stage as _stage
 from .._docstrings import docs as _docs
+from .._support import handle_dask as _handle_dask
 from . import _log_progress
 
 if _t.TYPE_CHECKING:
@@ -16,11 +26,26 @@ if _t.TYPE_CHECKING:
 
 DataT = _t.TypeVar("DataT")
 """Type of data to split."""
+_T = _t.TypeVar("_T")
 
 DataAsAvailableFn = _t.Callable[[DataT], _tst.DatetimeIterable]
 """A callable ``(data: DataT) -> DatetimeIterable``."""
 DataSelectFn = _t.Callable[[DataT, _datetime, _datetime], DataT]
 """A callable ``(data: DataT, left_inclusive: datetime, end_exclusive: datetime) -> DataT)``."""
+DataSelectManyFn = _t.Callable[[DataT, list[tuple[_datetime, _datetime]]], _t.Iterable[DataT]]
+"""A callable ``(data: DataT, ranges: list[(left_inclusive, end_exclusive)]) -> Iterable[DataT]``.
+
+Must yield exactly one item per range, in the same order as `ranges`.
+"""
+DataCountFn = _t.Callable[[DataT], int]
+"""A callable ``(data: DataT) -> int`` which returns the number of rows in `data`."""
+DataConcatFn = _t.Callable[[list[DataT]], DataT]
+"""A callable ``(batches: list[DataT]) -> DataT``."""
+AsyncDataAsAvailableFn = _t.Callable[[DataT], _t.Awaitable[_tst.DatetimeIterable] | _tst.DatetimeIterable]
+"""An async callable ``(data: DataT) -> DatetimeIterable``. Regular callables are also accepted."""
+AsyncDataSelectFn = _t.Callable[[DataT, _datetime, _datetime], _t.Awaitable[DataT] | DataT]
+"""An async callable ``(data: DataT, left_inclusive: datetime, end_exclusive: datetime) -> DataT)``. Regular callables
+are also accepted."""
 
 
 class DatetimeSplit(_t.NamedTuple, _t.Generic[DataT]):
@@ -52,17 +77,28 @@ def split_data(
     log_progress: _log_progress.LogProgressArg[_tst.MetricsType] = False,
     as_available: DataAsAvailableFn[DataT],
     select: DataSelectFn[DataT],
+    select_many: DataSelectManyFn[DataT] | None = None,
+    count: DataCountFn[DataT] | None = None,
+    cache: "SelectCache | None" = None,
     **kwargs: _t.Unpack[_tst.DatetimeIndexSplitterKwargs],
 ) -> _t.Iterable[DatetimeSplit[DataT]]:
     """Base implementation for splitting integrated `data` types.
 
-    The required ``as_available`` and ``select`` callables provided perform the actual integration.
+    The required ``as_available`` and ``select`` callables provided perform the actual integration. Integrations may
+    also provide a ``select_many`` callable, which selects the ranges of all folds in a single pass over the `data`.
 
     Args:
         data: The data to split.
         log_progress: {log_progress}
         as_available: A callable ``(data: DataT) -> DatetimeIterable``.
         select: A callable ``(data: DataT, left_inclusive: datetime, end_exclusive: datetime) -> DataT)``.
+        select_many: A callable ``(data: DataT, ranges: list[(left_inclusive, end_exclusive)]) -> Iterable[DataT]``.
+            Ranges are given as ``[(start, mid), (mid, end), ...]`` for each fold, in order. The returned iterable
+            is consumed lazily, two items per fold. Used instead of `select` unless a `cache` is given.
+        count: A callable ``(data: DataT) -> int``. If given, row counts of selected data are added to the progress
+            extras (see :class:`~time_split.types.SplitProgressExtras`). Must be cheap; lazy types should not be
+            counted.
+        cache: {cache}
         **kwargs: Keyword arguments for :func:`.split`-function.
 
     Yields:
@@ -74,14 +110,419 @@ def split_data(
         the linked function.
 
     """
-    available = as_available(data)
+    with _stage("as_available"):
+        available = as_available(data)
     splits = _frontend.split(**kwargs, available=available)
 
-    tracked_splits = _log_progress.handle_log_progress_arg(log_progress, splits=splits)
+    if cache is not None:
+        select = cache.wrap(select)
+
+    tracker = _log_progress.handle_log_progress_arg(log_progress, splits=splits)
+
+    if select_many is not None and cache is None:
+        ranges = [r for bounds in splits for r in ((bounds.start, bounds.mid), (bounds.mid, bounds.end))]
+        selected = iter(select_many(data, ranges))
+
+        def select_fold(bounds: _tst.DatetimeSplitBounds) -> DatetimeSplit[DataT]:
+            return DatetimeSplit(next(selected), future_data=next(selected), bounds=bounds)
+    else:
+
+        def select_fold(bounds: _tst.DatetimeSplitBounds) -> DatetimeSplit[DataT]:
+            return DatetimeSplit(
+                select(data, bounds.start, bounds.mid),
+                future_data=select(data, bounds.mid, bounds.end),
+                bounds=bounds,
+            )
+
+    for index, bounds in enumerate(splits):
+        start = _perf_counter()
+        with _stage("select_fold"):
+            split = select_fold(bounds)
+
+        if tracker is None:
+            yield split
+            continue
+
+        # Selection is done before the fold is tracked, so that the user time does not include it.
+        extra: dict[str, _t.Any] = {"select_seconds": round(_perf_counter() - start, 6)}
+        if count is not None:
+            extra.update(data_rows=count(split.data), future_data_rows=count(split.future_data))
+        with tracker.track(index, extra=extra):
+            yield split
+
+
+@_docs
+async def split_data_async(
+    data: DataT,
+    *,
+    log_progress: _log_progress.LogProgressArg[_tst.MetricsType] = False,
+    as_available: AsyncDataAsAvailableFn[DataT],
+    select: AsyncDataSelectFn[DataT],
+    prefetch: int = 1,
+    **kwargs: _t.Unpack[_tst.DatetimeIndexSplitterKwargs],
+) -> _t.AsyncGenerator[DatetimeSplit[DataT], None]:
+    """Asynchronous version of :func:`split_data`.
+
+    Fold data is fetched concurrently with the processing of earlier folds. Folds are always yielded in order. Pending
+    fetches are cancelled when the generator is closed, e.g. using :func:`contextlib.aclosing`.
+
+    Args:
+        data: The data to split.
+        log_progress: {log_progress} User time excludes the time spent waiting for fold data.
+        as_available: An async callable ``(data: DataT) -> DatetimeIterable``.
+        select: An async callable ``(data: DataT, left_inclusive: datetime, end_exclusive: datetime) -> DataT)``.
+            The `data` and `future_data` of a fold are selected concurrently.
+        prefetch: Number of folds to fetch while the caller is processing the current fold. Pass zero to disable.
+        **kwargs: Keyword arguments for :func:`.split`-function.
+
+    Yields:
+        Tuples ``(data, future_data, bounds)``.
+
+    Raises:
+        ValueError: If `prefetch` is negative.
+
+    Examples:
+        Splitting data behind an async client.
+
+        >>> import asyncio
+        >>> import pandas as pd
+        >>> async def fetch_range(client, left, right):
+        ...     await asyncio.sleep(0)  # e.g. await client.fetch(left, right)
+        ...     return pd.date_range(left, right, freq="h", inclusive="left")
+        >>> async def main():
+        ...     async for fold in split_data_async(
+        ...         "my-client",
+        ...         schedule="1d",
+        ...         as_available=lambda client: ("2022-01-01", "2022-01-10"),
+        ...         select=fetch_range,
+        ...         prefetch=2,
+        ...     ):
+        ...         print(fold.bounds.mid.date(), len(fold.data), len(fold.future_data))
+        >>> asyncio.run(main())
+        2022-01-08 168 24
+        2022-01-09 168 24
 
-    for bounds in splits if tracked_splits is None else tracked_splits:
-        yield DatetimeSplit(
-            select(data, bounds.start, bounds.mid),
-            future_data=select(data, bounds.mid, bounds.end),
-            bounds=bounds,
+    """
+    if prefetch < 0:
+        raise ValueError(f"Bad {prefetch=}; must be a non-negative integer.")
+
+    available = await _maybe_await(as_available(data))
+    all_splits = _frontend.split(**kwargs, available=available)
+    tracker = _log_progress.handle_log_progress_arg(log_progress, splits=all_splits)
+    splits = iter(all_splits)
+
+    async def fetch(bounds: _tst.DatetimeSplitBounds) -> DatetimeSplit[DataT]:
+        data_part, future_data_part = await _asyncio.gather(
+            _maybe_await(select(data, bounds.start, bounds.mid)),
+            _maybe_await(select(data, bounds.mid, bounds.end)),
         )
+        return DatetimeSplit(data_part, future_data=future_data_part, bounds=bounds)
+
+    tasks: _deque[_asyncio.Task[DatetimeSplit[DataT]]] = _deque()
+    index = 0
+
+    def fill(n: int) -> None:
+        while len(tasks) < n and (bounds := next(splits, None)) is not None:
+            tasks.append(_asyncio.ensure_future(fetch(bounds)))
+
+    try:
+        while True:
+            fill(max(prefetch, 1))
+            if not tasks:
+                return
+
+            split = await tasks.popleft()
+            fill(prefetch)  # Fetch upcoming folds while the caller processes this one.
+            if tracker is None:
+                yield split
+            else:
+                with tracker.track(index):
+                    yield split
+            index += 1
+    finally:
+        for task in tasks:
+            task.cancel()
+        await _asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _maybe_await(value: _t.Awaitable[_T] | _T) -> _T:
+    return await value if _inspect.isawaitable(value) else value
+
+
+@_docs
+def split_stream(
+    batches: _t.Iterable[DataT],
+    *,
+    available: _tst.DatetimeIterable | None = None,
+    as_available: DataAsAvailableFn[DataT],
+    select: DataSelectFn[DataT],
+    concat: DataConcatFn[DataT],
+    emit_partial: bool = False,
+    **kwargs: _t.Unpack[_tst.DatetimeIndexSplitterKwargs],
+) -> _t.Iterator[DatetimeSplit[DataT]]:
+    """Base implementation for splitting a stream of timestamped `batches`.
+
+    Folds are emitted as soon as the watermark (the latest timestamp seen so far) reaches their `end` bound. Batches
+    are evicted once no pending fold can use them, so only the batches needed by open folds are kept in memory.
+
+    All splits are computed up front, before the first batch is consumed. The range of the schedule must therefore be
+    known in advance: cron and timedelta schedules require the expected range of the stream as `available`, and
+    bookkeeping grows with the total number of folds. Batches beyond the last fold `end` are never consumed.
+
+    Batches should arrive in approximately chronological order. Rows that arrive after a fold has been emitted are
+    not included in that fold.
+
+    Args:
+        batches: An iterable of timestamped batches. May be infinite, but only batches up to the last fold `end`
+            (as given by `schedule` and `available`) are consumed.
+        available: Expected range of the stream, e.g. a tuple ``(min, max)``. Binds `schedule` to a range. Required
+            unless the schedule is explicit.
+        as_available: A callable ``(batch: DataT) -> DatetimeIterable``.
+        select: A callable ``(data: DataT, left_inclusive: datetime, end_exclusive: datetime) -> DataT)``.
+        concat: A callable ``(batches: list[DataT]) -> DataT``.
+        emit_partial: If ``True``, folds whose `end` has not been reached are emitted when `batches` is exhausted.
+            Discarded by default, since their `future_data` may be incomplete.
+        **kwargs: Keyword arguments for :func:`.split`-function.
+
+    Yields:
+        Tuples ``(data, future_data, bounds)``, ordered by `bounds.end`.
+
+    Examples:
+        Splitting a stream of lists.
+
+        >>> import pandas as pd
+        >>> def batches():
+        ...     for day in pd.date_range("2022-01-01", "2022-01-05"):
+        ...         print("batch", day.date())
+        ...         yield [day, day + pd.Timedelta(hours=12)]
+        >>> for fold in split_stream(
+        ...     batches(),
+        ...     schedule="1d",
+        ...     before="2d",
+        ...     available=("2022-01-01", "2022-01-06"),
+        ...     as_available=lambda batch: batch,
+        ...     select=lambda data, left, right: [t for t in data if left <= t < right],
+        ...     concat=lambda batches: [t for batch in batches for t in batch],
+        ... ):
+        ...     print("  fold:", len(fold.data), len(fold.future_data))
+        batch 2022-01-01
+        batch 2022-01-02
+        batch 2022-01-03
+        batch 2022-01-04
+          fold: 4 2
+        batch 2022-01-05
+          fold: 4 2
+
+        Each fold is emitted as soon as a batch at or beyond the fold `end` arrives.
+    """
+    import pandas as pd
+
+    splits = _frontend.split(**kwargs, available=available)
+    pending = sorted(splits, key=lambda bounds: bounds.end)
+
+    # Earliest start among the folds pending[i:]; batches ending before this are no longer needed.
+    min_start = [bounds.start for bounds in pending]
+    for i in reversed(range(len(min_start) - 1)):
+        min_start[i] = min(min_start[i], min_start[i + 1])
+
+    buffer: list[tuple[DataT, _t.Any, _t.Any]] = []  # (batch, batch_min, batch_max)
+    watermark = None
+    i = 0
+
+    def emit(bounds: _tst.DatetimeSplitBounds) -> DatetimeSplit[DataT]:
+        start, mid, end = bounds
+        relevant = [batch for batch, lo, hi in buffer if lo < end and hi >= start]
+        data = concat(relevant or [buffer[-1][0]])
+        return DatetimeSplit(select(data, start, mid), future_data=select(data, mid, end), bounds=bounds)
+
+    for batch in batches:
+        time = as_available(batch)
+        if not isinstance(time, _DatetimeIndexLike):
+            time = pd.DatetimeIndex(time)
+        lo, hi = _handle_dask(time.min()), _handle_dask(time.max())
+        if pd.isna(lo):
+            continue  # Empty batch.
+
+        lo, hi = pd.Timestamp(lo), pd.Timestamp(hi)
+        buffer.append((batch, lo, hi))
+        watermark = hi if watermark is None else max(watermark, hi)
+
+        while i < len(pending) and pending[i].end <= watermark:
+            yield emit(pending[i])
+            i += 1
+
+        if i == len(pending):
+            return  # Don't consume more batches than needed.
+        buffer = [entry for entry in buffer if entry[2] >= min_start[i]]
+
+    if emit_partial and buffer:
+        for bounds in pending[i:]:
+            yield emit(bounds)
+
+
+class SelectCacheInfo(_t.NamedTuple):
+    """Statistics of a :class:`SelectCache`."""
+
+    hits: int
+    """Number of ``select``-calls that returned a cached result."""
+    misses: int
+    """Number of ``select``-calls that were forwarded to the underlying ``select``-function."""
+    entries: int
+    """Number of cached results."""
+    current_bytes: int
+    """Estimated total size of all cached results."""
+    max_bytes: int
+    """Memory budget of the cache."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of calls that were cache hits. Returns zero if the cache hasn't been used."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SelectCache:
+    """Memoize ``select(data, left, right)`` results under a memory budget.
+
+    Useful when the same data is split many times, e.g. during hyperparameter search. Results are keyed by the
+    ``select``-function, the identity of the `data`, and the bounds. Least recently used results are evicted first.
+
+    Results are not copied. Users must not modify the fold data in place.
+
+    Args:
+        max_bytes: Memory budget. Results larger than this are never cached.
+        sizeof: A callable ``(result) -> int`` used to estimate result sizes. The default supports ``pandas``,
+            ``polars``, and ``numpy`` types, falling back to :func:`sys.getsizeof`.
+
+    Examples:
+        Reusing selections across hyperparameter search trials.
+
+        >>> import pandas as pd
+        >>> from time_split.integration.pandas import split_pandas
+        >>> df = pd.DataFrame({"time": pd.date_range("2022", "2022-01-10", freq="h")})
+        >>> cache = SelectCache(max_bytes=2**20)
+        >>> for trial in range(10):
+        ...     for fold in split_pandas(df, "time", schedule="1d", cache=cache):
+        ...         pass  # Evaluate a model
+        >>> cache.info().hit_rate
+        0.9
+
+    """
+
+    def __init__(self, max_bytes: int, *, sizeof: _t.Callable[[_t.Any], int] | None = None) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"Bad {max_bytes=}; must be positive.")
+
+        self._max_bytes = max_bytes
+        self._sizeof = _estimate_bytes if sizeof is None else sizeof
+        self._entries: _OrderedDict[_t.Hashable, tuple[_t.Any, int]] = _OrderedDict()
+        self._refs: dict[int, _weakref.ref[_t.Any]] = {}
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def current_bytes(self) -> int:
+        """Estimated total size of all cached results."""
+        return self._current_bytes
+
+    @property
+    def max_bytes(self) -> int:
+        """Memory budget of the cache."""
+        return self._max_bytes
+
+    def info(self) -> SelectCacheInfo:
+        """Get cache statistics."""
+        return SelectCacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            entries=len(self._entries),
+            current_bytes=self._current_bytes,
+            max_bytes=self._max_bytes,
+        )
+
+    def clear(self) -> None:
+        """Remove all cached results and reset statistics."""
+        self._entries.clear()
+        self._refs.clear()
+        self._current_bytes = self._hits = self._misses = 0
+
+    def wrap(self, select: DataSelectFn[DataT]) -> DataSelectFn[DataT]:
+        """Create a caching version of `select`.
+
+        Bound methods are keyed by their instance and function, so instances should implement ``__eq__`` and
+        ``__hash__`` to share results across calls.
+
+        Args:
+            select: A callable ``(data: DataT, left_inclusive: datetime, end_exclusive: datetime) -> DataT)``.
+
+        Returns:
+            A wrapped ``select``-function.
+        """
+        # Bound methods are recreated on every attribute access, so they can't be used as keys directly.
+        bound_to = getattr(select, "__self__", None)
+        select_key = select if bound_to is None else (bound_to, getattr(select, "__func__", select.__name__))
+
+        def cached_select(data: DataT, left: _datetime, right: _datetime) -> DataT:
+            if not self._track(data):
+                self._misses += 1
+                return select(data, left, right)  # Identity can't be verified; don't cache.
+
+            key = (select_key, id(data), left, right)
+            if (entry := self._entries.get(key)) is not None:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return entry[0]  # type: ignore[no-any-return]
+
+            self._misses += 1
+            result = select(data, left, right)
+            self._put(key, result)
+            return result
+
+        return cached_select
+
+    def _track(self, data: _t.Any) -> bool:
+        data_id = id(data)
+        ref = self._refs.get(data_id)
+        if ref is not None and ref() is data:
+            return True
+
+        self._forget(data_id)  # Stale id; the original data has been garbage collected.
+        try:
+            self._refs[data_id] = _weakref.ref(data, lambda _: self._forget(data_id))
+        except TypeError:
+            return False
+        return True
+
+    def _forget(self, data_id: int) -> None:
+        self._refs.pop(data_id, None)
+        for key in [key for key in self._entries if key[1] == data_id]:  # type: ignore[index]
+            _, size = self._entries.pop(key)
+            self._current_bytes -= size
+
+    def _put(self, key: _t.Hashable, result: _t.Any) -> None:
+        size = int(self._sizeof(result))
+        if size > self._max_bytes:
+            return
+
+        while self._entries and self._current_bytes + size > self._max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._current_bytes -= evicted_size
+
+        self._entries[key] = (result, size)
+        self._current_bytes += size
+
+    def __repr__(self) -> str:
+        hits, misses, entries, current_bytes, max_bytes = self.info()
+        return f"{type(self).__name__}({hits=}, {misses=}, {entries=}, {current_bytes=}, {max_bytes=})"
+
+
+def _estimate_bytes(obj: _t.Any) -> int:
+    if hasattr(obj, "estimated_size"):  # Polars
+        return int(obj.estimated_size())
+    if hasattr(obj, "memory_usage"):  # Pandas
+        usage = obj.memory_usage(index=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if hasattr(obj, "nbytes"):  # Numpy, pyarrow
+        return int(obj.nbytes)
+    return _sys.getsizeof(obj)
@@ -0,0 +1,9 @@
+"""Integration with the DuckDB library.
+
+Folds are lazy relations; nothing is executed until results are requested. Time predicates are pushed down into the
+underlying scans (e.g. of Parquet files) by DuckDB, so data larger than memory may be split.
+"""
+
+from ._impl import split_duckdb
+
+__all__ = ["split_duckdb"]
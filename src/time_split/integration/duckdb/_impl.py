@@ -0,0 +1,89 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Unpack
+
+from duckdb import ColumnExpression, ConstantExpression, DuckDBPyRelation, FunctionExpression
+from pandas import Timestamp
+
+from ..._docstrings import docs
+from ...types import DatetimeIndexSplitterKwargs, MetricsType
+from .._log_progress import LogProgressArg
+from ..base import DatetimeSplit, split_data
+
+
+@docs
+def split_duckdb(
+    data: DuckDBPyRelation,
+    time_column: str,
+    *,
+    log_progress: LogProgressArg[MetricsType] = False,
+    **kwargs: Unpack[DatetimeIndexSplitterKwargs],
+) -> Iterable[DatetimeSplit[DuckDBPyRelation]]:
+    """Split a DuckDB relation.
+
+    Limits are computed using a single aggregate query. Timestamps are never fetched. The `data` and `future_data` of
+    each fold are lazy, filtered relations of `data`.
+
+    Args:
+        data: A ``duckdb.DuckDBPyRelation``, e.g. from ``duckdb.read_parquet(path)``.
+        time_column: A column to split on.
+        log_progress: {log_progress}
+        **kwargs: {DatetimeIndexSplitterKwargs}
+
+    {USER_GUIDE}
+
+    Yields:
+        Tuples ``(data, future_data, bounds)``.
+
+    Raises:
+        ValueError: If `time_column` has no timestamps.
+
+    Examples:
+        Splitting a relation.
+
+        >>> # xdoctest: +REQUIRES(module:duckdb)
+        >>> import duckdb
+        >>> relation = duckdb.sql(
+        ...     "SELECT range AS time, 1 AS x FROM range("
+        ...     "  TIMESTAMP '2022-01-01', TIMESTAMP '2022-01-10', INTERVAL 1 HOUR"
+        ...     ")"
+        ... )
+        >>> for fold in split_duckdb(
+        ...     relation, "time", schedule="1d", before="2d", n_splits=2
+        ... ):
+        ...     print(
+        ...         fold.data.count("*").fetchone(), fold.future_data.count("*").fetchone()
+        ...     )
+        (48,) (24,)
+        (48,) (24,)
+    """
+    indexer = _Indexer(time_column)
+
+    yield from split_data(
+        data,
+        log_progress=log_progress,
+        as_available=indexer.as_available,
+        select=indexer.select,
+        **kwargs,
+    )
+
+
+@dataclass(frozen=True)
+class _Indexer:
+    time_column: str
+
+    def as_available(self, data: DuckDBPyRelation) -> tuple[Timestamp, Timestamp]:
+        time = ColumnExpression(self.time_column)
+        row = data.aggregate([FunctionExpression("min", time), FunctionExpression("max", time)]).fetchone()
+
+        if row is None or row[0] is None:
+            raise ValueError(f"No timestamps found in {self.time_column=}.")
+        return Timestamp(row[0]), Timestamp(row[1])
+
+    def select(self, data: DuckDBPyRelation, left: datetime, right: datetime) -> DuckDBPyRelation:
+        """Select data based on the given bounds."""
+        time = ColumnExpression(self.time_column)
+        lower = time >= ConstantExpression(Timestamp(left).to_pydatetime())
+        upper = time < ConstantExpression(Timestamp(right).to_pydatetime())
+        return data.filter(lower & upper)
@@ -0,0 +1,9 @@
+"""Integration with the Ibis library.
+
+Folds are lazy table expressions, which work with any Ibis backend. Only the limits of the time column are computed
+eagerly; fold data is not executed until requested by the caller.
+"""
+
+from ._impl import split_ibis
+
+__all__ = ["split_ibis"]
@@ -0,0 +1,84 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Unpack
+
+from pandas import Timestamp, isna
+
+from ..._docstrings import docs
+from ...types import DatetimeIndexSplitterKwargs, MetricsType
+from .._log_progress import LogProgressArg
+from ..base import DatetimeSplit, split_data
+
+if TYPE_CHECKING:
+    import ibis  # type: ignore[import-untyped]
+
+
+@docs
+def split_ibis(
+    data: "ibis.Table",
+    time_column: str,
+    *,
+    log_progress: LogProgressArg[MetricsType] = False,
+    **kwargs: Unpack[DatetimeIndexSplitterKwargs],
+) -> Iterable[DatetimeSplit["ibis.Table"]]:
+    """Split an Ibis table expression.
+
+    Limits are computed using a single aggregate query. Timestamps are never fetched. The `data` and `future_data` of
+    each fold are lazy, filtered expressions of `data`, which are executed by the backend of `data` when requested.
+
+    Args:
+        data: An ``ibis.Table``.
+        time_column: A column to split on.
+        log_progress: {log_progress}
+        **kwargs: {DatetimeIndexSplitterKwargs}
+
+    {USER_GUIDE}
+
+    Yields:
+        Tuples ``(data, future_data, bounds)``.
+
+    Raises:
+        ValueError: If `time_column` has no timestamps.
+
+    Examples:
+        Splitting an in-memory table.
+
+        >>> # xdoctest: +REQUIRES(module:ibis)
+        >>> import ibis
+        >>> import pandas as pd
+        >>> time = pd.date_range("2022-01-01", "2022-01-10", freq="h", inclusive="left")
+        >>> table = ibis.memtable(pd.DataFrame(dict(time=time, x=1)))
+        >>> for fold in split_ibis(table, "time", schedule="1d", before="2d", n_splits=2):
+        ...     print(fold.data.count().execute(), fold.future_data.count().execute())
+        48 24
+        48 24
+    """
+    indexer = _Indexer(time_column)
+
+    yield from split_data(
+        data,
+        log_progress=log_progress,
+        as_available=indexer.as_available,
+        select=indexer.select,
+        **kwargs,
+    )
+
+
+@dataclass(frozen=True)
+class _Indexer:
+    time_column: str
+
+    def as_available(self, data: "ibis.Table") -> tuple[Timestamp, Timestamp]:
+        time = data[self.time_column]
+        limits = data.aggregate(min=time.min(), max=time.max()).execute()
+
+        lo, hi = limits["min"].iloc[0], limits["max"].iloc[0]
+        if isna(lo) or isna(hi):
+            raise ValueError(f"No timestamps found in {self.time_column=}.")
+        return Timestamp(lo), Timestamp(hi)
+
+    def select(self, data: "ibis.Table", left: datetime, right: datetime) -> "ibis.Table":
+        """Select data based on the given bounds."""
+        time = data[self.time_column]
+        return data.filter((time >= Timestamp(left).to_pydatetime()) & (time < Timestamp(right).to_pydatetime()))
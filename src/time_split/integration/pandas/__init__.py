@@ -37,6 +37,17 @@ Examples:
     series are split along the index.
 """
 
-from ._impl import PandasT, split_pandas
+from ._export import ExportedFold, export_segments, read_segments
+from ._impl import PandasT, split_pandas, split_pandas_stream
+from ._scan import CsvScanResult, scan_csv
 
-__all__ = ["PandasT", "split_pandas"]
+__all__ = [
+    "CsvScanResult",
+    "ExportedFold",
+    "PandasT",
+    "export_segments",
+    "read_segments",
+    "scan_csv",
+    "split_pandas",
+    "split_pandas_stream",
+]
@@ -0,0 +1,142 @@
+import json
+import os
+from collections.abc import Hashable
+from itertools import pairwise
+from pathlib import Path
+from typing import Any, NamedTuple, Unpack
+
+from pandas import DataFrame, DatetimeIndex, Timestamp, concat, read_parquet
+
+from ..._docstrings import docs
+from ..._frontend import split
+from ...types import DatetimeIndexSplitterKwargs, DatetimeSplitBounds
+from ..base import DatetimeSplit
+from ._impl import _Indexer
+
+MANIFEST = "manifest.json"
+"""Name of the manifest file written by :func:`export_segments`."""
+
+
+class ExportedFold(NamedTuple):
+    """A fold written by :func:`.export_segments`."""
+
+    bounds: DatetimeSplitBounds
+    """The underlying bounds of the fold."""
+    data: list[str]
+    """Segment files that make up the `data` of the fold, relative to the export directory."""
+    future_data: list[str]
+    """Segment files that make up the `future_data` of the fold, relative to the export directory."""
+
+
+@docs
+def export_segments(
+    data: DataFrame,
+    path: str | os.PathLike[str],
+    time_column: Hashable = None,
+    **kwargs: Unpack[DatetimeIndexSplitterKwargs],
+) -> list[ExportedFold]:
+    """Write folds to disk as deduplicated Parquet segments.
+
+    The `data` is partitioned at the union of all fold bounds, and each segment is written exactly once. Storage is
+    linear in the size of `data`, regardless of the number of folds or how much they overlap. A manifest which maps
+    each fold to its segment files is written to ``path / 'manifest.json'``. Use :func:`read_segments` to load folds.
+
+    Args:
+        data: A ``DataFrame`` to split.
+        path: Output directory. Created if it does not exist.
+        time_column: A column in `data` to split on. Use ``data.index`` if ``None``.
+        **kwargs: {DatetimeIndexSplitterKwargs}
+
+    {USER_GUIDE}
+
+    Returns:
+        A list of :class:`.ExportedFold` tuples ``(bounds, data, future_data)``.
+
+    Examples:
+        Exporting expanding-window folds.
+
+        >>> import tempfile
+        >>> import pandas as pd
+        >>> index = pd.date_range("2022", "2022-1-10", freq="h")
+        >>> df = pd.DataFrame(dict(x=range(len(index))), index=index)
+        >>> path = tempfile.mkdtemp()
+        >>> folds = export_segments(df, path, schedule="1d", before="all", n_splits=2)
+        >>> for fold in folds:
+        ...     print(fold.data, fold.future_data)
+        ['segment-00000.parquet'] ['segment-00001.parquet']
+        ['segment-00000.parquet', 'segment-00001.parquet'] ['segment-00002.parquet']
+
+        Each row is written only once. Use :func:`read_segments` to load a fold.
+
+        >>> fold = read_segments(path, 1)
+        >>> len(fold.data), len(fold.future_data)
+        (192, 24)
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    indexer = _Indexer(time_column)
+    splits = split(**kwargs, available=indexer.as_available(data))
+
+    edges = sorted({edge for bounds in splits for edge in bounds})
+    segments = [
+        (left, right)
+        for left, right in pairwise(edges)
+        if any(bounds.start <= left and right <= bounds.end for bounds in splits)  # Skip gaps between folds.
+    ]
+
+    files = [f"segment-{i:05d}.parquet" for i in range(len(segments))]
+    for file, segment in zip(files, indexer.select_many(data, segments), strict=True):
+        segment.to_parquet(path / file)
+
+    # Segments are sorted and disjoint, so those inside [left, right) are contiguous.
+    lows = DatetimeIndex([lo for lo, _ in segments])
+    highs = DatetimeIndex([hi for _, hi in segments])
+
+    def covering(left: Timestamp, right: Timestamp) -> list[str]:
+        return files[lows.searchsorted(left, "left") : highs.searchsorted(right, "right")]
+
+    folds = [ExportedFold(b, data=covering(b.start, b.mid), future_data=covering(b.mid, b.end)) for b in splits]
+    manifest = {
+        "segments": [
+            dict(file=f, start=lo.isoformat(), end=hi.isoformat()) for f, (lo, hi) in zip(files, segments, strict=True)
+        ],
+        "folds": [
+            dict(bounds=[b.isoformat() for b in f.bounds], data=f.data, future_data=f.future_data) for f in folds
+        ],
+    }
+    (path / MANIFEST).write_text(json.dumps(manifest, indent=2))
+    return folds
+
+
+def read_segments(path: str | os.PathLike[str], fold: int, **kwargs: Any) -> DatetimeSplit[DataFrame]:
+    """Read a fold written by :func:`export_segments`.
+
+    Rows are ordered by segment. Within each segment, the original row order is preserved.
+
+    Args:
+        path: Directory passed to :func:`export_segments`.
+        fold: Index of the fold to read. Negative values are supported.
+        **kwargs: Keyword arguments for :func:`pandas.read_parquet`, e.g. `columns`.
+
+    Returns:
+        A :class:`~time_split.integration.base.DatetimeSplit` tuple ``(data, future_data, bounds)``.
+
+    Raises:
+        IndexError: If `fold` is out of range.
+    """
+    path = Path(path)
+    manifest = json.loads((path / MANIFEST).read_text())
+    entry = manifest["folds"][fold]
+
+    def read(files: list[str]) -> DataFrame:
+        if not files:
+            # E.g. before='empty'. Use any segment for the schema.
+            return read_parquet(path / manifest["segments"][0]["file"], **kwargs).head(0)
+        return concat([read_parquet(path / file, **kwargs) for file in files])
+
+    return DatetimeSplit(
+        read(entry["data"]),
+        future_data=read(entry["future_data"]),
+        bounds=DatetimeSplitBounds(*map(Timestamp, entry["bounds"])),
+    )
@@ -1,14 +1,17 @@
-from collections.abc import Hashable, Iterable
+from collections.abc import Hashable, Iterable, Iterator
+from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Generic, TypeVar, Unpack
 
-from pandas import DataFrame, DatetimeIndex, Series, Timestamp
+import numpy as np
+import pandas
+from pandas import DataFrame, DatetimeIndex, Series, Timestamp, concat
 from rics.misc import tname
 
 from ..._docstrings import docs
-from ...types import DatetimeIndexSplitterKwargs, MetricsType
+from ...types import DatetimeIndexSplitterKwargs, DatetimeIterable, MetricsType
 from .._log_progress import LogProgressArg
-from ..base import DatetimeSplit, split_data
+from ..base import DatetimeSplit, SelectCache, split_data, split_stream
 
 PandasT = TypeVar("PandasT", Series, DataFrame)
 """A splittable pandas type."""
@@ -20,6 +23,7 @@ def split_pandas(
     time_column: Hashable = None,
     *,
     log_progress: LogProgressArg[MetricsType] = False,
+    cache: SelectCache | None = None,
     **kwargs: Unpack[DatetimeIndexSplitterKwargs],
 ) -> Iterable[DatetimeSplit[PandasT]]:
     """Split a pandas type.
@@ -31,6 +35,7 @@ def split_pandas(
         data: A pandas data container type to split; either ``Series`` or a ``DataFrame``.
         time_column: A column in `data` to split on. Use ``data.index`` if ``None``.
         log_progress: {log_progress}
+        cache: {cache}
         **kwargs: {DatetimeIndexSplitterKwargs}
 
     {USER_GUIDE}
@@ -49,13 +54,59 @@ def split_pandas(
         log_progress=log_progress,
         as_available=indexer.as_available,
         select=indexer.select,
+        select_many=indexer.select_many,
+        count=len,
+        cache=cache,
         **kwargs,
     )
 
 
+@docs
+def split_pandas_stream(
+    batches: Iterable[PandasT],
+    time_column: Hashable = None,
+    *,
+    available: DatetimeIterable | None = None,
+    emit_partial: bool = False,
+    **kwargs: Unpack[DatetimeIndexSplitterKwargs],
+) -> Iterator[DatetimeSplit[PandasT]]:
+    """Split a stream of pandas batches.
+
+    See :func:`~time_split.integration.base.split_stream` for details.
+
+    Args:
+        batches: An iterable of ``Series`` or ``DataFrame`` batches, in approximately chronological order.
+        time_column: A column in each batch to split on. Use ``batch.index`` if ``None``.
+        available: Expected range of the stream, e.g. a tuple ``(min, max)``. Required unless the schedule is
+            explicit, since splits are computed before the first batch is consumed.
+        emit_partial: If ``True``, folds whose `end` has not been reached are emitted when `batches` is exhausted.
+        **kwargs: {DatetimeIndexSplitterKwargs}
+
+    {USER_GUIDE}
+
+    Yields:
+        Tuples ``(data, future_data, bounds)``, ordered by `bounds.end`.
+
+    Raises:
+        TypeError: If `time_column` is not datetime-like.
+
+    """
+    indexer = _Indexer(time_column)
+
+    yield from split_stream(
+        batches,
+        available=available,
+        as_available=indexer.as_available,
+        select=indexer.select,
+        concat=concat,
+        emit_partial=emit_partial,
+        **kwargs,
+    )
+
+
+@dataclass(frozen=True)
 class _Indexer(Generic[PandasT]):
-    def __init__(self, time_column: Hashable | None) -> None:
-        self.time_column = time_column
+    time_column: Hashable | None
 
     def as_available(self, data: PandasT) -> Series | DatetimeIndex:
         time = self._get_time(data)
@@ -79,3 +130,27 @@ class _Indexer(Generic[PandasT]):
         else:
             # Index slicing is a lot faster than boolean masks (empirically, seems to be a factor ~10).
             return data[left : right - Timestamp.resolution]  # type: ignore[misc]
+
+    def select_many(self, data: PandasT, ranges: list[tuple[datetime, datetime]]) -> Iterator[PandasT]:
+        """Select data for all `ranges` using a single sort. Row order is preserved.
+
+        Slices of sorted data are copied unless copy-on-write is enabled, so that folds never share memory with `data`.
+        """
+        values = DatetimeIndex(self._get_time(data)).as_unit("ns").asi8  # NaT is sorted first; never selected.
+        edges = DatetimeIndex([edge for r in ranges for edge in r]).as_unit("ns").asi8
+
+        if (values[1:] >= values[:-1]).all():
+            copy = not _copy_on_write()
+            for left, right in np.searchsorted(values, edges).reshape(-1, 2):
+                part = data.iloc[left:right]
+                yield part.copy() if copy else part
+        else:
+            order = np.argsort(values, kind="stable")
+            for left, right in np.searchsorted(values[order], edges).reshape(-1, 2):
+                yield data.iloc[np.sort(order[left:right])]
+
+
+def _copy_on_write() -> bool:
+    if not pandas.__version__.startswith("2."):
+        return True  # Always enabled for pandas>=3, where accessing the deprecated option emits a warning.
+    return pandas.get_option("mode.copy_on_write") is True
@@ -0,0 +1,92 @@
+import os
+from collections.abc import Hashable
+from typing import IO, Any, NamedTuple
+
+from pandas import Series, Timestamp, read_csv, to_datetime
+
+from ..._compat import fix_pandas4_warning
+
+
+class CsvScanResult(NamedTuple):
+    """Output of :func:`.scan_csv`."""
+
+    limits: tuple[Timestamp, Timestamp]
+    """A tuple ``(min, max)`` of the time column. Pass as `available` to e.g. :func:`time_split.split`."""
+    row_counts: Series | None
+    """Row counts per `row_count_bin`, or ``None``. Pass as `row_count_bin` to :func:`time_split.plot`."""
+    n_rows: int
+    """Number of rows with a valid timestamp."""
+
+
+def scan_csv(
+    path: str | os.PathLike[str] | IO[str],
+    time_column: Hashable,
+    *,
+    row_count_bin: str | None = None,
+    chunksize: int = 2**20,
+    **kwargs: Any,
+) -> CsvScanResult:
+    r"""Compute limits and row counts of a CSV time column in a single pass.
+
+    The file is read in chunks of `chunksize` rows, and only the `time_column` is parsed. Memory usage is bounded by
+    the chunk size and the number of row count bins, regardless of the file size.
+
+    Args:
+        path: A path or buffer. See :func:`pandas.read_csv`.
+        time_column: Name of the time column to scan.
+        row_count_bin: A pandas offset alias. If given, count rows in each bin.
+        chunksize: Number of rows per chunk.
+        **kwargs: Additional keyword arguments for :func:`pandas.read_csv`, e.g. `sep` or `compression`.
+
+    Returns:
+        A :class:`.CsvScanResult` tuple ``(limits, row_counts, n_rows)``.
+
+    Raises:
+        ValueError: If `time_column` has no valid timestamps.
+
+    Examples:
+        Scanning a CSV file without loading it.
+
+        >>> from io import StringIO
+        >>> csv = StringIO(
+        ...     "time,value\n2022-01-01 12:00,1\n2022-01-02 06:00,2\n2022-01-02 18:00,3\n"
+        ... )
+        >>> result = scan_csv(csv, "time", row_count_bin="1d", chunksize=2)
+        >>> result.limits
+        (Timestamp('2022-01-01 12:00:00'), Timestamp('2022-01-02 18:00:00'))
+        >>> result.row_counts
+        time
+        2022-01-01    1
+        2022-01-02    2
+        Name: count, dtype: int64
+
+        Pass ``available=result.limits`` and ``row_count_bin=result.row_counts`` to :func:`time_split.plot`.
+    """
+    freq = None if row_count_bin is None else fix_pandas4_warning(row_count_bin)
+
+    lo: Timestamp | None = None
+    hi: Timestamp | None = None
+    row_counts: Series | None = None
+    n_rows = 0
+
+    for chunk in read_csv(path, usecols=[time_column], chunksize=chunksize, **kwargs):
+        time = to_datetime(chunk[time_column]).dropna()
+        if time.empty:
+            continue
+
+        n_rows += len(time)
+        chunk_min, chunk_max = time.min(), time.max()
+        lo = chunk_min if lo is None else min(lo, chunk_min)
+        hi = chunk_max if hi is None else max(hi, chunk_max)
+
+        if freq is not None:
+            counts = time.dt.floor(freq).value_counts()
+            row_counts = counts if row_counts is None else row_counts.add(counts, fill_value=0).astype("int64")
+
+    if lo is None or hi is None:
+        raise ValueError(f"No valid timestamps found in column {time_column!r}.")
+
+    if row_counts is not None:
+        row_counts = row_counts.sort_index()
+        row_counts.name = "count"
+    return CsvScanResult((lo, hi), row_counts=row_counts, n_rows=n_rows)
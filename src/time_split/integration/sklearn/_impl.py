@@ -1,16 +1,16 @@
 from collections.abc import Iterable, Sequence
-from typing import Any, Unpack, cast, get_args
+from typing import Any, Unpack, cast
 
 from numpy import array, datetime64, logical_and, ndarray, nonzero
 from numpy.typing import NDArray
 
 from ..._backend import DatetimeIndexSplitter
+from ..._compat import DATETIME_TYPES
 from ..._docstrings import docs
 from ...types import (
     DatetimeIndexSplitterKwargs,
     DatetimeIterable,
     DatetimeSplits,
-    DatetimeTypes,
     MetricsType,
 )
 from .._log_progress import LogProgressArg, handle_log_progress_arg
@@ -119,7 +119,7 @@ class ScikitLearnSplitter(BaseCrossValidator):  # type: ignore[misc]
 
         index = arg.index
 
-        if type(arg.index[0]) in get_args(DatetimeTypes):
+        if type(arg.index[0]) in DATETIME_TYPES:
             return cast(DatetimeIterable, index)
 
         raise TypeError(f"{name}.index does not appear to be a datetime-like iterable.")
@@ -0,0 +1,9 @@
+"""Integration with :pep:`249` (DB-API) database drivers.
+
+Works with any DB-API compliant driver, e.g. ``sqlite3``, ``duckdb`` or ``psycopg``. Only the fold limits are computed
+eagerly; fold data is fetched on demand using the :class:`SqlQuery` methods.
+"""
+
+from ._impl import Connection, ParamStyle, SqlQuery, split_sql
+
+__all__ = ["Connection", "ParamStyle", "SqlQuery", "split_sql"]
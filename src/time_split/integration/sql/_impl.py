@@ -0,0 +1,256 @@
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Literal, Protocol, Unpack, cast
+
+from pandas import DataFrame, Timestamp
+
+from ..._docstrings import docs
+from ...types import DatetimeIndexSplitterKwargs, MetricsType
+from .._log_progress import LogProgressArg
+from ..base import DatetimeSplit, split_data
+
+if TYPE_CHECKING:
+    import pyarrow  # type: ignore[import-untyped]
+
+ParamStyle = Literal["qmark", "numeric", "named", "format", "pyformat"]
+"""Parameter marker formats defined by :pep:`249`."""
+
+_PLACEHOLDERS: dict[str, tuple[str, str]] = {
+    "qmark": ("?", "?"),
+    "numeric": (":1", ":2"),
+    "named": (":left", ":right"),
+    "format": ("%s", "%s"),
+    "pyformat": ("%(left)s", "%(right)s"),
+}
+
+
+class Connection(Protocol):
+    """Minimal :pep:`249` connection interface."""
+
+    def cursor(self) -> Any:
+        """Return a new cursor."""
+
+    def close(self) -> None:
+        """Close the connection."""
+
+
+@docs
+def split_sql(
+    connect: Connection | Callable[[], Connection],
+    source: str,
+    time_column: str,
+    *,
+    paramstyle: ParamStyle = "qmark",
+    to_param: Callable[[Timestamp], Any] | None = None,
+    log_progress: LogProgressArg[MetricsType] = False,
+    **kwargs: Unpack[DatetimeIndexSplitterKwargs],
+) -> Iterator[DatetimeSplit["SqlQuery"]]:
+    """Split a SQL table or query.
+
+    Limits are computed using a single ``SELECT MIN(time_column), MAX(time_column)`` query. Timestamps are never
+    fetched. Fold data is returned as lazy :class:`SqlQuery` objects; nothing is fetched until results are requested.
+
+    All queries are executed on a single connection. Executing a query after iteration has stopped raises a
+    ``RuntimeError``.
+
+    Args:
+        connect: A connection, or a callable ``() -> connection``, e.g. ``functools.partial(sqlite3.connect, path)``
+            or a pool checkout function. Callables are called at most once, on first use, and the connection is closed
+            when iteration stops. Connections passed directly are never closed.
+        source: A table name or a ``SELECT`` query.
+        time_column: A column in `source` to split on.
+        paramstyle: Parameter marker format used by the driver; see ``<module>.paramstyle``.
+        to_param: A callable ``(Timestamp) -> parameter`` used to convert fold bounds. Default is
+            :meth:`pandas.Timestamp.to_pydatetime`.
+        log_progress: {log_progress}
+        **kwargs: {DatetimeIndexSplitterKwargs}
+
+    {USER_GUIDE}
+
+    Yields:
+        Tuples ``(data, future_data, bounds)``, where `data` and `future_data` are :class:`SqlQuery` objects.
+
+    Raises:
+        ValueError: If `paramstyle` is unknown.
+        ValueError: If `time_column` has no timestamps.
+
+    Examples:
+        Splitting an SQLite table.
+
+        >>> import sqlite3
+        >>> connection = sqlite3.connect(":memory:")
+        >>> _ = connection.execute("CREATE TABLE events (time TEXT, value INTEGER)")
+        >>> _ = connection.executemany(
+        ...     "INSERT INTO events VALUES (?, ?)",
+        ...     [("2022-01-0" + str(day) + " 12:00:00", day) for day in range(1, 6)],
+        ... )
+        >>> folds = split_sql(
+        ...     connection,
+        ...     "events",
+        ...     "time",
+        ...     schedule="1d",
+        ...     before="2d",
+        ...     to_param=str,
+        ... )
+        >>> for fold in folds:
+        ...     print(fold.future_data.sql, fold.future_data.params)
+        ...     print(fold.data.to_pandas())
+        SELECT * FROM events WHERE time >= ? AND time < ? ('2022-01-03 12:00:00', '2022-01-04 12:00:00')
+                          time  value
+        0  2022-01-01 12:00:00      1
+        1  2022-01-02 12:00:00      2
+        SELECT * FROM events WHERE time >= ? AND time < ? ('2022-01-04 12:00:00', '2022-01-05 12:00:00')
+                          time  value
+        0  2022-01-02 12:00:00      2
+        1  2022-01-03 12:00:00      3
+
+        SQLite stores timestamps as text, so bounds are converted using ``to_param=str``. The `connection` is still
+        open after iteration has stopped.
+    """
+    if paramstyle not in _PLACEHOLDERS:
+        raise ValueError(f"Bad {paramstyle=}; expected one of {tuple(_PLACEHOLDERS)}.")
+
+    connection = _Connection(connect)
+    from_ = f"({source}) source" if source.split(maxsplit=1)[0].upper() in {"SELECT", "WITH"} else source
+    indexer = _Indexer(from_, time_column, paramstyle, to_param or Timestamp.to_pydatetime)
+
+    try:
+        yield from split_data(
+            SqlQuery(f"SELECT * FROM {from_}", connection=connection),  # noqa: S608
+            log_progress=log_progress,
+            as_available=indexer.as_available,
+            select=indexer.select,
+            **kwargs,
+        )
+    finally:
+        connection.close()
+
+
+@dataclass(frozen=True)
+class SqlQuery:
+    """A lazy, parameterized SQL query."""
+
+    sql: str
+    """The query string."""
+    params: tuple[Any, ...] | dict[str, Any] = ()
+    """Query parameters."""
+    connection: "_Connection" = field(repr=False, kw_only=True)
+
+    def to_pandas(self) -> DataFrame:
+        """Execute the query and return all rows as a ``pandas.DataFrame``."""
+        with self.connection.execute(self.sql, self.params) as cursor:
+            return DataFrame(cursor.fetchall(), columns=_column_names(cursor))
+
+    def iter_pandas(self, batch_size: int = 10_000) -> Iterator[DataFrame]:
+        """Execute the query and yield ``pandas.DataFrame`` batches of at most `batch_size` rows."""
+        with self.connection.execute(self.sql, self.params) as cursor:
+            columns = _column_names(cursor)
+            while rows := cursor.fetchmany(batch_size):
+                yield DataFrame(rows, columns=columns)
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Execute the query and return all rows as a ``pyarrow.Table``."""
+        import pyarrow
+
+        with self.connection.execute(self.sql, self.params) as cursor:
+            return pyarrow.Table.from_batches([_to_record_batch(cursor.fetchall(), _column_names(cursor))])
+
+    def iter_arrow(self, batch_size: int = 10_000) -> Iterator["pyarrow.RecordBatch"]:
+        """Execute the query and yield ``pyarrow.RecordBatch`` batches of at most `batch_size` rows.
+
+        All batches have the same schema, inferred from the first batch. Columns which are ``NULL`` for every row of
+        the first batch have type ``null``; use :meth:`to_arrow` if such columns may have values in later batches.
+        """
+        with self.connection.execute(self.sql, self.params) as cursor:
+            columns = _column_names(cursor)
+            schema = None
+            while rows := cursor.fetchmany(batch_size):
+                batch = _to_record_batch(rows, columns, schema)
+                schema = batch.schema
+                yield batch
+
+
+class _Connection:
+    def __init__(self, connect: Connection | Callable[[], Connection]) -> None:
+        # Connections passed by the user are borrowed. Only connections returned by `connect` are closed.
+        self._owned = not hasattr(connect, "cursor")
+        self._connect = cast(Callable[[], Connection], connect)
+        self._connection: Connection | None = None if self._owned else cast(Connection, connect)
+        self._closed = False
+
+    def execute(self, sql: str, params: tuple[Any, ...] | dict[str, Any]) -> "_Cursor":
+        if self._closed:
+            raise RuntimeError("Connection is closed. Queries must be executed before iteration stops.")
+        if self._connection is None:
+            self._connection = self._connect()
+        cursor = self._connection.cursor()
+        cursor.execute(sql, params)
+        return _Cursor(cursor)
+
+    def close(self) -> None:
+        self._closed = True
+        if self._owned and self._connection is not None:
+            self._connection.close()
+        self._connection = None
+
+
+class _Cursor:
+    def __init__(self, cursor: Any) -> None:
+        self.cursor = cursor
+
+    def __enter__(self) -> Any:
+        return self.cursor
+
+    def __exit__(self, *_: object) -> None:
+        self.cursor.close()
+
+
+@dataclass(frozen=True)
+class _Indexer:
+    # Identifiers (source, time_column) are trusted user input. Bounds are always passed as query parameters.
+    from_: str
+    time_column: str
+    paramstyle: ParamStyle
+    to_param: Callable[[Timestamp], Any]
+
+    def as_available(self, query: SqlQuery) -> tuple[Timestamp, Timestamp]:
+        sql = f"SELECT MIN({self.time_column}), MAX({self.time_column}) FROM {self.from_}"  # noqa: S608
+        with query.connection.execute(sql, ()) as cursor:
+            lo, hi = cursor.fetchone()
+
+        if lo is None or hi is None:
+            raise ValueError(f"No timestamps found in {self.time_column=}. Query: {sql!r}")
+        return Timestamp(lo), Timestamp(hi)
+
+    def select(self, query: SqlQuery, left: datetime, right: datetime) -> SqlQuery:
+        """Create a query for the given bounds."""
+        left_marker, right_marker = _PLACEHOLDERS[self.paramstyle]
+        where = f"{self.time_column} >= {left_marker} AND {self.time_column} < {right_marker}"
+
+        values = self.to_param(Timestamp(left)), self.to_param(Timestamp(right))
+        params = dict(left=values[0], right=values[1]) if self.paramstyle in {"named", "pyformat"} else values
+        return SqlQuery(f"SELECT * FROM {self.from_} WHERE {where}", params, connection=query.connection)  # noqa: S608
+
+
+def _column_names(cursor: Any) -> list[str]:
+    return [column[0] for column in cursor.description]
+
+
+def _to_record_batch(
+    rows: list[tuple[Any, ...]],
+    columns: list[str],
+    schema: "pyarrow.Schema | None" = None,
+) -> "pyarrow.RecordBatch":
+    import pyarrow
+
+    if schema is not None:
+        types = schema.types
+        arrays = [pyarrow.array(values, dtype) for values, dtype in zip(zip(*rows, strict=True), types, strict=True)]
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+    if rows:
+        arrays = [pyarrow.array(values) for values in zip(*rows, strict=True)]
+    else:
+        arrays = [pyarrow.array([], pyarrow.null()) for _ in columns]
+    return pyarrow.RecordBatch.from_arrays(arrays, names=columns)
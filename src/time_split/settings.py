@@ -1,5 +1,6 @@
 """Global settings for the splitting logic."""
 
+import os as _os
 import typing as _t
 
 from . import types as _tst
@@ -19,9 +20,9 @@ class auto_expand_limits:  # noqa: N801
         cls,
         level: _t.Literal["hour", "day"],
         *,
-        start_at: _tst.TimedeltaTypes,
-        round_to: _tst.TimedeltaTypes,
-        tolerance: _tst.TimedeltaTypes,
+        start_at: "_tst.TimedeltaTypes",
+        round_to: "_tst.TimedeltaTypes",
+        tolerance: "_tst.TimedeltaTypes",
     ) -> None:
         """Set a :class:`Level` used by the auto-expand_limits logic.
 
@@ -45,13 +46,13 @@ class auto_expand_limits:  # noqa: N801
     class Level(_t.NamedTuple):
         """Level type used by :attr:`auto_expand_limits`."""
 
-        start_at: _tst.TimedeltaTypes
+        start_at: "_tst.TimedeltaTypes"
         """Span size at which this level starts."""
 
-        round_to: _tst.TimedeltaTypes
+        round_to: "_tst.TimedeltaTypes"
         """Frequency to round the range limits to."""
 
-        tolerance: _tst.TimedeltaTypes
+        tolerance: "_tst.TimedeltaTypes"
         """Maximum amount by which to alter limits."""
 
     hour: Level = Level("6 hours", "hour", "15 min")
@@ -142,7 +143,10 @@ class log_split_progress:  # noqa: N801
     * The ``seconds`` key, which is the (fractional) time the user spent in the fold, and
     * The ``formatted_seconds`` key, obtained using the :attr:`SECONDS_FORMATTER`.
 
-    The value of ``seconds`` is obtained using :py:func:`time.perf_counter`.
+    The value of ``seconds`` is obtained using :py:func:`time.perf_counter`. When using integrations, the time spent
+    selecting fold data is not included in ``seconds``. It is available as the ``select_seconds`` key instead, along
+    with ``data_rows`` and ``future_data_rows`` if supported by the integration (see
+    :class:`~time_split.types.SplitProgressExtras`).
 
     .. code-block:: python
        :caption: Sample output.
@@ -189,6 +193,27 @@ class misc:  # noqa: N801
     """
 
 
+class split_cache:  # noqa: N801
+    """Settings for the opt-in disk cache used by :meth:`.DatetimeIndexSplitter.get_splits`.
+
+    The cache is keyed by a stable hash of the splitter parameters, the limits of the `available` data, relevant
+    settings, and the ``time_split`` version. Explicit schedules, including iterables such as generators, are keyed by
+    their materialized timestamps. Splits are never cached if the `filter` is a lambda, local function or bound method,
+    or if the `schedule` is a :class:`~time_split.types.BalancedRows` instance (which depends on all `available` data,
+    not only its limits).
+
+    .. note::
+
+       Only the limits of the `available` data are used for cache lookups, so data is still scanned once per call.
+    """
+
+    DIRECTORY: str | _os.PathLike[str] | None = None
+    """Cache directory. Set to enable caching; the directory will be created if it doesn't exist."""
+
+    MAX_BYTES: int = 64 * 2**20
+    """Maximum total size of the cache directory. Least recently used entries are evicted first."""
+
+
 def no_init(self: object) -> None:
     """Prevents initialization of config classes."""
     raise TypeError(
@@ -197,7 +222,7 @@ def no_init(self: object) -> None:
     )
 
 
-for cls in auto_expand_limits, plot, log_split_progress, misc:
+for cls in auto_expand_limits, plot, log_split_progress, misc, split_cache:
     cls.__init__ = no_init  # type: ignore[method-assign]
 
 del cls
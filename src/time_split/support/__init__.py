@@ -11,15 +11,40 @@ This module may change without notice. Stick to the top-level :mod:`time_split`-
 dependencies if you need to use the ``support`` module.
 """
 
-from .._backend import DatetimeIndexSplitter, expand_limits, process_available
-from .._frontend import default_metrics_formatter, fold_weight, format_expanded_limits, to_string
+from .._backend import DatetimeIndexSplitter, StageTimings, expand_limits, process_available, record_stages
+from .._frontend import (
+    FoldIndex,
+    MetricsCollector,
+    SplitManifest,
+    default_metrics_formatter,
+    fit_to_budget,
+    fold_membership,
+    fold_weight,
+    format_expanded_limits,
+    read_manifest,
+    split_grouped,
+    split_sweep,
+    to_string,
+    write_manifest,
+)
 
 __all__ = [
     "DatetimeIndexSplitter",
+    "FoldIndex",
+    "MetricsCollector",
+    "SplitManifest",
+    "StageTimings",
     "default_metrics_formatter",
     "expand_limits",
+    "fit_to_budget",
+    "fold_membership",
     "fold_weight",
     "format_expanded_limits",
     "process_available",
+    "read_manifest",
+    "record_stages",
+    "split_grouped",
+    "split_sweep",
     "to_string",
+    "write_manifest",
 ]
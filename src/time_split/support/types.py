@@ -2,10 +2,11 @@
 
 from time_split._backend._schedule import MaterializedSchedule
 
-from .._backend import DatetimeIndexLike, ProcessAvailableResult
+from .._backend import DatetimeIndexLike, ProcessAvailableResult, SplitterPlan
 
 __all__ = [
     "DatetimeIndexLike",
     "MaterializedSchedule",
     "ProcessAvailableResult",
+    "SplitterPlan",
 ]
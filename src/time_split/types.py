@@ -1,38 +1,86 @@
 """Types related to splitting data."""
 
-import datetime as _dt
+import dataclasses as _dataclasses
+import importlib as _importlib
 import logging as _logging
 import typing as _t
 from abc import ABC as _ABC
 from collections import abc as _abc
 
-import numpy as _np
-import pandas as _pd
+if _t.TYPE_CHECKING:
+    import numpy as _np
+    import numpy.typing as _npt
+    import pandas as _pd
 
-DatetimeTypes: _t.TypeAlias = str | _pd.Timestamp | _dt.datetime | _dt.date | _np.datetime64
-"""Types that may be cast to :class:`pandas.Timestamp`."""
-DatetimeIterable = _abc.Iterable[DatetimeTypes]
-"""Iterable that may be cast to :class:`pandas.DatetimeIndex`."""
-TimedeltaTypes: _t.TypeAlias = str | _pd.Timedelta | _dt.timedelta | _np.timedelta64
-"""Types that may be cast to :class:`pandas.Timedelta`."""
+    from . import _type_aliases as _aliases
+
+    # Aliases which depend on numpy or pandas are defined in _type_aliases, and loaded on first access at runtime.
+    # See __getattr__ below.
+    DatetimeTypes: _t.TypeAlias = _aliases.DatetimeTypes
+    """Types that may be cast to :class:`pandas.Timestamp`."""
+    DatetimeIterable: _t.TypeAlias = _aliases.DatetimeIterable
+    """Iterable that may be cast to :class:`pandas.DatetimeIndex`."""
+    TimedeltaTypes: _t.TypeAlias = _aliases.TimedeltaTypes
+    """Types that may be cast to :class:`pandas.Timedelta`."""
+else:
+
+    class _LazyModule:
+        """Imports `name` when an attribute is first accessed."""
+
+        def __init__(self, name: str) -> None:
+            self._name = name
+
+        def __getattr__(self, attr: str) -> _t.Any:
+            return getattr(_importlib.import_module(self._name), attr)
+
+    # String annotations must resolve at runtime, e.g. for typing.get_type_hints(). Names used by annotations are
+    # proxies which import the real module on access.
+    _np = _LazyModule("numpy")
+    _npt = _LazyModule("numpy.typing")
+    _pd = _LazyModule("pandas")
+    _aliases = _LazyModule("time_split._type_aliases")
+    _frontend = _LazyModule("time_split._frontend")
+
+
+@_dataclasses.dataclass(frozen=True)
+class BalancedRows:
+    """Schedule based on `available` data, such that each schedule interval holds about the same number of rows.
+
+    Schedule timestamps are quantiles of the `available` timestamps, plus the (expanded) limits. Use with the default
+    ``after=1`` to create folds whose `future_data` hold roughly ``len(available) / n`` rows each. Note that the first
+    interval never becomes `future_data`, since there is no data before it.
+
+    Requires the full `available` data; passing only the limits ``(min, max)`` is not enough.
+    """
+
+    n: int
+    """Number of schedule intervals. The schedule will have at most ``n + 1`` timestamps."""
+
+    def __post_init__(self) -> None:
+        if self.n < 1:
+            raise ValueError(f"Expected n >= 1, but got n={self.n!r}.")
+
+
+if _t.TYPE_CHECKING:
+    Schedule: _t.TypeAlias = _aliases.Schedule
+    """User schedule type."""
+    Span: _t.TypeAlias = _aliases.Span
+    """User span type. Used to determine limits from the timestamps given by a :attr:`Schedule`."""
 
-Schedule: _t.TypeAlias = _pd.DatetimeIndex | DatetimeIterable | TimedeltaTypes
-"""User schedule type."""
-Span = int | _t.Literal["all", "empty"] | TimedeltaTypes
-"""User span type. Used to determine limits from the timestamps given by a :attr:`Schedule`."""
 ExpandLimits = bool | _t.Literal["auto"] | str
 """Limits flexibility spec for ``floor/ceil``. Pass ``False`` to disable."""
 
-Filter = _t.Callable[[_pd.Timestamp, _pd.Timestamp, _pd.Timestamp], bool]
-"""A callable ``(start, mid, end) -> bool`` used to filter folds."""
+if _t.TYPE_CHECKING:
+    Filter: _t.TypeAlias = _aliases.Filter
+    """A callable ``(start, mid, end) -> bool`` used to filter folds."""
 
 
 class DatetimeSplitBounds(_t.NamedTuple):
     """A 3-tuple which denotes two adjacent datetime ranges."""
 
-    start: _pd.Timestamp
+    start: "_pd.Timestamp"
     """Left (inclusive) limit of the `data` range."""
-    mid: _pd.Timestamp
+    mid: "_pd.Timestamp"
     """Schedule timestamp; simulated :attr:`~.DatetimeSplit.training_date`.
 
     Right (exclusive) limit of the `data` range, left (inclusive) limit of the `future_data` range.
@@ -40,7 +88,7 @@ class DatetimeSplitBounds(_t.NamedTuple):
     When using :mod:`.integration` functions, These are available as :attr:`.DatetimeSplit.data` and
     :attr:`.DatetimeSplit.future_data`, respectively.
     """
-    end: _pd.Timestamp
+    end: "_pd.Timestamp"
     """Right (exclusive) limit of the `future_data` range."""
 
 
@@ -55,6 +103,72 @@ class DatetimeSplitCounts(_t.NamedTuple):
     future_data: int
 
 
+class FoldBudget(_t.NamedTuple):
+    """Fold selection arguments that fit a compute budget."""
+
+    n_splits: int
+    """Value to use for the `n_splits` argument. Zero means that all folds are used."""
+    step: int
+    """Value to use for the `step` argument."""
+    n_folds: int
+    """Number of folds selected by `n_splits` and `step`."""
+    seconds: float
+    """Estimated total cost of the selected folds."""
+
+
+FoldCost = _t.Callable[[DatetimeSplitCounts], float]
+"""A callable ``(DatetimeSplitCounts) -> seconds`` which estimates the cost of a fold, based on its row counts."""
+
+
+class SparseFoldMembership(_t.NamedTuple):
+    """A boolean ``(n_rows, n_folds)``-matrix in compressed sparse row (CSR) format.
+
+    The folds of row ``i`` are given by ``indices[indptr[i] : indptr[i + 1]]`` (see :meth:`folds`).
+    """
+
+    indptr: "_npt.NDArray[_np.int64]"
+    """Row pointers into `indices`. Always has length ``n_rows + 1``."""
+    indices: "_npt.NDArray[_np.int64]"
+    """Fold indices (positions in the original `splits`) of each row, concatenated."""
+    n_folds: int
+    """Number of folds (columns)."""
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Matrix shape ``(n_rows, n_folds)``."""
+        return len(self.indptr) - 1, self.n_folds
+
+    def folds(self, row: int) -> "_npt.NDArray[_np.int64]":
+        """Get the fold indices of a single `row`."""
+        return self.indices[self.indptr[row] : self.indptr[row + 1]]
+
+    def to_dense(self) -> "_npt.NDArray[_np.bool_]":
+        """Convert to a dense boolean matrix. Memory usage is proportional to ``n_rows * n_folds``."""
+        import numpy as np
+
+        dense = np.zeros(self.shape, dtype=bool)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        dense[rows, self.indices] = True
+        return dense
+
+    def to_scipy(self) -> _t.Any:
+        """Convert to a :class:`scipy.sparse.csr_array`. Requires ``scipy``."""
+        import numpy as np
+        from scipy.sparse import csr_array
+
+        data = np.ones(len(self.indices), dtype=bool)
+        return csr_array((data, self.indices, self.indptr), shape=self.shape)
+
+
+class DatetimeSplitMembership(_t.NamedTuple):
+    """Row-to-fold membership of `data` and `future_data`."""
+
+    data: SparseFoldMembership
+    """Rows in the [:attr:`~.DatetimeSplitBounds.start`, :attr:`~.DatetimeSplitBounds.mid`)-range of each fold."""
+    future_data: SparseFoldMembership
+    """Rows in the [:attr:`~.DatetimeSplitBounds.mid`, :attr:`~.DatetimeSplitBounds.end`)-range of each fold."""
+
+
 class DatetimeIndexSplitterKwargs(_t.TypedDict, total=False):
     """Keyword arguments for :class:`~time_split.support.DatetimeIndexSplitter`.
 
@@ -62,21 +176,22 @@ class DatetimeIndexSplitterKwargs(_t.TypedDict, total=False):
     :func:`time_split.split` or one of the related functions for user-facing APIs.
     """
 
-    schedule: _t.Required[Schedule]
-    before: Span
-    after: Span
+    schedule: _t.Required["_aliases.Schedule"]
+    before: "_aliases.Span"
+    after: "_aliases.Span"
     step: int
     n_splits: int
     expand_limits: ExpandLimits
-    filter: Filter | str | None
+    filter: "_aliases.Filter | str | None"
 
 
 LogSplitProgressLoggerArg = _logging.Logger | _logging.LoggerAdapter[_t.Any] | str
 """A logger or string."""
 MetricsType = _t.TypeVar("MetricsType")
 """Metrics argument type."""
-GetMetrics = _t.Callable[[_pd.Timestamp], MetricsType]
-"""A callable ``(Timestamp) -> MetricsType``."""
+if _t.TYPE_CHECKING:
+    GetMetrics: _t.TypeAlias = _aliases.GetMetrics[MetricsType]
+    """A callable ``(Timestamp) -> MetricsType``."""
 FormatMetrics = _t.Callable[[str, MetricsType], str]
 """A callable ``(end_message, metrics) -> str``."""
 
@@ -88,7 +203,8 @@ class LogSplitProgressKwargs(_t.TypedDict, _t.Generic[MetricsType], total=False)
     start_level: int
     end_level: int
     extra: dict[str, _t.Any] | None
-    get_metrics: GetMetrics[MetricsType]
+    get_metrics: "_aliases.GetMetrics[MetricsType]"
+    collector: "_frontend.MetricsCollector | None"
 
 
 class SplitProgressExtras(_t.TypedDict, _t.Generic[MetricsType]):
@@ -108,6 +224,13 @@ class SplitProgressExtras(_t.TypedDict, _t.Generic[MetricsType]):
     """User time for the fold. Available only for the :attr:`fold-end message <.settings.log_split_progress.END_MESSAGE>`."""
     metrics: _t.NotRequired[MetricsType]
     """Optional fold metrics. Typically appended to the :attr:`fold-end message <.settings.log_split_progress.END_MESSAGE>`."""
+    select_seconds: _t.NotRequired[float]
+    """Time spent selecting fold data. Not included in `seconds`. Available only when using integrations."""
+    data_rows: _t.NotRequired[int]
+    """Number of rows in :attr:`.DatetimeSplit.data`. Available only for integrations that can count rows cheaply."""
+    future_data_rows: _t.NotRequired[int]
+    """Number of rows in :attr:`.DatetimeSplit.future_data`. Available only for integrations that can count rows
+    cheaply."""
 
 
 class LogSplitProgress(_ABC, _abc.Sequence[DatetimeSplitBounds]):
@@ -121,3 +244,77 @@ class LogSplitProgress(_ABC, _abc.Sequence[DatetimeSplitBounds]):
 
     logger: _logging.Logger | _logging.LoggerAdapter  # type: ignore[type-arg]
     """Logger instance that emits messages."""
+
+    async def __aiter__(self) -> _abc.AsyncIterator[DatetimeSplitBounds]:
+        """Iterate over splits asynchronously, using ``async for``. Logs progress like regular iteration.
+
+        The default implementation wraps :meth:`~object.__iter__`.
+        """
+        for split in self:
+            yield split
+
+    def track(
+        self,
+        index: int,
+        *,
+        extra: dict[str, _t.Any] | None = None,
+    ) -> _t.ContextManager[DatetimeSplitBounds]:
+        """Log progress of a single fold.
+
+        The fold-begin message is logged on entry, and the fold-end message when the block exits without errors. Use
+        this method when folds are processed concurrently, e.g. using :func:`asyncio.gather`, so that the duration of
+        each fold is measured separately.
+
+        Args:
+            index: Index of a split in :attr:`splits`.
+            extra: Additional `extra`-arguments for this fold, e.g. ``select_seconds`` (see
+                :class:`.SplitProgressExtras`). Also available to the fold-begin and fold-end messages.
+
+        Returns:
+            A context manager which returns the split at `index`.
+
+        Notes:
+            The default implementation logs using :attr:`logger` and the
+            :class:`~time_split.settings.log_split_progress` messages, with default log levels.
+
+        Examples:
+            Tracking concurrently processed folds.
+
+            >>> import asyncio
+            >>> from time_split import log_split_progress, split
+            >>> tracker = log_split_progress(
+            ...     split("1d", available=("2022-01-01", "2022-01-10"))
+            ... )
+            >>> async def evaluate(index):
+            ...     with tracker.track(index) as bounds:
+            ...         await asyncio.sleep(0)  # e.g. await fit_and_score(bounds)
+            ...         return bounds.mid.day
+            >>> async def main():
+            ...     return await asyncio.gather(*map(evaluate, range(len(tracker))))
+            >>> asyncio.run(main())
+            [8, 9]
+        """
+        from ._frontend import log_split_progress
+
+        return log_split_progress(self.splits, logger=self.logger).track(index, extra=extra)
+
+
+if _t.TYPE_CHECKING:
+    # Imported last, since _frontend imports this module. Runtime equivalents are defined at the top of the module.
+    from . import _frontend
+else:
+    # Must match _type_aliases.__all__; listed here to avoid importing pandas.
+    _LAZY_ALIASES = ("DatetimeIterable", "DatetimeTypes", "Filter", "GetMetrics", "Schedule", "Span", "TimedeltaTypes")
+
+    def __dir__() -> list[str]:
+        return sorted({*globals(), *_LAZY_ALIASES})
+
+    def __getattr__(name: str) -> _t.Any:
+        if name not in _LAZY_ALIASES:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+        from . import _type_aliases
+
+        aliases = {alias: getattr(_type_aliases, alias) for alias in _LAZY_ALIASES}
+        globals().update(aliases)
+        return aliases[name]
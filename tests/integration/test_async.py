@@ -0,0 +1,127 @@
+import asyncio
+from contextlib import aclosing
+
+import pandas as pd
+import pytest
+
+from time_split.integration.base import split_data, split_data_async
+from time_split.types import DatetimeIndexSplitterKwargs
+
+from ..conftest import SPLIT_DATA
+
+
+def _select(data, left, right):
+    return data[(left <= data) & (data < right)]
+
+
+class Client:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+
+    async def as_available(self, data):
+        await asyncio.sleep(0)
+        return data
+
+    async def select(self, data, left, right):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        return _select(data, left, right)
+
+
+async def _collect(folds, delay=0.0):
+    result = []
+    async for fold in folds:
+        await asyncio.sleep(delay)  # Simulate model evaluation.
+        result.append(fold)
+    return result
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+@pytest.mark.parametrize("sync", [False, True])
+def test_against_split_data(prefetch, sync):
+    client = Client()
+    kwargs = DatetimeIndexSplitterKwargs(schedule="1d", before="all")
+    expected = list(split_data(SPLIT_DATA, as_available=lambda data: data, select=_select, **kwargs))
+
+    folds = split_data_async(
+        SPLIT_DATA,
+        as_available=(lambda data: data) if sync else client.as_available,
+        select=_select if sync else client.select,
+        prefetch=prefetch,
+        **kwargs,
+    )
+    actual = asyncio.run(_collect(folds))
+
+    assert [fold.bounds for fold in actual] == [fold.bounds for fold in expected]
+    for left, right in zip(actual, expected, strict=True):
+        pd.testing.assert_index_equal(left.data, right.data)
+        pd.testing.assert_index_equal(left.future_data, right.future_data)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_prefetch(prefetch):
+    client = Client(delay=0.001)
+    folds = split_data_async(
+        SPLIT_DATA,
+        schedule="1d",
+        as_available=client.as_available,
+        select=client.select,
+        prefetch=prefetch,
+    )
+    asyncio.run(_collect(folds, delay=0.05))
+    assert client.max_in_flight == 2 * max(prefetch, 1)
+
+
+def test_cancel_on_close():
+    client = Client(delay=0.05)
+
+    async def main():
+        folds = split_data_async(
+            SPLIT_DATA, schedule="1d", as_available=client.as_available, select=client.select, prefetch=3
+        )
+        async with aclosing(folds):
+            async for _ in folds:
+                await asyncio.sleep(0.01)  # Prefetching starts.
+                break
+
+    asyncio.run(main())
+    assert client.cancelled > 0
+    assert client.in_flight == 0
+
+
+def test_bad_prefetch():
+    folds = split_data_async(SPLIT_DATA, schedule="1d", as_available=lambda data: data, select=_select, prefetch=-1)
+    with pytest.raises(ValueError, match="prefetch=-1"):
+        asyncio.run(_collect(folds))
+
+
+def test_log_progress(caplog):
+    client = Client()
+    folds = split_data_async(
+        SPLIT_DATA,
+        schedule="1d",
+        n_splits=2,
+        as_available=client.as_available,
+        select=client.select,
+        log_progress="test-async",
+    )
+    asyncio.run(_collect(folds, delay=0.01))
+
+    records = [record for record in caplog.records if record.name == "test-async"]
+    assert [(record.n, hasattr(record, "seconds")) for record in records] == [
+        (1, False),
+        (1, True),
+        (2, False),
+        (2, True),
+    ]
+    assert all(record.seconds >= 0.01 for record in records if hasattr(record, "seconds"))
@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+
+from time_split.integration.pandas import split_pandas
+from time_split.types import DatetimeIndexSplitterKwargs
+
+duckdb = pytest.importorskip("duckdb")
+
+from time_split.integration.duckdb import split_duckdb  # noqa: E402
+
+
+@pytest.fixture
+def df():
+    time = pd.date_range("2022-01-01", "2022-01-10", freq="h", inclusive="left")
+    return pd.DataFrame({"time": time, "value": range(len(time))})
+
+
+@pytest.mark.parametrize("source", ["parquet", "frame"])
+def test_duckdb(df, source, tmp_path):
+    if source == "parquet":
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "events.parquet"
+        df.to_parquet(path)
+        relation = duckdb.read_parquet(str(path))
+    else:
+        relation = duckdb.from_df(df)
+
+    kwargs = DatetimeIndexSplitterKwargs(schedule="1d", before="2d", after="12h")
+    expected = list(split_pandas(df, "time", **kwargs))
+    actual = list(split_duckdb(relation, "time", **kwargs))
+
+    assert [fold.bounds for fold in actual] == [fold.bounds for fold in expected]
+    for a, e in zip(actual, expected, strict=True):
+        assert a.data.order("time").df()["value"].tolist() == e.data["value"].tolist()
+        assert a.future_data.order("time").df()["value"].tolist() == e.future_data["value"].tolist()
+
+
+def test_empty(df):
+    relation = duckdb.from_df(df).filter("value < 0")
+    with pytest.raises(ValueError, match="No timestamps"):
+        next(iter(split_duckdb(relation, "time", schedule="1d")))
@@ -0,0 +1,53 @@
+import json
+
+import pandas as pd
+import pytest
+
+from time_split.integration.pandas import export_segments, read_segments, split_pandas
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def df():
+    time = pd.date_range("2022-01-01", "2022-01-20", freq="h", inclusive="left", tz="Europe/Stockholm")
+    return pd.DataFrame({"time": time, "value": range(len(time))}).sample(frac=1, random_state=2022)
+
+
+@pytest.mark.parametrize("time_column", ["time", None])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(before="all"),
+        dict(before="2d", after="12h", step=3),
+        dict(before="empty"),
+    ],
+)
+def test_export_segments(df, tmp_path, time_column, kwargs):
+    if time_column is None:
+        df = df.set_index("time")
+
+    expected = list(split_pandas(df, time_column, schedule="1d", **kwargs))
+    exported = export_segments(df, tmp_path, time_column, schedule="1d", **kwargs)
+    assert [fold.bounds for fold in exported] == [fold.bounds for fold in expected]
+
+    for i, e in enumerate(expected):
+        actual = read_segments(tmp_path, i)
+        assert actual.bounds == e.bounds
+        pd.testing.assert_frame_equal(actual.data.sort_values("value"), e.data.sort_values("value"))
+        pd.testing.assert_frame_equal(actual.future_data.sort_values("value"), e.future_data.sort_values("value"))
+
+    # Every row is written at most once.
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    values = pd.concat([pd.read_parquet(tmp_path / s["file"]) for s in manifest["segments"]])["value"]
+    assert values.is_unique
+    used = {file for fold in exported for file in fold.data + fold.future_data}
+    assert used == {s["file"] for s in manifest["segments"]}
+
+
+def test_read_out_of_range(df, tmp_path):
+    exported = export_segments(df, tmp_path, "time", schedule="1d", n_splits=2)
+    assert len(exported) == 2
+    assert read_segments(tmp_path, -1).bounds == exported[-1].bounds
+    with pytest.raises(IndexError):
+        read_segments(tmp_path, 2)
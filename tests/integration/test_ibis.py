@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+
+from time_split.integration.pandas import split_pandas
+from time_split.types import DatetimeIndexSplitterKwargs
+
+ibis = pytest.importorskip("ibis")
+
+from time_split.integration.ibis import split_ibis  # noqa: E402
+
+
+@pytest.fixture
+def df():
+    time = pd.date_range("2022-01-01", "2022-01-10", freq="h", inclusive="left")
+    return pd.DataFrame({"time": time, "value": range(len(time))})
+
+
+def test_ibis(df):
+    kwargs = DatetimeIndexSplitterKwargs(schedule="1d", before="2d", after="12h")
+    expected = list(split_pandas(df, "time", **kwargs))
+    actual = list(split_ibis(ibis.memtable(df), "time", **kwargs))
+
+    assert [fold.bounds for fold in actual] == [fold.bounds for fold in expected]
+    for a, e in zip(actual, expected, strict=True):
+        assert a.data.order_by("time").execute()["value"].tolist() == e.data["value"].tolist()
+        assert a.future_data.order_by("time").execute()["value"].tolist() == e.future_data["value"].tolist()
+
+
+def test_empty(df):
+    table = ibis.memtable(df)
+    with pytest.raises(ValueError, match="No timestamps"):
+        next(iter(split_ibis(table.filter(table.value < 0), "time", schedule="1d")))
@@ -1,11 +1,13 @@
 import logging
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from time_split import split
 from time_split._backend._process_available import process_available
-from time_split.integration.pandas import split_pandas
+from time_split.integration.pandas import _impl, split_pandas
+from time_split.integration.pandas._impl import _Indexer
 
 
 @pytest.mark.parametrize("typ", [pd.Series, pd.DataFrame])
@@ -76,3 +78,42 @@ def test_series_is_preserved():
 
     actual = process_available(available, expand_limits=False).available_as_index
     assert isinstance(actual, pd.Series)
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+@pytest.mark.parametrize("time_column", [None, "time"])
+def test_select_many(shuffle, time_column):
+    time = pd.date_range("2022", "2022-1-10", freq="h", tz="Europe/Stockholm").to_series()
+    time.iloc[[3, 17]] = pd.NaT
+    df = pd.DataFrame({"time": time.to_numpy(), "x": range(len(time))})
+    if shuffle:
+        df = df.sample(frac=1, random_state=2022)
+    if time_column is None:
+        df = df.set_index("time")
+
+    indexer = _Indexer(time_column)
+    splits = split("1d", available=(time.min(), time.max()), before="2d", after="12h")
+    ranges = [r for s in splits for r in ((s.start, s.mid), (s.mid, s.end))]
+
+    for (left, right), actual in zip(ranges, indexer.select_many(df, ranges), strict=True):
+        expected = df[pd.Series(indexer._get_time(df)).between(left, right, inclusive="left").to_numpy()]
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize("copy_on_write", [False, True])
+def test_select_many_copy(monkeypatch, copy_on_write):
+    monkeypatch.setattr(_impl, "_copy_on_write", lambda: copy_on_write)
+    df = pd.DataFrame({"x": range(24 * 9)}, index=pd.date_range("2022", "2022-1-10", freq="h", inclusive="left"))
+
+    folds = list(split_pandas(df, schedule="1d"))
+    assert [np.shares_memory(fold.data["x"].to_numpy(), df["x"].to_numpy()) for fold in folds] == [copy_on_write] * 2
+
+
+def test_select_many_used_by_split_data(monkeypatch):
+    calls = []
+    monkeypatch.setattr(_Indexer, "select", lambda *args: calls.append(args))
+
+    index = pd.date_range("2022", "2022-1-10", freq="h")
+    folds = list(split_pandas(pd.Series(range(len(index)), index=index), schedule="1d"))
+    assert calls == []
+    assert [len(fold.data) for fold in folds] == [7 * 24, 7 * 24]
@@ -6,6 +6,7 @@ import pytest
 
 from time_split import split
 from time_split.integration.polars import split_polars
+from time_split.integration.polars._impl import _Indexer
 
 
 @pytest.fixture
@@ -49,3 +50,19 @@ def test_polars(df, caplog):
 def test_bad_time(df):
     with pytest.raises(TypeError, match="'ints'"):
         list(split_polars(df, schedule="1d", time_column="ints", log_progress=False))
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_select_many(df, shuffle):
+    df = df.with_columns(
+        timestamp=pl.when(pl.col("ints").is_in([3, 17])).then(None).otherwise(pl.col("timestamp")),
+    )
+    if shuffle:
+        df = df.sample(fraction=1, shuffle=True, seed=2022)
+
+    indexer = _Indexer("timestamp")
+    splits = split("1d", available=(df["timestamp"].min(), df["timestamp"].max()), before="2d", after="12h")
+    ranges = [r for s in splits for r in ((s.start, s.mid), (s.mid, s.end))]
+
+    for (left, right), actual in zip(ranges, indexer.select_many(df, ranges), strict=True):
+        assert actual.equals(indexer.select(df, left, right))
@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from time_split import split
+from time_split.integration.pandas import scan_csv
+
+from ..conftest import SPLIT_DATA
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("scan-csv") / "data.csv.gz"
+    frame = pd.DataFrame(
+        {"value": range(len(SPLIT_DATA)), "time": SPLIT_DATA.to_series().sample(frac=1, random_state=1)}
+    )
+    frame.loc[frame.index[::1000], "time"] = pd.NaT
+    frame.to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize("chunksize", [999, 2**20])
+def test_scan(path, chunksize):
+    expected = pd.read_csv(path, parse_dates=["time"])["time"].dropna()
+
+    actual = scan_csv(path, "time", row_count_bin="6h", chunksize=chunksize)
+
+    assert actual.limits == (expected.min(), expected.max())
+    assert actual.n_rows == len(expected)
+    expected_counts = expected.dt.floor("6h").value_counts().sort_index()
+    pd.testing.assert_series_equal(actual.row_counts, expected_counts, check_freq=False)
+    assert split("1d", available=actual.limits) == split("1d", available=expected)
+
+
+def test_plot(path):
+    import matplotlib as mpl
+    from matplotlib import pyplot as plt
+
+    from time_split import plot
+
+    mpl.use("Agg")
+    result = scan_csv(path, "time", row_count_bin="6h")
+    ax = plot("1d", available=result.limits, row_count_bin=result.row_counts)
+    assert "#rows [bin: 6h]" in ax.get_legend_handles_labels()[1]
+    plt.close(ax.figure)  # type: ignore[arg-type]
+
+
+def test_no_row_counts(path):
+    assert scan_csv(path, "time").row_counts is None
+
+
+def test_no_timestamps(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("time,value\n,1\n")
+    with pytest.raises(ValueError, match="No valid timestamps"):
+        scan_csv(path, "time")
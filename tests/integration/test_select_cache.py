@@ -0,0 +1,116 @@
+import gc
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from time_split.integration.base import SelectCache, split_data
+from time_split.integration.pandas import split_pandas
+from time_split.integration.polars import split_polars
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"time": pd.date_range("2022", "2022-01-10", freq="h"), "x": 1.0})
+
+
+def _collect(folds):
+    return [(fold.data, fold.future_data) for fold in folds]
+
+
+def test_hits(df):
+    cache = SelectCache(max_bytes=2**20)
+    expected = _collect(split_pandas(df, "time", schedule="1d"))
+
+    for i in range(3):
+        actual = _collect(split_pandas(df, "time", schedule="1d", cache=cache))
+        for (data, future_data), (expected_data, expected_future_data) in zip(actual, expected, strict=True):
+            pd.testing.assert_frame_equal(data, expected_data)
+            pd.testing.assert_frame_equal(future_data, expected_future_data)
+
+        info = cache.info()
+        assert info.misses == 4
+        assert info.hits == 4 * i
+
+    assert info.current_bytes == sum(data.memory_usage().sum() + future.memory_usage().sum() for data, future in actual)
+
+
+def test_different_time_column_is_not_shared(df):
+    cache = SelectCache(max_bytes=2**20)
+    df = df.set_index("time", drop=False)
+    list(split_pandas(df, "time", schedule="1d", cache=cache))
+    list(split_pandas(df, None, schedule="1d", cache=cache))
+    assert cache.info().hits == 0
+
+
+class _Selector:
+    def head(self, data, _left, _right):
+        return data.head(1)
+
+    def tail(self, data, _left, _right):
+        return data.tail(1)
+
+
+def test_methods_of_same_instance_are_not_shared(df):
+    cache = SelectCache(max_bytes=2**20)
+    selector = _Selector()
+    left, right = df["time"].iloc[0], df["time"].iloc[-1]
+
+    pd.testing.assert_frame_equal(cache.wrap(selector.head)(df, left, right), df.head(1))
+    pd.testing.assert_frame_equal(cache.wrap(selector.tail)(df, left, right), df.tail(1))
+    pd.testing.assert_frame_equal(cache.wrap(selector.head)(df, left, right), df.head(1))
+    assert cache.info().hits == 1
+
+
+def test_budget(df):
+    size = df.iloc[:24].memory_usage().sum()
+    cache = SelectCache(max_bytes=int(size * 2.5), sizeof=lambda frame: frame.memory_usage().sum())
+
+    for _ in range(2):
+        list(split_pandas(df, "time", schedule="1d", before="1d", cache=cache))
+
+    info = cache.info()
+    assert info.entries == 2
+    assert info.current_bytes <= info.max_bytes
+    assert isinstance(info.current_bytes, int)
+
+
+def test_garbage_collected_data_is_evicted(df):
+    cache = SelectCache(max_bytes=2**20)
+    list(split_pandas(df.copy(), "time", schedule="1d", cache=cache))
+    gc.collect()
+
+    info = cache.info()
+    assert info.entries == 0
+    assert info.current_bytes == 0
+
+
+def test_not_weakref_able():
+    data = list(pd.date_range("2022", "2022-01-10", freq="h"))
+    cache = SelectCache(max_bytes=2**20)
+
+    for _ in range(2):
+        list(
+            split_data(
+                data,
+                as_available=lambda d: d,
+                select=lambda d, left, right: [t for t in d if left <= t < right],
+                schedule="1d",
+                cache=cache,
+            )
+        )
+
+    assert cache.info() == (0, 8, 0, 0, 2**20)
+
+
+def test_polars(df):
+    cache = SelectCache(max_bytes=2**20)
+    data = pl.from_pandas(df)
+    for _ in range(2):
+        list(split_polars(data, "time", schedule="1d", cache=cache))
+    assert cache.info().hit_rate == 0.5
+
+
+def test_bad_budget():
+    with pytest.raises(ValueError, match="positive"):
+        SelectCache(0)
@@ -0,0 +1,109 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from time_split import split
+from time_split.integration.sql import split_sql
+
+pa = pytest.importorskip("pyarrow")
+
+TIME = pd.date_range("2022-01-01", "2022-01-10", freq="h", inclusive="left")
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "events.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE events (time TEXT, value INTEGER)")
+        connection.executemany("INSERT INTO events VALUES (?, ?)", [(str(t), i) for i, t in enumerate(TIME)])
+    return path
+
+
+@pytest.mark.parametrize("paramstyle", ["qmark", "named", "numeric"])
+@pytest.mark.parametrize("source", ["events", "SELECT * FROM events WHERE value >= 0"])
+def test_sqlite(path, paramstyle, source):
+    connections = []
+
+    def connect():
+        connections.append(sqlite3.connect(path))
+        return connections[-1]
+
+    expected = split("1d", available=TIME, before="2d")
+    folds = list(split_sql(connect, source, "time", schedule="1d", before="2d", to_param=str, paramstyle=paramstyle))
+    assert [fold.bounds for fold in folds] == expected
+    assert len(connections) == 1
+
+    with pytest.raises(RuntimeError, match="closed"):
+        folds[0].data.to_pandas()
+
+
+def test_fetch(path):
+    for fold in split_sql(lambda: sqlite3.connect(path), "events", "time", schedule="1d", to_param=str):
+        start, mid, end = fold.bounds
+        df = fold.data.to_pandas()
+        assert list(df.columns) == ["time", "value"]
+        assert df["value"].tolist() == [i for i, t in enumerate(TIME) if start <= t < mid]
+
+        batches = list(fold.future_data.iter_pandas(batch_size=5))
+        assert [len(b) for b in batches] == [5, 5, 5, 5, 4]
+        assert pd.concat(batches, ignore_index=True)["value"].tolist() == [
+            i for i, t in enumerate(TIME) if mid <= t < end
+        ]
+
+        table = fold.future_data.to_arrow()
+        assert table.column_names == ["time", "value"]
+        assert table.num_rows == 24
+        assert [b.num_rows for b in fold.future_data.iter_arrow(batch_size=10)] == [10, 10, 4]
+
+
+def test_duckdb():
+    duckdb = pytest.importorskip("duckdb")
+
+    connection = duckdb.connect()
+    connection.register("source", pd.DataFrame({"time": TIME, "value": range(len(TIME))}))
+    connection.execute("CREATE TABLE events AS SELECT * FROM source")
+
+    folds = list(split_sql(connection, "events", "time", schedule="1d"))
+    assert [fold.bounds for fold in folds] == split("1d", available=TIME)
+    assert connection.execute("SELECT COUNT(*) FROM events").fetchone() == (len(TIME),)
+
+
+def test_borrowed_connection(path):
+    connection = sqlite3.connect(path)
+    folds = list(split_sql(connection, "events", "time", schedule="1d", to_param=str))
+    assert connection.execute("SELECT COUNT(*) FROM events").fetchone() == (len(TIME),)
+
+    with pytest.raises(RuntimeError, match="closed"):
+        folds[0].data.to_pandas()
+
+    list(split_sql(lambda: connection, "events", "time", schedule="1d", to_param=str))
+    with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+        connection.execute("SELECT 1")
+
+
+def test_iter_arrow_schema(path):
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE events SET value = NULL WHERE value >= 5")
+
+    schedule = [TIME[10], TIME[20]]
+    for fold in split_sql(
+        lambda: sqlite3.connect(path), "events", "time", schedule=schedule, before="all", to_param=str
+    ):
+        batches = list(fold.data.iter_arrow(batch_size=5))
+    assert [b.schema for b in batches] == [batches[0].schema] * 2
+    assert batches[1].column("value").null_count == 5
+    assert pa.Table.from_batches(batches).num_rows == 10
+
+
+def test_empty(path):
+    with sqlite3.connect(path) as connection:
+        connection.execute("DELETE FROM events")
+
+    with pytest.raises(ValueError, match="No timestamps"):
+        next(split_sql(lambda: sqlite3.connect(path), "events", "time", schedule="1d"))
+
+
+def test_bad_paramstyle(path):
+    with pytest.raises(ValueError, match="paramstyle"):
+        next(split_sql(lambda: sqlite3.connect(path), "events", "time", schedule="1d", paramstyle="bad"))  # type: ignore[arg-type]
@@ -0,0 +1,77 @@
+import itertools
+
+import pandas as pd
+import pytest
+
+from time_split.integration.base import split_stream
+from time_split.integration.pandas import split_pandas, split_pandas_stream
+
+from ..conftest import DATA_CASES, SPLIT_DATA
+
+FRAME = pd.DataFrame({"time": SPLIT_DATA, "value": range(len(SPLIT_DATA))})
+BATCHES = [batch for _, batch in FRAME.groupby(FRAME["time"].dt.floor("3h"))]
+
+
+@pytest.mark.parametrize("kwargs", [kwargs for kwargs, _ in DATA_CASES[0]])
+@pytest.mark.parametrize("emit_partial", [False, True])
+def test_against_split_pandas(kwargs, emit_partial):
+    expected = list(split_pandas(FRAME, "time", **kwargs))
+    if not emit_partial:
+        expected = [fold for fold in expected if fold.bounds.end <= SPLIT_DATA.max()]
+
+    actual = list(
+        split_pandas_stream(BATCHES, "time", available=SPLIT_DATA[[0, -1]], emit_partial=emit_partial, **kwargs)
+    )
+
+    assert [fold.bounds for fold in actual] == [fold.bounds for fold in expected]
+    for left, right in zip(actual, expected, strict=True):
+        pd.testing.assert_frame_equal(left.data, right.data)
+        pd.testing.assert_frame_equal(left.future_data, right.future_data)
+
+
+def test_index():
+    batches = [batch.set_index("time")["value"] for batch in BATCHES]
+    actual = list(split_pandas_stream(batches, schedule="1d", before="2d", available=SPLIT_DATA[[0, -1]]))
+    expected = list(split_pandas(FRAME.set_index("time")["value"], schedule="1d", before="2d"))
+    assert len(actual) == len(expected) - 1
+
+    for left, right in zip(actual, expected, strict=False):
+        pd.testing.assert_series_equal(left.future_data, right.future_data)
+
+
+def test_bounded_memory():
+    concatenated = []
+
+    def concat(batches):
+        concatenated.append(len(batches))
+        return pd.concat(batches)
+
+    folds = split_stream(
+        BATCHES,
+        schedule="1d",
+        before="1d",
+        available=SPLIT_DATA[[0, -1]],
+        as_available=lambda batch: batch["time"],
+        select=lambda data, left, right: data[data["time"].between(left, right, inclusive="left")],
+        concat=concat,
+    )
+    assert len(list(folds)) == 11
+    assert max(concatenated) <= 2 * 24 // 3  # Two days of three-hour batches.
+
+
+def test_emits_early_and_stops():
+    consumed = []
+
+    def batches():
+        for day in itertools.count():
+            consumed.append(day)
+            yield pd.DataFrame({"time": [pd.Timestamp("2022-01-01") + pd.Timedelta(days=day)]})
+
+    folds = split_pandas_stream(
+        batches(), "time", schedule=["2022-01-01", "2022-01-03", "2022-01-05"], before=1, after=1
+    )
+    assert next(folds).bounds.end == pd.Timestamp("2022-01-05")
+    assert consumed == [0, 1, 2, 3, 4]
+    with pytest.raises(StopIteration):
+        next(folds)
+    assert consumed == [0, 1, 2, 3, 4]
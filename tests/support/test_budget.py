@@ -0,0 +1,58 @@
+import pandas as pd
+import pytest
+
+from time_split import split
+from time_split.support import fit_to_budget, fold_weight
+
+AVAILABLE = pd.date_range("2022-01-01", "2022-03-01", freq="10min")
+
+
+def is_odd(_start, mid, _end):
+    return mid.day % 2 == 1
+
+
+def _brute_force(budget, cost, **kwargs):
+    n_folds = len(split(**kwargs, available=AVAILABLE, ignore_filters=True))
+
+    best: dict[int, int] = {}  # {n_folds: step}
+    for step in range(1, n_folds + 1):
+        for n_splits in range(n_folds + 1):
+            splits = split(**kwargs, available=AVAILABLE, step=step, n_splits=n_splits)
+            seconds = sum(map(cost, fold_weight(splits, unit="rows", available=AVAILABLE)))
+            if splits and seconds <= budget:
+                best.setdefault(len(splits), step)
+    return max(best.items())
+
+
+@pytest.mark.parametrize("budget", [150, 300, 1000])
+@pytest.mark.parametrize("before", ["all", "7d"])
+@pytest.mark.parametrize("filter", [None, is_odd])
+def test_against_brute_force(budget, before, filter):
+    def cost(counts):
+        return 0.01 * counts.data + 0.1 * counts.future_data
+
+    kwargs = dict(schedule="5d", before=before, filter=filter)
+    actual = fit_to_budget(budget=budget, cost=cost, **kwargs, available=AVAILABLE)
+
+    assert (actual.n_folds, actual.step) == _brute_force(budget, cost, **kwargs)
+    assert actual.seconds <= budget
+
+    splits = split(**kwargs, available=AVAILABLE, step=actual.step, n_splits=actual.n_splits)
+    assert len(splits) == actual.n_folds
+    assert actual.seconds == pytest.approx(sum(map(cost, fold_weight(splits, unit="rows", available=AVAILABLE))))
+
+
+def test_timedelta_budget():
+    seconds = fit_to_budget("7d", 240, cost=0.01, available=AVAILABLE)
+    assert fit_to_budget("7d", "4m", cost=0.01, available=AVAILABLE) == seconds
+    assert fit_to_budget("7d", pd.Timedelta(minutes=4), cost=0.01, available=AVAILABLE) == seconds
+
+
+def test_no_fit():
+    with pytest.raises(ValueError, match="No fold fits"):
+        fit_to_budget("7d", 1, cost=0.01, available=AVAILABLE)
+
+
+def test_limits_tuple():
+    with pytest.raises(ValueError, match="Cannot count rows using limits"):
+        fit_to_budget("1d", 100, cost=0.01, available=("2022-01-01", "2022-01-10"))
@@ -0,0 +1,115 @@
+import pandas as pd
+import pytest
+
+from time_split import log_split_progress, split
+from time_split.integration.pandas import split_pandas
+from time_split.support import MetricsCollector
+
+AVAILABLE = ("2022-01-01", "2022-01-10")
+
+
+def _metrics(mid):
+    if mid.day == 8:
+        return {"rmse": {"test": 0.5}}
+    if mid.day == 9:
+        return pd.DataFrame({"rmse": [0.1, 0.2]}, index=["train", "test"])
+    return "pre-formatted"
+
+
+def test_columns():
+    collector = MetricsCollector()
+    splits = split("1d", before="5d", available=AVAILABLE)
+    for _ in log_split_progress(splits, get_metrics=_metrics, collector=collector):
+        pass
+
+    assert len(collector) == len(splits) == 4
+    actual = collector.to_pandas()
+    assert list(actual.columns) == [
+        "n",
+        "start",
+        "mid",
+        "end",
+        "seconds",
+        "metrics",
+        "metrics.rmse.test",
+        "metrics.rmse.train",
+    ]
+    assert actual["n"].tolist() == [1, 2, 3, 4]
+    assert actual["mid"].tolist() == [s.mid for s in splits]
+    assert actual["metrics"].tolist()[:2] == ["pre-formatted", "pre-formatted"]
+    assert actual["metrics"].isna().tolist() == [False, False, True, True]
+    assert actual["metrics.rmse.test"].tolist()[2:] == [0.5, 0.2]
+    assert actual["metrics.rmse.train"].isna().tolist() == [True, True, True, False]
+    assert collector.to_dict()["n"] == [1, 2, 3, 4]
+
+
+def test_integration():
+    df = pd.DataFrame({"time": pd.date_range(*AVAILABLE, freq="h")})
+    collector = MetricsCollector()
+    folds = list(split_pandas(df, "time", schedule="1d", before="2d", log_progress={"collector": collector}))
+
+    actual = collector.to_pandas()
+    assert actual["data_rows"].tolist() == [len(fold.data) for fold in folds]
+    assert actual["future_data_rows"].tolist() == [len(fold.future_data) for fold in folds]
+    assert (actual["select_seconds"] >= 0).all()
+
+
+def test_to_polars():
+    pytest.importorskip("polars")
+
+    collector = MetricsCollector()
+    for _ in log_split_progress(split("1d", available=AVAILABLE), collector=collector):
+        pass
+
+    actual = collector.to_polars()
+    assert actual.columns == ["n", "start", "mid", "end", "seconds"]
+    assert actual.height == len(collector)
+
+
+def test_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    path = tmp_path / "metrics"
+    collector = MetricsCollector(path, flush_every=3)
+    splits = split("1d", before="5d", available=AVAILABLE)
+    for i, _ in enumerate(log_split_progress(splits, get_metrics=_metrics, collector=collector), start=1):
+        if i == 4:
+            # Readable while iterating; the first three folds have finished.
+            assert MetricsCollector.read_parquet(path)["n"].tolist() == [1, 2, 3]
+
+    # The last fold flushes remaining rows.
+    expected_files = ["part-00000.parquet", "part-00001.parquet"]
+    assert sorted(p.name for p in path.iterdir()) == expected_files
+    collector.flush()  # Nothing to write.
+    assert sorted(p.name for p in path.iterdir()) == expected_files
+
+    actual = MetricsCollector.read_parquet(path)
+    expected = collector.to_pandas()
+    assert list(actual.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(actual.drop(columns="metrics"), expected.drop(columns="metrics"), check_dtype=False)
+    assert actual["metrics"].isna().tolist() == expected["metrics"].isna().tolist()
+
+    with pytest.raises(FileExistsError):
+        MetricsCollector(path)
+
+
+def test_flush_on_exit(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    path = tmp_path / "metrics"
+    splits = split("1d", before="5d", available=AVAILABLE)
+    with MetricsCollector(path, flush_every=3) as collector:
+        progress = log_split_progress(splits, collector=collector)
+        for index in [0, 3, 1, 2]:  # Final fold is not the last to finish.
+            with progress.track(index):
+                pass
+        assert MetricsCollector.read_parquet(path)["n"].tolist() == [1, 4]
+
+    assert MetricsCollector.read_parquet(path)["n"].tolist() == [1, 4, 2, 3]
+
+
+def test_bad_args(tmp_path):
+    with pytest.raises(ValueError, match="flush_every"):
+        MetricsCollector(flush_every=0)
+    with pytest.raises(FileNotFoundError):
+        MetricsCollector.read_parquet(tmp_path)
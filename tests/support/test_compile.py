@@ -0,0 +1,74 @@
+import copy
+import pickle
+
+import pandas as pd
+import pytest
+
+from time_split.support import DatetimeIndexSplitter
+from time_split.support.types import SplitterPlan
+
+from ..conftest import DATA_CASES, SPLIT_DATA
+
+
+@pytest.mark.parametrize("kwargs, expected", *DATA_CASES)
+def test_reuse(kwargs, expected):
+    plan = DatetimeIndexSplitter(**kwargs).compile()
+    assert isinstance(plan, SplitterPlan)
+
+    expected = [tuple(map(pd.Timestamp, bounds)) for bounds in expected]
+    for _ in range(2):
+        assert plan.get_splits(SPLIT_DATA) == expected
+
+
+def test_parsed():
+    plan = DatetimeIndexSplitter("1d", before="3d", after=2, filter="builtins.all").compile()
+    assert plan.schedule == pd.Timedelta(days=1)
+    assert plan.before == pd.Timedelta(days=3)
+    assert plan.after == 2
+    assert plan.filter is all
+
+
+def test_iterable_schedule():
+    schedule = pd.date_range("2022-01-02", periods=5, freq="1D")
+    plan = DatetimeIndexSplitter(iter(schedule), before=1).compile()
+    assert plan.get_splits() == plan.get_splits()
+    assert len(plan.get_splits()) == 3
+
+
+def test_immutable():
+    plan = DatetimeIndexSplitter("1d").compile()
+    with pytest.raises(AttributeError, match="immutable"):
+        plan.schedule = "2d"
+
+
+def test_negative_schedule():
+    with pytest.raises(ValueError, match="greater than zero"):
+        DatetimeIndexSplitter("-1d").compile()
+
+
+def test_unsorted_schedule():
+    plan = DatetimeIndexSplitter(["2022-01-03", "2022-01-01", "2022-01-02"], before=1).compile()
+    with pytest.raises(ValueError, match="sorted"):
+        plan.get_splits()
+
+
+def _keep_odd_days(_start, mid, _end):
+    return mid.day % 2 == 1
+
+
+def _copy(obj, how):
+    return pickle.loads(pickle.dumps(obj)) if how == "pickle" else copy.deepcopy(obj)  # noqa: S301
+
+
+@pytest.mark.parametrize("how", ["pickle", "deepcopy"])
+def test_copy_after_split(how):
+    splitter = DatetimeIndexSplitter("1d", before="3d", filter=_keep_odd_days)
+    expected = splitter.get_splits(SPLIT_DATA)  # Caches the plan.
+
+    actual = _copy(splitter, how)
+    assert actual == splitter
+    assert actual.get_splits(SPLIT_DATA) == expected
+
+    plan = _copy(splitter.compile(), how)
+    assert plan.filter is _keep_odd_days
+    assert plan.get_splits(SPLIT_DATA) == expected
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from time_split import split
+from time_split.support import split_grouped
+from time_split.types import BalancedRows
+
+from ..conftest import DATA_CASES
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(2019_05_11)
+    time = pd.date_range("2022-01-01", "2022-01-20", freq="h")
+    frames = []
+    for group in range(25):
+        start, stop = sorted(rng.choice(len(time), size=2, replace=False))
+        frames.append(pd.DataFrame({"group": f"g{group % 20}", "time": time[start : stop + 1]}))
+    return pd.concat(frames, ignore_index=True).sample(frac=1, random_state=rng)
+
+
+@pytest.mark.parametrize("kwargs", [kwargs for kwargs, _ in DATA_CASES[0]])
+def test_against_split(data, kwargs):
+    actual = split_grouped(data, "group", "time", errors="ignore", **kwargs)
+    assert actual.columns.tolist() == ["group", "fold", "start", "mid", "end"]
+
+    for group, time in data.groupby("group")["time"]:
+        try:
+            expected = split(**kwargs, available=time)
+        except ValueError:
+            expected = []
+
+        rows = actual[actual["group"] == group]
+        assert rows["fold"].tolist() == list(range(len(expected)))
+        assert list(rows[["start", "mid", "end"]].itertuples(index=False, name=None)) == expected
+
+
+def test_index_and_tz(data):
+    data = data.set_index("time").tz_localize("Europe/Stockholm")
+    actual = split_grouped(data, "group", schedule="1d", before="all", errors="ignore")
+    assert str(actual["mid"].dtype) == str(data.index.dtype)
+
+
+def test_raise():
+    data = pd.DataFrame({"group": ["a", "a", "b"], "time": pd.to_datetime(["2022-01-01", "2022-01-05", "2022-01-03"])})
+    with pytest.raises(ValueError, match="Cannot split group group='b'"):
+        split_grouped(data, "group", "time", schedule="1d", before=1)
+
+    actual = split_grouped(data, "group", "time", schedule="1d", before=1, errors="ignore")
+    assert set(actual["group"]) == {"a"}
+
+
+def test_bad_errors():
+    with pytest.raises(ValueError, match="Bad errors='warn'"):
+        split_grouped(pd.DataFrame(), "group", schedule="1d", errors="warn")  # type: ignore[arg-type]
+
+
+def test_balanced_rows():
+    rng = np.random.default_rng(2019_05_11)
+    hours = pd.date_range("2022-01-01", "2022-01-31", freq="h")
+    a = np.sort(rng.choice(hours, size=500))
+    b = np.sort(rng.choice(hours, size=500))
+    b[[0, -1]] = a[[0, -1]]  # Same limits as group a
+    data = pd.DataFrame({"group": ["a"] * len(a) + ["b"] * len(b), "time": np.concatenate([a, b])})
+
+    actual = split_grouped(data, "group", "time", schedule=BalancedRows(3), before="all")
+
+    for group, time in [("a", a), ("b", b)]:
+        expected = split(BalancedRows(3), before="all", available=pd.Series(time))
+        assert len(expected) == 2
+        rows = actual[actual["group"] == group]
+        assert list(rows[["start", "mid", "end"]].itertuples(index=False, name=None)) == list(map(tuple, expected))
@@ -0,0 +1,69 @@
+import json
+
+import pandas as pd
+import pytest
+
+from time_split import settings, split
+from time_split.support import read_manifest, write_manifest
+from time_split.types import DatetimeIndexSplitterKwargs
+
+
+@pytest.fixture(params=[".json", ".parquet"])
+def suffix(request):
+    if request.param == ".parquet":
+        pytest.importorskip("pyarrow")
+    return request.param
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Stockholm"])
+def test_round_trip(tmp_path, suffix, tz):
+    available = pd.date_range("2022-01-01", "2022-02-01", freq="h", tz=tz)
+    kwargs = DatetimeIndexSplitterKwargs(schedule="0 3 * * MON,FRI", before="5d", after="2d", step=2)
+    expected = split(**kwargs, available=available)
+
+    path = tmp_path / f"manifest{suffix}"
+    written = write_manifest(path, available=available, **kwargs)
+    assert written.splits == expected
+
+    actual = read_manifest(path)
+    assert actual == written
+    assert actual.splits == expected
+    assert all(ts.tz == expected[0].mid.tz for bounds in actual.splits for ts in bounds)
+    assert actual.config["schedule"] == "0 3 * * MON,FRI"
+    assert actual.config["step"] == 2
+    assert actual.config["available"] == [available[0].isoformat(), available[-1].isoformat()]
+
+
+def test_explicit_schedule(tmp_path, suffix):
+    schedule = ["2022-01-03", "2022-01-05", "2022-01-09"]
+    path = tmp_path / f"manifest{suffix}"
+    written = write_manifest(path, schedule=schedule, before=1)
+    assert written.config["schedule"] == [pd.Timestamp(s).isoformat() for s in schedule]
+    assert written.config["available"] is None
+    assert read_manifest(path).splits == split(schedule, before=1)
+
+
+def test_settings_match(tmp_path, monkeypatch):
+    manifest = write_manifest(tmp_path / "manifest.json", schedule="1d", available=("2022-01-01", "2022-01-10"))
+    assert read_manifest(tmp_path / "manifest.json").settings_match()
+
+    monkeypatch.setattr(settings.misc, "round_limits", not settings.misc.round_limits)
+    assert not manifest.settings_match()
+
+
+def test_bad_suffix(tmp_path):
+    with pytest.raises(ValueError, match="suffix"):
+        write_manifest(tmp_path / "manifest.csv", schedule="1d", available=("2022-01-01", "2022-01-10"))
+
+
+def test_bad_file(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"splits": []}))
+    with pytest.raises(ValueError, match="Not a manifest"):
+        read_manifest(path)
+
+    write_manifest(path, schedule="1d", available=("2022-01-01", "2022-01-10"))
+    content = json.loads(path.read_text())
+    path.write_text(json.dumps({**content, "manifest_version": 999}))
+    with pytest.raises(ValueError, match="version 999 is not supported"):
+        read_manifest(path)
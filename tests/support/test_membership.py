@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from time_split import split
+from time_split.support import FoldIndex, fold_membership
+from time_split.types import DatetimeSplitBounds
+
+from ..conftest import DATA_CASES
+
+
+def _brute_force(splits, time):
+    data = np.column_stack([time.between(s.start, s.mid, inclusive="left") for s in splits])
+    future_data = np.column_stack([time.between(s.mid, s.end, inclusive="left") for s in splits])
+    return data, future_data
+
+
+@pytest.mark.parametrize("kwargs", [kwargs for kwargs, _ in DATA_CASES[0]])
+@pytest.mark.parametrize("step", [1, 2, -1])
+def test_against_brute_force(kwargs, step):
+    rng = np.random.default_rng(2019_05_11)
+    time = pd.Series(pd.date_range("2022-01-01", "2022-01-13 23:00:00", freq="17min")).sample(frac=1, random_state=rng)
+    splits = split(**kwargs, step=step, available=time)
+
+    actual = fold_membership(splits, available=time)
+
+    data, future_data = _brute_force(splits, time)
+    np.testing.assert_array_equal(actual.data.to_dense(), data)
+    np.testing.assert_array_equal(actual.future_data.to_dense(), future_data)
+    assert actual.data.shape == (len(time), len(splits))
+
+
+def test_to_scipy():
+    time = pd.date_range("2022", "2022-01-10", freq="h", tz="utc")
+    splits = split("1d", before="all", available=time)
+
+    actual = fold_membership(splits, available=time).data.to_scipy()
+    assert actual.nnz == sum(len(time[(s.start <= time) & (time < s.mid)]) for s in splits)
+
+
+def test_not_monotonic():
+    splits = [
+        DatetimeSplitBounds(*map(pd.Timestamp, ["2022-01-02", "2022-01-03", "2022-01-04"])),
+        DatetimeSplitBounds(*map(pd.Timestamp, ["2022-01-01", "2022-01-04", "2022-01-05"])),
+    ]
+    with pytest.raises(ValueError, match="'start' must be non-decreasing"):
+        fold_membership(splits, available=["2022-01-01"])
+
+
+class TestFoldIndex:
+    @pytest.fixture
+    def index(self):
+        return FoldIndex(split("1d", before="2d", after="2d", available=("2022-01-01", "2022-01-07")))
+
+    @pytest.mark.parametrize(
+        "which, expected",
+        [
+            ("data", [[2], [], [], [0]]),
+            ("future_data", [[0, 1], [1, 2], [], []]),
+        ],
+    )
+    def test_query(self, index, which, expected):
+        timestamps = ["2022-01-04 12:00", "2022-01-05 12:00", "2022-01-10", "2022-01-01"]
+        actual = index.query(timestamps, which=which)
+        assert [actual.folds(i).tolist() for i in range(len(timestamps))] == expected
+
+    def test_reversed(self):
+        splits = split("1d", before="2d", after="2d", step=-1, available=("2022-01-01", "2022-01-07"))
+        actual = FoldIndex(splits).query(["2022-01-04 12:00"], which="future_data")
+        assert sorted(actual.folds(0).tolist()) == [1, 2]
+
+    def test_bad_which(self, index):
+        with pytest.raises(ValueError, match="Bad which='train'"):
+            index.query(["2022-01-04"], which="train")
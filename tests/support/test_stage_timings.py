@@ -0,0 +1,80 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from time_split import split
+from time_split.integration.pandas import split_pandas
+from time_split.support import record_stages
+
+AVAILABLE = ("2022-01-01", "2022-02-01")
+
+
+def test_split():
+    with record_stages() as timings:
+        split("0 0 * * *", available=AVAILABLE, step=2)
+
+    actual = timings.to_dict()
+    assert list(actual) == [
+        "materialize_schedule",
+        "process_available",
+        "expand_limits",
+        "compute_bounds",
+        "apply_filters",
+    ]
+    assert all(t["calls"] == 1 for t in actual.values())
+    assert actual["materialize_schedule"]["seconds"] >= actual["process_available"]["seconds"]
+
+
+@pytest.mark.parametrize("time_column", ["time", None])
+def test_integration(time_column):
+    df = pd.DataFrame({"time": pd.date_range(*AVAILABLE, freq="h")})
+    if time_column is None:
+        df = df.set_index("time")
+
+    with record_stages() as timings:
+        n_folds = sum(1 for _ in split_pandas(df, time_column, schedule="1d"))
+
+    actual = timings.to_pandas()
+    assert actual.index.name == "stage"
+    assert actual.loc["as_available", "calls"] == 1
+    assert actual.loc["select_fold", "calls"] == n_folds
+
+
+def test_disabled_outside_block():
+    with record_stages() as timings:
+        pass
+    split("1d", available=AVAILABLE)
+
+    assert timings.to_dict() == {}
+
+
+def test_nested():
+    with record_stages() as outer:
+        split("1d", available=AVAILABLE)
+        with record_stages() as inner:
+            split("1d", available=AVAILABLE)
+        split("1d", available=AVAILABLE)
+
+    assert outer.to_dict()["compute_bounds"]["calls"] == 2
+    assert inner.to_dict()["compute_bounds"]["calls"] == 1
+
+
+def test_other_threads_not_recorded():
+    with record_stages() as timings, ThreadPoolExecutor(1) as executor:
+        executor.submit(split, "1d", available=AVAILABLE).result()
+
+    assert timings.to_dict() == {}
+
+
+def test_log(caplog):
+    with record_stages() as timings:
+        split("1d", available=AVAILABLE)
+
+    with caplog.at_level(logging.DEBUG, logger="time_split"):
+        timings.log()
+
+    (record,) = caplog.records
+    assert record.getMessage().startswith("Stage timings: materialize_schedule=")
+    assert record.stage_timings == timings.to_dict()
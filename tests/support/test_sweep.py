@@ -0,0 +1,52 @@
+from itertools import product
+from typing import Any
+
+import pytest
+
+from time_split import settings, split
+from time_split.support import split_sweep
+
+from ..conftest import SPLIT_DATA
+
+GRID: dict[str, list[Any]] = dict(before=["5d", 1, "all"], after=["1d", 2, "all"], n_splits=[0, 2], step=[1, -2])
+
+
+def is_odd(_start, mid, _end):
+    return mid.day % 2 == 1
+
+
+@pytest.mark.parametrize("schedule", ["68h", "0 0 * * MON,FRI", ["2022-01-03", "2022-01-07", "2022-01-08"]])
+@pytest.mark.parametrize("snap_to_end", [True, False])
+def test_against_split(monkeypatch, schedule, snap_to_end):
+    monkeypatch.setattr(settings.misc, "snap_to_end", snap_to_end)
+    actual = split_sweep(schedule, GRID, available=SPLIT_DATA, errors="ignore")
+    assert actual.columns.tolist() == [*GRID, "fold", "start", "mid", "end"]
+
+    groups = dict(list(actual.groupby(list(GRID), sort=False)))
+    for combination in product(*GRID.values()):
+        kwargs = dict(zip(GRID, combination, strict=True))
+        try:
+            expected = split(schedule, **kwargs, available=SPLIT_DATA)
+        except ValueError:
+            assert combination not in groups
+            continue
+
+        rows = groups[combination]
+        assert rows["fold"].tolist() == list(range(len(expected)))
+        assert list(rows[["start", "mid", "end"]].itertuples(index=False, name=None)) == expected
+
+
+def test_filter():
+    actual = split_sweep("1d", dict(filter=[None, is_odd]), available=SPLIT_DATA)
+    assert len(actual[actual["filter"].isna()]) == len(split("1d", available=SPLIT_DATA))
+    assert actual.loc[actual["filter"].notna(), "mid"].dt.day.map(lambda day: day % 2 == 1).all()
+
+
+def test_raise():
+    with pytest.raises(ValueError, match=r"Cannot split combination \{'before': '30d'\}"):
+        split_sweep("1d", dict(before=["1d", "30d"]), available=SPLIT_DATA)
+
+
+def test_unknown_parameter():
+    with pytest.raises(ValueError, match=r"Unknown grid parameters: \['schedule'\]"):
+        split_sweep("1d", dict(schedule=["1d"]))
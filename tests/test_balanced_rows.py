@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from time_split import settings, split
+from time_split.support import DatetimeIndexSplitter
+from time_split.types import BalancedRows, DatetimeIndexSplitterKwargs
+
+
+@pytest.fixture
+def available():
+    # Seasonal data; far more rows in the summer.
+    rng = np.random.default_rng(2019_05_11)
+    hours = pd.date_range("2022-01-01", "2022-12-31 23:00", freq="h")
+    weights = 1.5 + np.sin(np.linspace(-np.pi / 2, 3 * np.pi / 2, len(hours)))
+    return pd.Series(rng.choice(hours, size=20_000, p=weights / weights.sum()))
+
+
+@pytest.mark.parametrize("n", [2, 4, 12])
+@pytest.mark.parametrize("tz", [None, "Asia/Tokyo"])
+def test_balanced(available, n, tz):
+    available = available.dt.tz_localize(tz)
+    splits = split(BalancedRows(n), before="all", available=available, expand_limits=False)
+
+    assert len(splits) == n - 1  # No data before the first interval.
+    counts = [available.between(mid, end, inclusive="left").sum() for _, mid, end in splits]
+    expected = len(available) // n
+    assert all(abs(count - expected) <= expected / 100 for count in counts)  # Duplicate timestamps are not split.
+    assert splits[0].mid.tz == available.dt.tz
+
+
+def test_sorted_input(available):
+    kwargs: DatetimeIndexSplitterKwargs = dict(schedule=BalancedRows(12), before="30d", after=2)
+    assert split(**kwargs, available=available) == split(**kwargs, available=available.sort_values())
+
+
+def test_requires_available():
+    with pytest.raises(ValueError, match="requires available data"):
+        split(BalancedRows(12))
+
+
+@pytest.mark.parametrize(
+    "limits", [("2022-01-01", "2022-01-10"), (pd.Timestamp("2022-01-01"), pd.Timestamp("2022-01-10"))]
+)
+def test_limits_tuple(limits):
+    with pytest.raises(ValueError, match="requires available data; limits"):
+        split(BalancedRows(3), available=limits)
+
+
+def test_bad_n():
+    with pytest.raises(ValueError, match="n >= 1"):
+        BalancedRows(0)
+
+
+def test_not_cached(available, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings.split_cache, "DIRECTORY", tmp_path)
+
+    first = split(BalancedRows(4), before="all", available=available)
+    assert not list(tmp_path.iterdir())
+    assert split(BalancedRows(4), before="all", available=available[::2]) != first
+
+
+def test_as_dict_round_trip():
+    splitter = DatetimeIndexSplitter(BalancedRows(3), before="all")
+    assert splitter.as_dict()["schedule"] == BalancedRows(3)
+    assert DatetimeIndexSplitter(**splitter.as_dict()) == splitter
+
+
+def test_no_valid_splits_message():
+    with pytest.raises(ValueError, match=r"schedule=BalancedRows\(n=3\)"):
+        split(BalancedRows(3), before=10_000, available=pd.date_range("2022", periods=100, freq="h"))
+
+
+def test_plot(available):
+    pytest.importorskip("matplotlib")
+    from time_split import plot
+
+    ax = plot(BalancedRows(3), before="all", available=available)
+    assert "BalancedRows(n=3)" in ax.get_title()
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("numpy", "pandas", "rics", "matplotlib")
+
+
+def _run(code):
+    args = [sys.executable, "-X", "importtime", "-c", code]
+    return subprocess.run(args, capture_output=True, text=True, check=True)  # noqa: S603
+
+
+@pytest.mark.parametrize("module", ["time_split", "time_split.types", "time_split.settings"])
+def test_no_heavy_imports(module):
+    result = _run(f"import sys, {module}; print(*sorted(sys.modules), sep='\\n')")
+    loaded = set(result.stdout.split())
+    assert not loaded.intersection(HEAVY_MODULES)
+
+
+def test_lazy_attributes():
+    result = _run(
+        "import sys, time_split, time_split.types as t;"
+        "print(t.TimedeltaTypes is t.TimedeltaTypes, time_split.split.__module__, 'pandas' in sys.modules)"
+    )
+    assert result.stdout.split() == ["True", "time_split._frontend._split", "True"]
+
+
+def test_unknown_attribute():
+    import time_split
+    import time_split.types
+
+    with pytest.raises(AttributeError, match="has no attribute 'nope'"):
+        _ = time_split.nope
+    with pytest.raises(AttributeError, match="has no attribute 'nope'"):
+        getattr(time_split.types, "nope")  # noqa: B009
+
+
+def test_dir():
+    result = _run("import sys, time_split, time_split.types as t; print('split' in dir(time_split), 'Span' in dir(t))")
+    assert result.stdout.split() == ["True", "True"]
+
+
+def test_lazy_aliases_match_definitions():
+    from time_split import _type_aliases, types
+
+    assert set(_type_aliases.__all__).issubset(dir(types))
+    for name in _type_aliases.__all__:
+        assert getattr(types, name) is getattr(_type_aliases, name)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "DatetimeSplitBounds",
+        "SparseFoldMembership",
+        "DatetimeIndexSplitterKwargs",
+        "LogSplitProgressKwargs",
+        "SplitProgressExtras",
+    ],
+)
+def test_get_type_hints(name):
+    code = (
+        "import sys, typing, time_split.types as t;"
+        "typing.get_type_hints(getattr(t, sys.argv[1]));"
+        "typing.get_type_hints(t.DatetimeIndexSplitterKwargs)"
+    )
+    args = [sys.executable, "-c", code, name]
+    subprocess.run(args, check=True)  # noqa: S603
@@ -1,7 +1,11 @@
+import asyncio
+import logging
+
 import pandas as pd
 import pytest
 
 from time_split import log_split_progress, settings, split
+from time_split.types import LogSplitProgress
 
 
 @pytest.mark.parametrize("extra", ["{{escaped-key}}", "{extra0}", "{extra1}", "{extra1} and {extra1}!"])
@@ -57,3 +61,120 @@ def test_metrics(caplog):
         fold_metrics = metrics.pop(key)
         assert fold_metrics == record.metrics
         assert expected_in_message[key] in record.getMessage()
+
+
+def _messages(caplog):
+    return [(record.n, record.message.split()[0]) for record in caplog.records if record.name == "time_split"]
+
+
+def test_async(caplog):
+    progress = log_split_progress(split("1d", available=("2022", "2022-01-10")))
+
+    async def main():
+        return [split async for split in progress]
+
+    assert asyncio.run(main()) == list(progress.splits)
+    assert _messages(caplog) == [(1, "Begin"), (1, "Finished"), (2, "Begin"), (2, "Finished")]
+
+
+def test_track_concurrent(caplog):
+    progress = log_split_progress(split("1d", available=("2022", "2022-01-10")))
+    delays = [0.1, 0.01]
+
+    async def evaluate(index):
+        with progress.track(index) as bounds:
+            await asyncio.sleep(delays[index])
+            return bounds
+
+    async def main():
+        return await asyncio.gather(*map(evaluate, range(len(progress))))
+
+    assert asyncio.run(main()) == list(progress.splits)
+    assert _messages(caplog) == [(1, "Begin"), (2, "Begin"), (2, "Finished"), (1, "Finished")]
+
+    seconds = {record.n: record.seconds for record in caplog.records if hasattr(record, "seconds")}
+    assert seconds[1] >= delays[0] > seconds[2] >= delays[1]
+
+
+def test_track_index(caplog):
+    progress = log_split_progress(split("1d", available=("2022", "2022-01-10")))
+    with progress.track(-1) as bounds:
+        assert bounds == progress[-1]
+    assert _messages(caplog) == [(2, "Begin"), (2, "Finished")]
+
+    with pytest.raises(IndexError), progress.track(2):
+        pass
+
+
+def test_track_error(caplog):
+    progress = log_split_progress(split("1d", available=("2022", "2022-01-10")))
+    with pytest.raises(RuntimeError), progress.track(0):
+        raise RuntimeError
+    assert _messages(caplog) == [(1, "Begin")]
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_split_data_select_extras(caplog, monkeypatch, use_cache):
+    from time_split.integration.base import SelectCache
+    from time_split.integration.pandas import split_pandas
+
+    monkeypatch.setattr(
+        settings.log_split_progress,
+        "END_MESSAGE",
+        settings.log_split_progress.END_MESSAGE + " Selected {data_rows}+{future_data_rows} rows.",
+    )
+    df = pd.DataFrame({"time": pd.date_range("2022", "2022-01-10", freq="h")})
+    cache = SelectCache(2**20) if use_cache else None  # Uses select instead of select_many.
+    folds = list(split_pandas(df, "time", schedule="1d", before="2d", log_progress=True, cache=cache))
+
+    records = [record for record in caplog.records if hasattr(record, "seconds")]
+    assert len(records) == len(folds)
+    for record, fold in zip(records, folds, strict=True):
+        assert record.select_seconds >= 0
+        assert (record.data_rows, record.future_data_rows) == (len(fold.data), len(fold.future_data))
+        assert record.getMessage().endswith(f"Selected {len(fold.data)}+{len(fold.future_data)} rows.")
+    assert _messages(caplog)[:2] == [(1, "Begin"), (1, "Finished")]
+
+
+def test_track_extra_overrides_user_extra(caplog):
+    progress = log_split_progress(split("1d", available=("2022", "2022-01-10")), extra={"a": 1, "b": 2})
+
+    with progress.track(0, extra={"b": 3}):
+        pass
+
+    assert [(record.a, record.b) for record in caplog.records] == [(1, 3), (1, 3)]
+
+
+class _Subclass(LogSplitProgress):
+    """A subclass written before ``__aiter__`` and ``track`` were added."""
+
+    def __init__(self, splits):
+        self.splits = splits
+        self.logger = logging.getLogger("time_split")
+
+    def __getitem__(self, index):
+        return self.splits[index]
+
+    def __len__(self):
+        return len(self.splits)
+
+    def __iter__(self):
+        for bounds in self.splits:
+            self.logger.info("Custom")
+            yield bounds
+
+
+def test_subclass_defaults(caplog):
+    progress = _Subclass(split("1d", available=("2022", "2022-01-10")))
+
+    async def main():
+        return [bounds async for bounds in progress]
+
+    assert asyncio.run(main()) == list(progress.splits)
+    assert [record.message for record in caplog.records if record.name == "time_split"] == ["Custom", "Custom"]
+
+    caplog.clear()
+    with progress.track(1, extra={"a": 1}) as bounds:
+        assert bounds == progress[1]
+    assert _messages(caplog) == [(2, "Begin"), (2, "Finished")]
+    assert [record.a for record in caplog.records] == [1, 1]
@@ -0,0 +1,113 @@
+import pandas as pd
+import pytest
+
+from time_split import settings, split
+from time_split.support import DatetimeIndexSplitter
+from time_split.support.types import SplitterPlan
+
+from .conftest import DATA_CASES, SPLIT_DATA
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings.split_cache, "DIRECTORY", tmp_path)
+    return tmp_path
+
+
+def _disable_compute(monkeypatch):
+    def fail(*_, **__):
+        raise AssertionError("not cached")
+
+    monkeypatch.setattr(SplitterPlan, "make_bounds_list", fail)
+
+
+def is_odd(_start, mid, _end):
+    return mid.day % 2 == 1
+
+
+@pytest.mark.parametrize("kwargs, expected", *DATA_CASES)
+@pytest.mark.parametrize("tz", [None, "Europe/Stockholm"])
+def test_hit(cache_dir, monkeypatch, kwargs, expected, tz):
+    available = SPLIT_DATA.tz_localize(tz)
+    first = split(**kwargs, available=available)
+    assert len(first) == len(expected)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    _disable_compute(monkeypatch)
+    second = split(**kwargs, available=available)
+    assert second == first
+    assert [s.mid.tz for s in second] == [s.mid.tz for s in first]
+
+
+@pytest.mark.usefixtures("cache_dir")
+def test_named_filter_is_cached(monkeypatch):
+    first = split("1d", filter=is_odd, available=SPLIT_DATA)
+    _disable_compute(monkeypatch)
+    assert split("1d", filter=is_odd, available=SPLIT_DATA) == first
+
+
+def test_lambda_filter_bypasses_cache(cache_dir):
+    split("1d", filter=lambda *_: True, available=SPLIT_DATA)
+    assert not list(cache_dir.iterdir())
+
+
+class _Weekday:
+    def __init__(self, weekday):
+        self.weekday = weekday
+
+    def keep(self, _start, mid, _end):
+        return mid.weekday() == self.weekday
+
+
+def test_bound_method_filter_bypasses_cache(cache_dir):
+    monday = split("1d", filter=_Weekday(0).keep, available=SPLIT_DATA, before="all")
+    tuesday = split("1d", filter=_Weekday(1).keep, available=SPLIT_DATA, before="all")
+    assert {s.mid.weekday() for s in monday} == {0}
+    assert {s.mid.weekday() for s in tuesday} == {1}
+    assert not list(cache_dir.iterdir())
+
+
+def test_settings_change_key(cache_dir, monkeypatch):
+    split("3d", after="2d", available=SPLIT_DATA)
+    monkeypatch.setattr(settings.misc, "snap_to_end", False)
+    split("3d", after="2d", available=SPLIT_DATA)
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_eviction(cache_dir, monkeypatch):
+    split("1d", available=SPLIT_DATA)
+    (size,) = [p.stat().st_size for p in cache_dir.iterdir()]
+    monkeypatch.setattr(settings.split_cache, "MAX_BYTES", 2 * size + size // 2)
+
+    for n_splits in range(1, 5):
+        split("1d", n_splits=n_splits, available=SPLIT_DATA)
+    assert len(list(cache_dir.iterdir())) == 2
+
+    _disable_compute(monkeypatch)
+    split("1d", n_splits=4, available=SPLIT_DATA)
+    with pytest.raises(AssertionError, match="not cached"):
+        split("1d", available=SPLIT_DATA)
+
+
+def test_corrupt_entry(cache_dir):
+    expected = split("1d", available=SPLIT_DATA)
+    (path,) = cache_dir.iterdir()
+    path.write_bytes(b"garbage")
+
+    assert split("1d", available=SPLIT_DATA) == expected
+
+
+@pytest.mark.usefixtures("cache_dir")
+def test_explicit_schedule_without_data(monkeypatch):
+    schedule = pd.date_range("2022", periods=5, freq="3D")
+    first = split(schedule, before=1)
+    _disable_compute(monkeypatch)
+    assert split(schedule, before=1) == first
+
+
+@pytest.mark.usefixtures("cache_dir")
+def test_generator_schedule(monkeypatch):
+    schedule = pd.date_range("2022-01-02", periods=5, freq="1D")
+    first = DatetimeIndexSplitter(iter(schedule), before=1).get_splits(SPLIT_DATA)
+    _disable_compute(monkeypatch)
+    assert DatetimeIndexSplitter(iter(schedule), before=1).get_splits(SPLIT_DATA) == first